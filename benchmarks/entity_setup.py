@@ -0,0 +1,96 @@
+"""Measure entity setup time, memory and per-refresh cost for a 100-car fleet.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.entity_setup
+
+Builds the per-car entities the platforms create (description sensors and
+binary sensors, the tracker and the button) for CARS cars against stub
+coordinators, then times one state read per entity per refresh, which is
+what ``async_write_ha_state`` does after every coordinator update.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from custom_components.voyah.binary_sensor import VoyahBinarySensorEntity
+from custom_components.voyah.button import VoyahStartHeatingButton
+from custom_components.voyah.car import VoyahCar
+from custom_components.voyah.const import BINARY_SENSOR_DESCRIPTIONS, SENSOR_DESCRIPTIONS
+from custom_components.voyah.device_tracker import VoyahDeviceTracker
+from custom_components.voyah.polling import SleepBackoff
+from custom_components.voyah.sensor import VoyahSensorEntity
+
+CARS = 100
+REFRESHES = 50
+
+SNAPSHOT = {
+    "sensors_data": {description.key: 1 for description in (*SENSOR_DESCRIPTIONS, *BINARY_SENSOR_DESCRIPTIONS)},
+    "position_data": {"lat": 55.7558, "lon": 37.6176, "hdop": 1.0, "speed": 0},
+    "time": 1700000000,
+}
+
+
+def _coordinator(index: int) -> SimpleNamespace:
+    entry = SimpleNamespace(entry_id=f"entry{index}", data={"car_id": f"car{index}", "car_name": f"Voyah {index}"})
+    return SimpleNamespace(
+        data=copy.deepcopy(SNAPSHOT),
+        car=VoyahCar.from_entry(entry),
+        statistics=None,
+        deadbands={},
+        sleep=SleepBackoff(),
+        last_data=None,
+    )
+
+
+def _entities(coordinator: SimpleNamespace) -> list:
+    entities: list = [VoyahSensorEntity(coordinator, description) for description in SENSOR_DESCRIPTIONS]
+    entities.extend(VoyahBinarySensorEntity(coordinator, description) for description in BINARY_SENSOR_DESCRIPTIONS)
+    entities.append(VoyahDeviceTracker(coordinator))
+    entities.append(VoyahStartHeatingButton(coordinator))
+    return entities
+
+
+def _read_state(entity) -> object:
+    if isinstance(entity, VoyahSensorEntity):
+        return entity._read_value()
+    if isinstance(entity, VoyahBinarySensorEntity):
+        return entity.is_on
+    if isinstance(entity, VoyahDeviceTracker):
+        return entity.latitude, entity.longitude, entity.extra_state_attributes
+    return entity.unique_id
+
+
+def main() -> None:
+    """Print setup and per-refresh figures."""
+    coordinators = [_coordinator(index) for index in range(CARS)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    entities = [entity for coordinator in coordinators for entity in _entities(coordinator)]
+    setup_seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    device_infos = {id(entity.device_info) for entity in entities}
+
+    start = time.perf_counter()
+    for _ in range(REFRESHES):
+        for entity in entities:
+            _read_state(entity)
+    refresh_seconds = (time.perf_counter() - start) / REFRESHES
+
+    print(f"cars:                      {CARS}")
+    print(f"entities:                  {len(entities)}")
+    print(f"distinct DeviceInfo dicts: {len(device_infos)}")
+    print(f"setup time:                {setup_seconds * 1000:.1f} ms")
+    print(f"setup memory (peak):       {peak / 1024:.0f} KiB")
+    print(f"state reads per refresh:   {refresh_seconds * 1000:.2f} ms for all cars")
+
+
+if __name__ == "__main__":
+    main()
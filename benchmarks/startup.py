@@ -0,0 +1,83 @@
+"""Measure integration import time and the cost of building entity descriptions.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.startup
+
+Each import is timed in a fresh interpreter, after Home Assistant's core
+modules are already loaded, so the figure is what the integration itself adds
+to startup. const is also loaded on its own from its file path: importing
+``custom_components.voyah.const`` runs the package ``__init__`` first, which
+would hide the cost of const behind everything the package imports. The
+description tables are then built in-process.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 10
+IMPORTS = {
+    "const (by file path)": (
+        "import importlib.util\n"
+        "spec = importlib.util.spec_from_file_location('voyah_const', 'custom_components/voyah/const.py')\n"
+        "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+    ),
+    "custom_components.voyah": "import custom_components.voyah",
+    "custom_components.voyah.sensor": "import custom_components.voyah.sensor",
+}
+# Home Assistant components whose loading the integration should defer; reported when an import loads them.
+COMPONENTS = (
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.websocket_api",
+    "homeassistant.components.http",
+)
+
+_IMPORT_SNIPPET = """
+import sys, time
+import homeassistant.core, homeassistant.helpers.update_coordinator, homeassistant.helpers.storage
+preloaded = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+components = sorted(m.rsplit(".", 1)[1] for m in {components!r} if m in sys.modules and m not in preloaded)
+print(elapsed, ",".join(components) or "-")
+"""
+
+
+def _time_import(statement: str) -> tuple[float, str]:
+    samples = []
+    components = "-"
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SNIPPET.format(statement=statement, components=COMPONENTS)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        samples.append(float(output[0]))
+        components = output[1]
+    return statistics.median(samples), components
+
+
+def main() -> None:
+    """Print import and description build figures."""
+    for name, statement in IMPORTS.items():
+        seconds, components = _time_import(statement)
+        print(f"import {name:32} {seconds * 1000:7.1f} ms  (components it loads: {components})")
+
+    from custom_components.voyah import const  # noqa: PLC0415
+
+    start = time.perf_counter()
+    tables = {**const._build_sensor_descriptions(), **const._build_binary_sensor_descriptions()}
+    seconds = time.perf_counter() - start
+    count = sum(len(table) for table in tables.values())
+    print(f"build {count} entity descriptions            {seconds * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
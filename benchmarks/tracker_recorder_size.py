@@ -0,0 +1,133 @@
+"""Estimate recorder growth caused by the device tracker over a simulated day.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.tracker_recorder_size
+
+The recorder writes a ``states`` row for every state change (a write whose
+state or attributes differ from the previous one) and deduplicates the
+recorded attribute payloads into ``state_attributes``. This script replays
+one day of 60-second polls (parked with GPS drift, two commutes and an
+errand) and reports the rows and bytes for three configurations:
+
+* baseline: the raw fix written on every poll, all attributes recorded;
+* unrecorded attributes: as baseline, but course, altitude, satellites and
+  hdop kept out of the recorder (``_unrecorded_attributes``);
+* jitter filter and write skipping: ``VoyahDeviceTracker`` itself, which
+  also locks the parked position and skips writes for attribute-only changes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import json
+import math
+import random
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.voyah.car import VoyahCar
+from custom_components.voyah.device_tracker import VoyahDeviceTracker
+from custom_components.voyah.gps import PositionFilter, hdop_to_accuracy
+
+POLL_SECONDS = 60
+DRIVING_WINDOWS = ((8 * 60, 8 * 60 + 50), (13 * 60, 13 * 60 + 25), (18 * 60, 18 * 60 + 55))
+# Standard deviation of the parked GPS drift, in degrees (about 2 m north-south).
+PARKED_DRIFT_DEG = 0.00002
+UNRECORDED = VoyahDeviceTracker._unrecorded_attributes
+
+
+def _simulate_day(seed: int = 1) -> list[dict]:
+    """Return one position_data dict per poll."""
+    rng = random.Random(seed)
+    lat, lon, course = 55.7558, 37.6176, 90.0
+    positions = []
+    for minute in range(0, 24 * 60, POLL_SECONDS // 60):
+        driving = any(start <= minute < end for start, end in DRIVING_WINDOWS)
+        drift = 0.0 if driving else PARKED_DRIFT_DEG
+        if driving:
+            course = (course + rng.uniform(-30, 30)) % 360
+            step = rng.uniform(0.005, 0.01)
+            lat += step * math.cos(math.radians(course))
+            lon += step * math.sin(math.radians(course))
+        positions.append(
+            {
+                "lat": round(lat + rng.gauss(0, drift), 6),
+                "lon": round(lon + rng.gauss(0, drift), 6),
+                "course": round(course) if driving else 0,
+                "height": 150 + rng.randint(-3, 3),
+                "sats": rng.randint(6, 12),
+                "hdop": round(rng.uniform(0.7, 1.6), 1),
+                "speed": rng.randint(20, 90) if driving else 0,
+            }
+        )
+    return positions
+
+
+def _raw_writes(positions: list[dict]) -> Iterator[dict[str, Any]]:
+    """Attributes of a tracker that writes the raw fix on every poll."""
+    for position in positions:
+        yield {
+            "latitude": position["lat"],
+            "longitude": position["lon"],
+            "gps_accuracy": int(hdop_to_accuracy(position["hdop"])),
+            "course": position["course"],
+            "altitude": position["height"],
+            "satellites": position["sats"],
+            "hdop": position["hdop"],
+        }
+
+
+def _tracker_writes(positions: list[dict]) -> Iterator[dict[str, Any]]:
+    """Attributes of the writes VoyahDeviceTracker actually makes."""
+    entry = SimpleNamespace(entry_id="bench", data={"car_id": "bench", "car_name": "Voyah"})
+    coordinator = SimpleNamespace(
+        data={"position_data": positions[0]}, car=VoyahCar.from_entry(entry), last_data=None, last_update_success=True
+    )
+    tracker = VoyahDeviceTracker(coordinator)
+    tracker._filter = PositionFilter()
+    for position in positions:
+        coordinator.data = {"position_data": position}
+        if tracker._should_write():
+            yield {
+                "latitude": tracker.latitude,
+                "longitude": tracker.longitude,
+                "gps_accuracy": tracker.location_accuracy,
+                **tracker.extra_state_attributes,
+            }
+
+
+def _recorder_rows(writes: Iterator[dict[str, Any]], unrecorded: frozenset[str]) -> tuple[int, int, int]:
+    """Return states rows, state_attributes rows and attribute bytes for a series of writes."""
+    state_rows = 0
+    previous = None
+    payloads: set[str] = set()
+    for attributes in writes:
+        attributes = {"source_type": "gps", "friendly_name": "Voyah Location", **attributes}
+        if attributes == previous:
+            # Home Assistant fires no state_changed event for an identical write.
+            continue
+        previous = attributes
+        state_rows += 1
+        recorded = {key: value for key, value in attributes.items() if key not in unrecorded}
+        payloads.add(json.dumps(recorded, sort_keys=True, separators=(",", ":")))
+    return state_rows, len(payloads), sum(len(payload) for payload in payloads)
+
+
+def main() -> None:
+    """Print the comparison table."""
+    positions = _simulate_day()
+    scenarios = (
+        ("baseline", _raw_writes(positions), frozenset()),
+        ("+ unrecorded attributes", _raw_writes(positions), UNRECORDED),
+        ("+ jitter filter, write skipping", _tracker_writes(positions), UNRECORDED),
+    )
+    print(f"polls per day: {len(positions)}")
+    print(f"{'':32} {'states':>7} {'state_attributes':>17} {'bytes':>8}")
+    for name, writes, unrecorded in scenarios:
+        rows, attr_rows, attr_bytes = _recorder_rows(writes, unrecorded)
+        print(f"{name:32} {rows:7} {attr_rows:17} {attr_bytes:8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 
+from .account import VoyahAccount
 from .api import VoyahApiClient
-from .const import CONF_ACCESS_TOKEN, CONF_CAR_ID, CONF_REFRESH_TOKEN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .car import VoyahCar
+from .const import (
+    BINARY_SENSOR_KEYS,
+    COMPOSITE_MEMBERS,
+    CONF_ACCESS_TOKEN,
+    CONF_PLACES_FILE,
+    CONF_REFRESH_TOKEN,
+    CONF_STATISTICS_MODE,
+    DOMAIN,
+)
 from .coordinator import VoyahDataUpdateCoordinator
+from .fleet import async_get_fleet_aggregates, async_get_fleet_index
+from .places import PlaceIndex, load_place_index
+from .polling import PollingPolicy
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -19,28 +43,156 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+def _platforms_with_data(data: dict[str, Any]) -> set[Platform]:
+    """Return the platforms that have something to show for a snapshot.
+
+    The sensor platform also carries trip, fleet and place sensors and the
+    button works without telemetry, so both are always set up. Binary sensors
+    and the tracker wait until the car reports a status key or a position.
+    """
+    platforms = {Platform.SENSOR, Platform.BUTTON}
+    sensors = data.get("sensors_data") or {}
+    if not BINARY_SENSOR_KEYS.isdisjoint(sensors) or any(
+        key in sensors for keys in COMPOSITE_MEMBERS.values() for key in keys
+    ):
+        platforms.add(Platform.BINARY_SENSOR)
+    position = data.get("position_data") or {}
+    if position.get("lat") is not None and position.get("lon") is not None:
+        platforms.add(Platform.DEVICE_TRACKER)
+    return platforms
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Voyah integration services and WebSocket commands."""
+    # Imported here: the WebSocket API pulls in the http component, which
+    # would otherwise be loaded by every module importing this package.
+    from .services import async_setup_services  # noqa: PLC0415
+    from .websocket import async_setup_websocket  # noqa: PLC0415
+
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
+
+
+async def _async_setup_car(
+    hass: HomeAssistant, entry: ConfigEntry, client: VoyahApiClient, car: VoyahCar, places: PlaceIndex | None
+) -> VoyahDataUpdateCoordinator:
+    """Create a car's coordinator, restore its stored state and fetch the first snapshot."""
+    scan_interval = PollingPolicy.from_entry(entry).interval
+    coordinator = VoyahDataUpdateCoordinator(hass, client, entry, scan_interval, car)
+    await coordinator.trips.async_load()
+    await coordinator.routes.async_load()
+    await coordinator.chargers.async_load()
+    coordinator.places = places
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady as err:
+        # Keep the car: its coordinator retries on its own schedule, its entities
+        # stay unavailable and the sensors for its keys appear once it answers.
+        _LOGGER.warning("%s did not answer at setup, retrying on its polling schedule: %s", car.name, err)
+        coordinator.data = {}
+    return coordinator
+
+
+async def _async_load_places(hass: HomeAssistant, places_file: str | None) -> PlaceIndex | None:
+    """Read the entry's places file once; every car of the entry shares the index."""
+    if not places_file:
+        return None
+    try:
+        return await hass.async_add_executor_job(load_place_index, hass.config.path(places_file))
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Could not load places file %s: %s", places_file, err)
+        return None
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Voyah from a config entry."""
+    """Set up Voyah from a config entry.
+
+    Cars are set up in parallel. A car that fails its first refresh is kept
+    and keeps polling on its own; only when every car fails does the whole
+    entry retry.
+    """
     session = async_get_clientsession(hass)
     client = VoyahApiClient(
         session=session,
-        car_id=entry.data[CONF_CAR_ID],
         access_token=entry.data[CONF_ACCESS_TOKEN],
         refresh_token=entry.data[CONF_REFRESH_TOKEN],
     )
 
-    scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    coordinator = VoyahDataUpdateCoordinator(hass, client, entry, scan_interval)
-    await coordinator.async_config_entry_first_refresh()
+    account = VoyahAccount(client)
+    account.places_file = entry.options.get(CONF_PLACES_FILE)
+    account.options = dict(entry.options)
+    places = await _async_load_places(hass, account.places_file)
+    results = await asyncio.gather(
+        *(_async_setup_car(hass, entry, client, car, places) for car in VoyahCar.all_from_entry(entry)),
+        return_exceptions=True,
+    )
+    coordinators: list[VoyahDataUpdateCoordinator] = []
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        coordinators.append(result)
+    if not any(coordinator.last_update_success for coordinator in coordinators):
+        raise ConfigEntryNotReady(str(coordinators[0].last_exception)) from coordinators[0].last_exception
+    for coordinator in coordinators:
+        if coordinator.statistics is not None:
+            entry.async_on_unload(coordinator.statistics.async_start())
+    account.coordinators = {coordinator.car_id: coordinator for coordinator in coordinators}
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = account
+    for coordinator in coordinators:
+        account.platforms |= _platforms_with_data(coordinator.data)
+    await hass.config_entries.async_forward_entry_setups(entry, [p for p in PLATFORMS if p in account.platforms])
+
+    @callback
+    def _forward_new_platforms() -> None:
+        """Set up platforms whose data first appears after setup."""
+        missing = set().union(*(_platforms_with_data(c.data) for c in coordinators)) - account.platforms
+        if not missing:
+            return
+        account.platforms |= missing
+        entry.async_create_task(
+            hass,
+            hass.config_entries.async_forward_entry_setups(entry, [p for p in PLATFORMS if p in missing]),
+        )
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    for coordinator in coordinators:
+        entry.async_on_unload(coordinator.async_add_listener(_forward_new_platforms))
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
 
     return True
 
 
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinators.
+
+    Statistics mode changes which entities exist and how they round, and the
+    places file is read once at setup, so changing either reloads the entry;
+    everything else applies in place. Updates that leave the options alone,
+    such as persisting refreshed tokens, are ignored.
+    """
+    account: VoyahAccount = hass.data[DOMAIN][entry.entry_id]
+    if entry.options == account.options:
+        return
+    account.options = dict(entry.options)
+    statistics_mode = bool(entry.options.get(CONF_STATISTICS_MODE))
+    if entry.options.get(CONF_PLACES_FILE) != account.places_file or any(
+        (coordinator.statistics is not None) != statistics_mode for coordinator in account.coordinators.values()
+    ):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    for coordinator in account.coordinators.values():
+        coordinator.async_apply_options()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    account: VoyahAccount = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, account.platforms):
         hass.data[DOMAIN].pop(entry.entry_id)
+        fleet_index = async_get_fleet_index(hass)
+        aggregates = async_get_fleet_aggregates(hass)
+        for car_id in account.coordinators:
+            fleet_index.remove(car_id)
+            aggregates.remove(car_id)
     return unload_ok
@@ -0,0 +1,40 @@
+"""Runtime state of one Voyah config entry."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+
+from .api import VoyahApiClient
+from .const import DOMAIN
+from .coordinator import VoyahDataUpdateCoordinator
+
+
+class VoyahAccount:
+    """The client shared by an entry's cars and one coordinator per car.
+
+    An account entry may manage several cars; they share one token pair and
+    one HTTP session, so connections and token refreshes scale per account.
+    Entries created before accounts are an account with a single car.
+    """
+
+    def __init__(self, client: VoyahApiClient) -> None:
+        self.client = client
+        self.coordinators: dict[str, VoyahDataUpdateCoordinator] = {}
+        # Platforms forwarded for this entry; grows when new data kinds appear.
+        self.platforms: set[Platform] = set()
+        # Places file the coordinators were set up with; changing it needs a reload.
+        self.places_file: str | None = None
+        # Options last applied to the coordinators; token refreshes update the entry
+        # data and fire the update listener without changing them.
+        self.options: dict[str, Any] = {}
+
+
+@callback
+def async_iter_coordinators(hass: HomeAssistant) -> Iterator[VoyahDataUpdateCoordinator]:
+    """Yield the coordinators of every car across all loaded entries."""
+    for account in hass.data.get(DOMAIN, {}).values():
+        yield from account.coordinators.values()
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import aiohttp
 
-from .const import API_BASE_URL
+from .const import API_BASE_URL, COMPOSITE_MEMBERS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,20 +25,33 @@ class VoyahApiAuthError(VoyahApiError):
     """Exception for authentication errors."""
 
 
+def pack_status_bits(sensors_data: dict[str, Any], keys: tuple[str, ...]) -> int:
+    """Pack on/off statuses into an int; bit i is set when keys[i] is truthy."""
+    mask = 0
+    for bit, key in enumerate(keys):
+        if sensors_data.get(key):
+            mask |= 1 << bit
+    return mask
+
+
 class VoyahApiClient:
-    """Client to interact with the Voyah vehicle data API."""
+    """Client to interact with the Voyah vehicle data API.
+
+    One client serves every car of an account: the car is passed per call and
+    all cars share the token pair, so a refresh made for one car is reused by
+    the others.
+    """
 
     def __init__(
         self,
         session: aiohttp.ClientSession,
-        car_id: str,
         access_token: str,
         refresh_token: str,
     ) -> None:
         self._session = session
-        self._car_id = car_id
         self._access_token = access_token
         self._refresh_token = refresh_token
+        self._refresh_lock = asyncio.Lock()
 
     @property
     def access_token(self) -> str:
@@ -63,9 +77,10 @@ class VoyahApiClient:
         """Send an authenticated request, refreshing the token on 401."""
         url = f"{API_BASE_URL}{path}"
         try:
+            sent_token = self._access_token
             async with self._session.request(method, url, headers=self._headers(), json=json_data) as resp:
                 if resp.status == 401:
-                    refreshed = await self._refresh_access_token()
+                    refreshed = await self._async_refresh_once(sent_token)
                     if not refreshed:
                         raise VoyahApiAuthError("Authentication failed")
                     async with self._session.request(
@@ -84,6 +99,17 @@ class VoyahApiClient:
         except aiohttp.ClientError as err:
             raise VoyahApiConnectionError(f"Error communicating with API: {err}") from err
 
+    async def _async_refresh_once(self, stale_token: str) -> bool:
+        """Refresh the token pair unless a concurrent request already did.
+
+        Refresh tokens are single-use, so when several cars hit a 401 at once
+        only the first refresh may go out; the rest retry with its result.
+        """
+        async with self._refresh_lock:
+            if self._access_token != stale_token:
+                return True
+            return await self._refresh_access_token()
+
     async def _refresh_access_token(self) -> bool:
         """Use refresh_token to obtain a new access_token pair."""
         url = f"{API_BASE_URL}/id-service/auth/refresh-token"
@@ -113,19 +139,19 @@ class VoyahApiClient:
             _LOGGER.debug("Access token refreshed successfully")
             return True
 
-    async def async_start_heating(self) -> dict[str, Any]:
+    async def async_start_heating(self, car_id: str) -> dict[str, Any]:
         """Send a command to start cabin heating."""
         return await self._request(
             "POST",
-            f"/car-service/tbox/{self._car_id}/heating",
+            f"/car-service/tbox/{car_id}/heating",
             json_data={},
         )
 
-    async def async_get_car_data(self) -> dict[str, Any]:
+    async def async_get_car_data(self, car_id: str) -> dict[str, Any]:
         """Fetch full telemetry from the tbox endpoint."""
         raw = await self._request(
             "GET",
-            f"/car-service/tbox/{self._car_id}/sensors",
+            f"/car-service/tbox/{car_id}/sensors",
         )
         _LOGGER.debug(
             "Tbox response keys: %s",
@@ -148,12 +174,15 @@ class VoyahApiClient:
             len(sensors_data),
             timestamp,
         )
-        return {
+        data: dict[str, Any] = {
             "sensors_data": sensors_data,
             "position_data": position_data,
             "time": timestamp,
             "last_ping": raw.get("lastPing"),
         }
+        for name, keys in COMPOSITE_MEMBERS.items():
+            data[name] = pack_status_bits(sensors_data, keys)
+        return data
 
     # ── Auth helpers (used by config_flow, not during polling) ──
 
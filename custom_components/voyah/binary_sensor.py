@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import BINARY_SENSOR_DESCRIPTIONS, CONF_CAR_ID, CONF_CAR_NAME, DOMAIN
+from .account import VoyahAccount
+from .const import BINARY_SENSOR_DESCRIPTIONS, COMPOSITE_BINARY_SENSOR_DESCRIPTIONS, COMPOSITE_MEMBERS, DOMAIN
 from .coordinator import VoyahDataUpdateCoordinator
+from .entity import VoyahEntity
 
 
 async def async_setup_entry(
@@ -19,41 +21,89 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Voyah binary sensor entities."""
-    coordinator: VoyahDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    account: VoyahAccount = hass.data[DOMAIN][entry.entry_id]
+    for coordinator in account.coordinators.values():
+        _async_setup_car(entry, coordinator, async_add_entities)
 
-    async_add_entities(
-        VoyahBinarySensorEntity(coordinator, description, entry)
-        for description in BINARY_SENSOR_DESCRIPTIONS
-        if description.key in coordinator.data.get("sensors_data", {})
-    )
 
+@callback
+def _async_setup_car(
+    entry: ConfigEntry,
+    coordinator: VoyahDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add one car's binary sensors and more as new status keys appear."""
+    seen_keys: set[str] = set()
 
-class VoyahBinarySensorEntity(CoordinatorEntity[VoyahDataUpdateCoordinator], BinarySensorEntity):
-    """Representation of a Voyah binary sensor."""
+    @callback
+    def _new_key_entities() -> list[BinarySensorEntity]:
+        """Create entities for status keys not seen in earlier snapshots."""
+        new_keys = coordinator.data.get("sensors_data", {}).keys() - seen_keys
+        if not new_keys:
+            return []
+        new_entities: list[BinarySensorEntity] = [
+            VoyahBinarySensorEntity(coordinator, description)
+            for description in BINARY_SENSOR_DESCRIPTIONS
+            if description.key in new_keys
+        ]
+        new_entities.extend(
+            VoyahCompositeBinarySensorEntity(coordinator, description)
+            for description in COMPOSITE_BINARY_SENSOR_DESCRIPTIONS
+            if seen_keys.isdisjoint(COMPOSITE_MEMBERS[description.key])
+            and not new_keys.isdisjoint(COMPOSITE_MEMBERS[description.key])
+        )
+        seen_keys.update(new_keys)
+        return new_entities
 
-    _attr_has_entity_name = True
+    @callback
+    def _async_on_coordinator_update() -> None:
+        if new_entities := _new_key_entities():
+            async_add_entities(new_entities)
+
+    async_add_entities(_new_key_entities())
+    entry.async_on_unload(coordinator.async_add_listener(_async_on_coordinator_update))
+
+
+class VoyahBinarySensorEntity(VoyahEntity, BinarySensorEntity):
+    """Representation of a Voyah binary sensor."""
 
     def __init__(
         self,
         coordinator: VoyahDataUpdateCoordinator,
         description: BinarySensorEntityDescription,
-        entry: ConfigEntry,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
-        car_id = entry.data.get(CONF_CAR_ID, entry.entry_id)
-        self._attr_unique_id = f"{car_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, car_id)},
-            name=entry.data.get(CONF_CAR_NAME, "Voyah"),
-            manufacturer="Voyah",
-        )
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        sensors_data = self.coordinator.data.get("sensors_data", {})
-        value = sensors_data.get(self.entity_description.key)
+        value = self.sensors_data.get(self.entity_description.key)
         if value is None:
             return None
         return bool(value)
+
+
+class VoyahCompositeBinarySensorEntity(VoyahBinarySensorEntity):
+    """Binary sensor that is on when any member of a packed status group is on."""
+
+    def __init__(
+        self,
+        coordinator: VoyahDataUpdateCoordinator,
+        description: BinarySensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, description)
+        self._members = COMPOSITE_MEMBERS[description.key]
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if any member is on."""
+        mask = self.coordinator.data.get(self.entity_description.key)
+        if mask is None:
+            return None
+        return mask != 0
+
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Return the members that are currently on."""
+        mask = self.coordinator.data.get(self.entity_description.key) or 0
+        return {"active": [key for bit, key in enumerate(self._members) if mask >> bit & 1]}
@@ -0,0 +1,44 @@
+"""Per-car context shared by the coordinator and all of a car's entities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceInfo
+
+from .const import CONF_CAR_ID, CONF_CAR_NAME, CONF_CARS, DOMAIN
+
+
+@dataclass(slots=True, frozen=True)
+class VoyahCar:
+    """Identity of one car, resolved once from its config entry."""
+
+    car_id: str
+    name: str
+    device_info: DeviceInfo
+
+    @classmethod
+    def create(cls, car_id: str, name: str) -> VoyahCar:
+        """Build the context for a car id and display name."""
+        return cls(car_id, name, DeviceInfo(identifiers={(DOMAIN, car_id)}, name=name, manufacturer="Voyah"))
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> VoyahCar:
+        """Build the context from single-car entry data."""
+        return cls.create(entry.data.get(CONF_CAR_ID, entry.entry_id), entry.data.get(CONF_CAR_NAME, "Voyah"))
+
+    @classmethod
+    def all_from_entry(cls, entry: ConfigEntry) -> list[VoyahCar]:
+        """Build the contexts of every car an entry manages.
+
+        Account entries list their cars under CONF_CARS; entries created
+        before accounts carry a single car at the top level.
+        """
+        if CONF_CARS in entry.data:
+            return [cls.create(car_id, name) for car_id, name in entry.data[CONF_CARS].items()]
+        return [cls.from_entry(entry)]
+
+    def unique_id(self, suffix: str) -> str:
+        """Return the unique id of the car's entity with the given suffix."""
+        return f"{self.car_id}_{suffix}"
@@ -0,0 +1,188 @@
+"""Learning where a car usually charges."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .gps import haversine_m
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+# Charging sessions starting within this distance of a cluster centre join it, in metres.
+CLUSTER_RADIUS_M = 150.0
+# Grid cell size in degrees (~222 m of latitude, narrower in longitude away from the equator).
+CLUSTER_CELL_DEG = 0.002
+METERS_PER_DEG = 111_195.0
+MAX_CLUSTERS = 50
+
+
+@dataclass(slots=True)
+class ChargerCluster:
+    """A learned charging location with a running-mean centre."""
+
+    id: int
+    lat: float
+    lon: float
+    sessions: int
+    last_seen: float
+    name: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Place name when known, otherwise a stable numbered label."""
+        return self.name or f"Charger {self.id}"
+
+    def to_row(self) -> list[Any]:
+        """Compact list form for storage."""
+        return [self.id, self.lat, self.lon, self.sessions, self.last_seen, self.name]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serializable form for service responses."""
+        return {
+            "id": self.id,
+            "name": self.label,
+            "latitude": round(self.lat, 6),
+            "longitude": round(self.lon, 6),
+            "sessions": self.sessions,
+            "last_seen": dt_util.utc_from_timestamp(self.last_seen).isoformat(),
+        }
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / CLUSTER_CELL_DEG), math.floor(lon / CLUSTER_CELL_DEG)
+
+
+class ChargerClusterer:
+    """Incremental grid clusterer over charging-session start positions.
+
+    Each cluster is indexed by the grid cell of its centre, so assigning a new
+    session only checks clusters in the cells around it: one cell either way
+    in latitude, and as many in longitude as CLUSTER_RADIUS_M spans at that
+    latitude (two at 55° N, where a cell is only ~125 m wide). Memory is bounded
+    by MAX_CLUSTERS; the least used, least recent cluster is evicted first.
+    """
+
+    def __init__(self, max_clusters: int = MAX_CLUSTERS) -> None:
+        self._max_clusters = max_clusters
+        self._next_id = 1
+        self.clusters: dict[int, ChargerCluster] = {}
+        self._grid: dict[tuple[int, int], set[int]] = {}
+
+    def restore(self, rows: list[list[Any]]) -> None:
+        """Rebuild clusters and the grid from stored rows."""
+        for row in rows:
+            cluster = ChargerCluster(*row)
+            self.clusters[cluster.id] = cluster
+            self._grid.setdefault(_cell(cluster.lat, cluster.lon), set()).add(cluster.id)
+            self._next_id = max(self._next_id, cluster.id + 1)
+
+    def nearest(self, lat: float, lon: float) -> ChargerCluster | None:
+        """Return the cluster within CLUSTER_RADIUS_M of the position, if any."""
+        cell_lat, cell_lon = _cell(lat, lon)
+        edge_lat = min(abs(lat) + CLUSTER_CELL_DEG, 89.0)
+        lon_cells = math.ceil(CLUSTER_RADIUS_M / (CLUSTER_CELL_DEG * METERS_PER_DEG * math.cos(math.radians(edge_lat))))
+        best: ChargerCluster | None = None
+        best_distance = CLUSTER_RADIUS_M
+        for dlat in (-1, 0, 1):
+            for dlon in range(-lon_cells, lon_cells + 1):
+                for cluster_id in self._grid.get((cell_lat + dlat, cell_lon + dlon), ()):
+                    cluster = self.clusters[cluster_id]
+                    distance = haversine_m(lat, lon, cluster.lat, cluster.lon)
+                    if distance <= best_distance:
+                        best, best_distance = cluster, distance
+        return best
+
+    def add(self, lat: float, lon: float, now: float, name: str | None = None) -> ChargerCluster:
+        """Assign one session start to a cluster, creating one if none is near."""
+        cluster = self.nearest(lat, lon)
+        if cluster is None:
+            if len(self.clusters) >= self._max_clusters:
+                self._evict()
+            cluster = ChargerCluster(self._next_id, lat, lon, 1, now, name)
+            self._next_id += 1
+            self.clusters[cluster.id] = cluster
+            self._grid.setdefault(_cell(lat, lon), set()).add(cluster.id)
+            return cluster
+
+        old_cell = _cell(cluster.lat, cluster.lon)
+        cluster.sessions += 1
+        cluster.lat += (lat - cluster.lat) / cluster.sessions
+        cluster.lon += (lon - cluster.lon) / cluster.sessions
+        cluster.last_seen = now
+        cluster.name = cluster.name or name
+        new_cell = _cell(cluster.lat, cluster.lon)
+        if new_cell != old_cell:
+            self._unindex(old_cell, cluster.id)
+            self._grid.setdefault(new_cell, set()).add(cluster.id)
+        return cluster
+
+    def _evict(self) -> None:
+        victim = min(self.clusters.values(), key=lambda cluster: (cluster.sessions, cluster.last_seen))
+        del self.clusters[victim.id]
+        self._unindex(_cell(victim.lat, victim.lon), victim.id)
+
+    def _unindex(self, cell: tuple[int, int], cluster_id: int) -> None:
+        members = self._grid[cell]
+        members.discard(cluster_id)
+        if not members:
+            del self._grid[cell]
+
+
+class VoyahChargerLog:
+    """Persisted charging locations for one car, fed by the coordinator."""
+
+    def __init__(self, hass: HomeAssistant, car_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{car_id}.chargers")
+        self.clusterer = ChargerClusterer()
+        self.current: ChargerCluster | None = None
+        self._charging: bool | None = None
+
+    async def async_load(self) -> None:
+        """Load stored clusters and the last charging location."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self.clusterer.restore(stored.get("clusters", []))
+        self.current = self.clusterer.clusters.get(stored.get("current"))
+
+    def process(self, data: dict[str, Any], now: float, place: str | None = None) -> ChargerCluster | None:
+        """Record the position when charging starts; return the session's cluster."""
+        charging = (data.get("sensors_data") or {}).get("chargingStatus")
+        if charging is None:
+            return None
+        was_charging = self._charging
+        self._charging = bool(charging)
+        # The first snapshot after a restart is not an edge: the session may already be counted.
+        if was_charging is None or was_charging or not charging:
+            return None
+
+        position = data.get("position_data") or {}
+        lat = position.get("lat")
+        lon = position.get("lon")
+        if lat is None or lon is None:
+            return None
+
+        self.current = self.clusterer.add(lat, lon, data.get("time") or now, place)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        _LOGGER.debug("Charging started at %s (%d sessions)", self.current.label, self.current.sessions)
+        return self.current
+
+    def locations(self) -> list[ChargerCluster]:
+        """Learned locations, most used first."""
+        return sorted(self.clusterer.clusters.values(), key=lambda cluster: (-cluster.sessions, -cluster.last_seen))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "clusters": [cluster.to_row() for cluster in self.clusterer.clusters.values()],
+            "current": self.current.id if self.current is not None else None,
+        }
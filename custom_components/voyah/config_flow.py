@@ -2,41 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 import logging
 from typing import Any
 
-from homeassistant.config_entries import ConfigEntry, ConfigFlow
+from aiohttp import ClientSession
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import ObjectSelector
 import voluptuous as vol
 
 from .api import VoyahApiAuthError, VoyahApiClient, VoyahApiConnectionError, VoyahApiError
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_BATTERY_CAPACITY,
     CONF_CAR_ID,
-    CONF_CAR_NAME,
+    CONF_CARS,
+    CONF_CONSUMPTION_WINDOW,
+    CONF_DEADBANDS,
+    CONF_GRACE_PERIOD,
+    CONF_ORGANIZATION,
     CONF_PHONE,
+    CONF_PLACES_FILE,
+    CONF_RATE_BUDGET,
     CONF_REFRESH_TOKEN,
     CONF_SCAN_INTERVAL,
+    CONF_SCHEDULES,
+    CONF_STATISTICS_MODE,
+    DEFAULT_CONSUMPTION_WINDOW,
+    DEFAULT_GRACE_PERIOD,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from .polling import PollingPolicy, PollingSchedule
 
 _LOGGER = logging.getLogger(__name__)
 
+# Organizations signed in to and searched at the same time during discovery.
+DISCOVERY_CONCURRENCY = 4
+
+INTERVAL_SECONDS = vol.All(vol.Coerce(int), vol.Range(min=10, max=3600))
+# Optional option fields whose value is dropped when left empty in the options form.
+CLEARABLE_OPTIONS = frozenset({CONF_BATTERY_CAPACITY, CONF_PLACES_FILE})
+DEADBAND_FIELDS = ("absolute", "relative", "min_interval")
+
 
 class VoyahConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Voyah."""
 
     VERSION = 2
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> VoyahOptionsFlow:
+        """Return the options flow."""
+        return VoyahOptionsFlow(config_entry)
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._phone: str = ""
-        self._access_token: str = ""
-        self._refresh_token: str = ""
-        self._organizations: list[dict[str, Any]] = []
-        self._cars: list[dict[str, Any]] = []
+        self._logins: list[_Login] = []
+        self._cars: dict[str, tuple[dict[str, Any], _Login]] = {}
         self._reauth_entry: ConfigEntry | None = None
 
     async def async_step_reauth(
@@ -121,24 +152,7 @@ class VoyahConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception during sign-in")
                 errors["base"] = "unknown"
             else:
-                self._access_token = auth_data["accessToken"]
-                self._refresh_token = auth_data["refreshToken"]
-
-                orgs = await VoyahApiClient.async_get_organizations(session, self._access_token)
-                if len(orgs) > 1:
-                    self._organizations = orgs
-                    return await self.async_step_organization()
-
-                if len(orgs) == 1:
-                    org_id = orgs[0].get("_id", orgs[0].get("id"))
-                    try:
-                        org_auth = await VoyahApiClient.async_sign_in_org(session, self._access_token, org_id)
-                        if "accessToken" in org_auth:
-                            self._access_token = org_auth["accessToken"]
-                            self._refresh_token = org_auth["refreshToken"]
-                    except VoyahApiError:
-                        _LOGGER.warning("Org sign-in failed, continuing without org")
-
+                self._logins = await _async_discover(session, auth_data["accessToken"], auth_data["refreshToken"])
                 return await self._async_load_cars()
 
         return self.async_show_form(
@@ -148,48 +162,26 @@ class VoyahConfigFlow(ConfigFlow, domain=DOMAIN):
             description_placeholders={"phone": self._phone},
         )
 
-    async def async_step_organization(
-        self,
-        user_input: dict[str, Any] | None = None,
-    ) -> FlowResult:
-        """Step 3 (optional): select organization."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            org_id = user_input["organization"]
-            session = async_get_clientsession(self.hass)
-
-            try:
-                org_auth = await VoyahApiClient.async_sign_in_org(session, self._access_token, org_id)
-            except VoyahApiError:
-                errors["base"] = "cannot_connect"
-            else:
-                if "accessToken" in org_auth:
-                    self._access_token = org_auth["accessToken"]
-                    self._refresh_token = org_auth["refreshToken"]
-                return await self._async_load_cars()
-
-        org_options = {
-            org.get("_id", org.get("id")): org.get("name", org.get("_id", "?")) for org in self._organizations
-        }
-
-        return self.async_show_form(
-            step_id="organization",
-            data_schema=vol.Schema({vol.Required("organization"): vol.In(org_options)}),
-            errors=errors,
-        )
-
     async def _async_load_cars(self) -> FlowResult:
-        """Fetch car list and proceed to car selection."""
-        session = async_get_clientsession(self.hass)
-        self._cars = await VoyahApiClient.async_search_cars(session, self._access_token)
+        """Merge the discovered cars and proceed to car selection."""
+        self._cars = {}
+        for login in self._logins:
+            for car in login.cars:
+                self._cars.setdefault(_car_id(car), (car, login))
 
         if not self._cars:
             return self.async_abort(reason="no_cars")
 
+        if self._reauth_entry is not None:
+            return self._async_finish_reauth()
+
+        configured = self._configured_car_ids()
+        self._cars = {car_id: found for car_id, found in self._cars.items() if car_id not in configured}
+        if not self._cars:
+            return self.async_abort(reason="already_configured")
+
         if len(self._cars) == 1:
-            car = self._cars[0]
-            return await self._async_create_entry(car)
+            return await self._async_create_entries(set(self._cars))
 
         return await self.async_step_car()
 
@@ -197,56 +189,273 @@ class VoyahConfigFlow(ConfigFlow, domain=DOMAIN):
         self,
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
-        """Step 4: select a car."""
-        if user_input is not None:
-            car_id = user_input["car"]
-            car = next(
-                (c for c in self._cars if c.get("_id", c.get("id")) == car_id),
-                self._cars[0],
-            )
-            return await self._async_create_entry(car)
+        """Step 3: select the cars to import, across all organizations."""
+        show_org = len({login.org_id for _, login in self._cars.values()}) > 1
+        car_options = {
+            car_id: f"{_car_label(car)} — {login.name}" if show_org else _car_label(car)
+            for car_id, (car, login) in self._cars.items()
+        }
+        errors: dict[str, str] = {}
 
-        car_options = {car.get("_id", car.get("id")): _car_label(car) for car in self._cars}
+        if user_input is not None:
+            if selected := set(user_input[CONF_CARS]):
+                return await self._async_create_entries(selected)
+            errors["base"] = "no_cars_selected"
 
         return self.async_show_form(
             step_id="car",
-            data_schema=vol.Schema({vol.Required("car"): vol.In(car_options)}),
+            data_schema=vol.Schema({vol.Required(CONF_CARS, default=list(car_options)): cv.multi_select(car_options)}),
+            errors=errors,
         )
 
-    async def _async_create_entry(self, car: dict[str, Any]) -> FlowResult:
-        """Create or update the config entry for a selected car."""
-        car_id = car.get("_id", car.get("id"))
-        car_name = _car_label(car)
-
-        if self._reauth_entry is not None:
-            await self.async_set_unique_id(f"{DOMAIN}_{car_id}")
-            self._abort_if_unique_id_mismatch()
-            return self.async_update_reload_and_abort(
-                self._reauth_entry,
-                data_updates={
-                    CONF_PHONE: self._phone,
-                    CONF_ACCESS_TOKEN: self._access_token,
-                    CONF_REFRESH_TOKEN: self._refresh_token,
-                },
-                reason="reauth_successful",
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create the entry of one more organization picked in a user flow."""
+        self._phone = import_data[CONF_PHONE]
+        login = _Login(
+            import_data.get(CONF_ORGANIZATION),
+            "",
+            import_data[CONF_ACCESS_TOKEN],
+            import_data[CONF_REFRESH_TOKEN],
+            [],
+        )
+        return await self._async_create_entry(login, import_data[CONF_CARS])
+
+    async def _async_create_entries(self, selected: set[str]) -> FlowResult:
+        """Create one account entry per organization of the selected cars.
+
+        Tokens are scoped to an organization, so each one gets its own entry.
+        This flow creates the first; the others go through import flows.
+        """
+        by_login: dict[str | None, tuple[_Login, dict[str, str]]] = {}
+        for car_id in selected:
+            car, login = self._cars[car_id]
+            by_login.setdefault(login.org_id, (login, {}))[1][car_id] = _car_label(car)
+
+        (first_login, first_cars), *others = by_login.values()
+        for login, cars in others:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_IMPORT},
+                    data={
+                        CONF_PHONE: self._phone,
+                        CONF_ORGANIZATION: login.org_id,
+                        CONF_ACCESS_TOKEN: login.access_token,
+                        CONF_REFRESH_TOKEN: login.refresh_token,
+                        CONF_CARS: cars,
+                    },
+                )
             )
+        return await self._async_create_entry(first_login, first_cars)
+
+    def _configured_car_ids(self) -> set[str]:
+        """Car ids already managed by any entry of this integration."""
+        car_ids: set[str] = set()
+        for entry in self._async_current_entries(include_ignore=False):
+            car_ids.update(entry.data.get(CONF_CARS) or ())
+            if CONF_CAR_ID in entry.data:
+                car_ids.add(entry.data[CONF_CAR_ID])
+        return car_ids
+
+    def _async_finish_reauth(self) -> FlowResult:
+        """Store the new tokens if the account still has the entry's cars."""
+        assert self._reauth_entry is not None
+        entry_car_ids = set(self._reauth_entry.data.get(CONF_CARS) or ())
+        if CONF_CAR_ID in self._reauth_entry.data:
+            entry_car_ids.add(self._reauth_entry.data[CONF_CAR_ID])
+        login = next(
+            (login for login in self._logins if entry_car_ids <= {_car_id(car) for car in login.cars}),
+            None,
+        )
+        if login is None:
+            return self.async_abort(reason="unique_id_mismatch")
 
-        await self.async_set_unique_id(f"{DOMAIN}_{car_id}")
-        self._abort_if_unique_id_configured()
+        return self.async_update_reload_and_abort(
+            self._reauth_entry,
+            data_updates={
+                CONF_PHONE: self._phone,
+                CONF_ACCESS_TOKEN: login.access_token,
+                CONF_REFRESH_TOKEN: login.refresh_token,
+            },
+            reason="reauth_successful",
+        )
 
+    async def _async_create_entry(self, login: _Login, cars: dict[str, str]) -> FlowResult:
+        """Create the account entry for one organization's selected cars.
+
+        Adding more cars of an account that already has an entry extends that
+        entry instead of creating a second client for the same tokens.
+        """
+        unique_id = f"{DOMAIN}_{self._phone}" + (f"_{login.org_id}" if login.org_id else "")
+        await self.async_set_unique_id(unique_id)
+        existing = next(
+            (entry for entry in self._async_current_entries(include_ignore=False) if entry.unique_id == unique_id),
+            None,
+        )
+        if existing is not None:
+            self._abort_if_unique_id_configured(
+                updates={
+                    CONF_ACCESS_TOKEN: login.access_token,
+                    CONF_REFRESH_TOKEN: login.refresh_token,
+                    CONF_CARS: {**existing.data.get(CONF_CARS, {}), **cars},
+                }
+            )
+
+        title = next(iter(cars.values())) if len(cars) == 1 else f"Voyah +{self._phone}"
+        if login.name and len(cars) > 1:
+            title = f"{title} ({login.name})"
         return self.async_create_entry(
-            title=car_name,
+            title=title,
             data={
                 CONF_PHONE: self._phone,
-                CONF_ACCESS_TOKEN: self._access_token,
-                CONF_REFRESH_TOKEN: self._refresh_token,
-                CONF_CAR_ID: car_id,
-                CONF_CAR_NAME: car_name,
+                CONF_ORGANIZATION: login.org_id,
+                CONF_ACCESS_TOKEN: login.access_token,
+                CONF_REFRESH_TOKEN: login.refresh_token,
+                CONF_CARS: cars,
                 CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
             },
         )
 
 
+class VoyahOptionsFlow(OptionsFlow):
+    """Change the polling policy and deadbands of a running entry.
+
+    Saved options are applied to the coordinators by the entry's update
+    listener, so no reload (and no blocking first refresh) is needed.
+    """
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> FlowResult:
+        """Edit polling, the grace period, deadbands and consumption settings."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                deadbands = _validate_deadbands(user_input.get(CONF_DEADBANDS) or {})
+            except vol.Invalid:
+                errors[CONF_DEADBANDS] = "invalid_deadbands"
+            schedules = user_input.get(CONF_SCHEDULES) or []
+            try:
+                PollingSchedule.from_options(schedules)
+            except ValueError:
+                errors[CONF_SCHEDULES] = "invalid_schedules"
+            if not errors:
+                # Keep options this form does not edit; a cleared optional
+                # field is missing from user_input and removed.
+                kept = {key: value for key, value in self._entry.options.items() if key not in CLEARABLE_OPTIONS}
+                return self.async_create_entry(
+                    title="",
+                    data={**kept, **user_input, CONF_DEADBANDS: deadbands, CONF_SCHEDULES: schedules},
+                )
+
+        policy = PollingPolicy.from_entry(self._entry)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_SCAN_INTERVAL, default=policy.interval): INTERVAL_SECONDS,
+                    vol.Required(CONF_ACTIVE_SCAN_INTERVAL, default=policy.active_interval): INTERVAL_SECONDS,
+                    vol.Required(CONF_RATE_BUDGET, default=policy.rate_budget): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
+                    vol.Required(
+                        CONF_GRACE_PERIOD, default=self._entry.options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD)
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Optional(
+                        CONF_DEADBANDS, description={"suggested_value": self._entry.options.get(CONF_DEADBANDS, {})}
+                    ): ObjectSelector(),
+                    vol.Optional(
+                        CONF_SCHEDULES, description={"suggested_value": self._entry.options.get(CONF_SCHEDULES, [])}
+                    ): ObjectSelector(),
+                    vol.Required(
+                        CONF_CONSUMPTION_WINDOW,
+                        default=self._entry.options.get(CONF_CONSUMPTION_WINDOW, DEFAULT_CONSUMPTION_WINDOW),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=10000)),
+                    vol.Optional(
+                        CONF_BATTERY_CAPACITY,
+                        description={"suggested_value": self._entry.options.get(CONF_BATTERY_CAPACITY)},
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=500)),
+                    vol.Required(
+                        CONF_STATISTICS_MODE, default=self._entry.options.get(CONF_STATISTICS_MODE, False)
+                    ): bool,
+                    vol.Optional(
+                        CONF_PLACES_FILE, description={"suggested_value": self._entry.options.get(CONF_PLACES_FILE)}
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+
+def _validate_deadbands(value: Any) -> dict[str, dict[str, float]]:
+    """Check deadband overrides: a mapping of sensor key to numeric thresholds."""
+    if not isinstance(value, dict):
+        raise vol.Invalid("deadbands must be a mapping")
+    for key, config in value.items():
+        if not isinstance(config, dict) or not set(config) <= set(DEADBAND_FIELDS):
+            raise vol.Invalid(f"invalid deadband for {key}")
+        if not all(isinstance(number, (int, float)) and number >= 0 for number in config.values()):
+            raise vol.Invalid(f"invalid deadband for {key}")
+    return value
+
+
+@dataclass(slots=True)
+class _Login:
+    """Tokens for one organization (or the personal account) and the cars they see."""
+
+    org_id: str | None
+    name: str
+    access_token: str
+    refresh_token: str
+    cars: list[dict[str, Any]]
+
+
+async def _async_discover(session: ClientSession, access_token: str, refresh_token: str) -> list[_Login]:
+    """Sign in to every organization and search its cars, in parallel.
+
+    At most DISCOVERY_CONCURRENCY organizations are queried at a time. An
+    account without organizations, or whose organization sign-ins all fail,
+    searches with its personal tokens.
+    """
+    orgs = await VoyahApiClient.async_get_organizations(session, access_token)
+    if not orgs:
+        cars = await VoyahApiClient.async_search_cars(session, access_token)
+        return [_Login(None, "", access_token, refresh_token, cars)]
+
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def _async_org_login(org: dict[str, Any]) -> _Login | None:
+        org_id = org.get("_id", org.get("id"))
+        async with semaphore:
+            try:
+                org_auth = await VoyahApiClient.async_sign_in_org(session, access_token, org_id)
+            except VoyahApiError as err:
+                _LOGGER.warning("Sign-in to organization %s failed: %s", org_id, err)
+                return None
+            if "accessToken" not in org_auth:
+                return None
+            cars = await VoyahApiClient.async_search_cars(session, org_auth["accessToken"])
+        return _Login(org_id, org.get("name", org_id), org_auth["accessToken"], org_auth["refreshToken"], cars)
+
+    logins = [login for login in await asyncio.gather(*(_async_org_login(org) for org in orgs)) if login is not None]
+    if not logins:
+        _LOGGER.warning("No organization sign-in succeeded, continuing without organization")
+        cars = await VoyahApiClient.async_search_cars(session, access_token)
+        logins.append(_Login(None, "", access_token, refresh_token, cars))
+    return logins
+
+
+def _car_id(car: dict[str, Any]) -> str:
+    """Car id from a search result."""
+    return car.get("_id", car.get("id"))
+
+
 def _car_label(car: dict[str, Any]) -> str:
     """Human-readable label for a car."""
     parts: list[str] = []
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntityDescription
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription, SensorStateClass
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfElectricPotential,
@@ -11,9 +12,16 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+    from homeassistant.components.sensor import SensorEntityDescription
+
 DOMAIN = "voyah"
+# Fired once per refresh with the telemetry keys that changed.
+EVENT_TELEMETRY_CHANGED = f"{DOMAIN}_telemetry_changed"
 
 API_BASE_URL = "https://app.voyahassist.ru"
 
@@ -22,230 +30,497 @@ CONF_ACCESS_TOKEN = "access_token"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_CAR_ID = "car_id"
 CONF_CAR_NAME = "car_name"
+# Account entries: mapping of car id to display name for every car the entry manages.
+CONF_CARS = "cars"
+CONF_ORGANIZATION = "organization"
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 60
+# Polling interval while a car is driving or charging; defaults to the scan interval.
+CONF_ACTIVE_SCAN_INTERVAL = "active_scan_interval"
+# Requests per hour shared by all cars of an entry; 0 means unlimited.
+CONF_RATE_BUDGET = "rate_budget"
+DEFAULT_RATE_BUDGET = 0
+# Time-of-day polling windows: a list of {"cron": "minute hour * * weekday", "interval": seconds}.
+CONF_SCHEDULES = "schedules"
+# Seconds entities keep the last good data after failed polls before going unavailable; 0 disables.
+CONF_GRACE_PERIOD = "grace_period"
+DEFAULT_GRACE_PERIOD = 900
+CONF_CONSUMPTION_WINDOW = "consumption_window"
+DEFAULT_CONSUMPTION_WINDOW = 100
+CONF_BATTERY_CAPACITY = "battery_capacity"
+CONF_STATISTICS_MODE = "statistics_mode"
+# GeoJSON file of named places, relative to the configuration directory.
+CONF_PLACES_FILE = "places_file"
+
+# High-frequency keys pushed as external statistics when statistics mode is on,
+# with the coarse resolution their entity state is rounded to in that mode.
+STATISTICS_RESOLUTION: dict[str, float] = {
+    "speed": 10,
+    "12VBatteryVoltage": 0.5,
+    "outsideTemp": 1,
+    "inBoardTemp": 1,
+    "batteryTemp": 1,
+    "coolantTemp": 1,
+}
+STATISTICS_KEYS: tuple[str, ...] = tuple(STATISTICS_RESOLUTION)
 
-SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
-        key="batteryPercentage",
-        translation_key="battery_percentage",
-        native_unit_of_measurement=PERCENTAGE,
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="remainsMileage",
-        translation_key="remains_mileage",
-        native_unit_of_measurement=UnitOfLength.KILOMETERS,
-        device_class=SensorDeviceClass.DISTANCE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="fuelPercentage",
-        translation_key="fuel_percentage",
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:gas-station",
-    ),
-    SensorEntityDescription(
-        key="remainsMileageFuel",
-        translation_key="remains_mileage_fuel",
-        native_unit_of_measurement=UnitOfLength.KILOMETERS,
-        device_class=SensorDeviceClass.DISTANCE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="12VBatteryVoltage",
-        translation_key="battery_voltage_12v",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="odometer",
-        translation_key="odometer",
-        native_unit_of_measurement=UnitOfLength.KILOMETERS,
-        device_class=SensorDeviceClass.DISTANCE,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        icon="mdi:counter",
-    ),
-    SensorEntityDescription(
-        key="outsideTemp",
-        translation_key="outside_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="inBoardTemp",
-        translation_key="inboard_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="batteryTemp",
-        translation_key="battery_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="coolantTemp",
-        translation_key="coolant_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="climateTargetTemp",
-        translation_key="climate_target_temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="climateFanSpeed",
-        translation_key="climate_fan_speed",
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:fan",
-    ),
-    SensorEntityDescription(
-        key="tirePressureFL",
-        translation_key="tire_pressure_front_left",
-        native_unit_of_measurement=UnitOfPressure.BAR,
-        device_class=SensorDeviceClass.PRESSURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="tirePressureFR",
-        translation_key="tire_pressure_front_right",
-        native_unit_of_measurement=UnitOfPressure.BAR,
-        device_class=SensorDeviceClass.PRESSURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="tirePressureRL",
-        translation_key="tire_pressure_rear_left",
-        native_unit_of_measurement=UnitOfPressure.BAR,
-        device_class=SensorDeviceClass.PRESSURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="tirePressureRR",
-        translation_key="tire_pressure_rear_right",
-        native_unit_of_measurement=UnitOfPressure.BAR,
-        device_class=SensorDeviceClass.PRESSURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    SensorEntityDescription(
-        key="speed",
-        translation_key="speed",
-        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-        device_class=SensorDeviceClass.SPEED,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
+# Per-key significant-change thresholds applied before a sensor writes state.
+# Each entry may set "absolute", "relative" (fraction of the last written value)
+# and "min_interval" (seconds between writes); entry options override them per key.
+CONF_DEADBANDS = "deadbands"
+DEFAULT_DEADBANDS: dict[str, dict[str, float]] = {
+    "12VBatteryVoltage": {"absolute": 0.1},
+    "outsideTemp": {"absolute": 0.5},
+    "inBoardTemp": {"absolute": 0.5},
+    "batteryTemp": {"absolute": 0.5},
+    "coolantTemp": {"absolute": 0.5},
+    "tirePressureFL": {"absolute": 0.05},
+    "tirePressureFR": {"absolute": 0.05},
+    "tirePressureRL": {"absolute": 0.05},
+    "tirePressureRR": {"absolute": 0.05},
+}
+
+# Status keys packed into bitmasks at parse time; bit i is set when key i is on.
+OPENING_KEYS: tuple[str, ...] = (
+    "doorFLStatus",
+    "doorFRStatus",
+    "doorRLStatus",
+    "doorRRStatus",
+    "trunkStatus",
+    "hatchStatus",
+)
+HEATING_KEYS: tuple[str, ...] = (
+    "climateFWindowStatus",
+    "mirrorsHeatingStatus",
+    "climateWheelHeatingStatus",
+    "seatHeatingDriverStatus",
+    "seatHeatingFPassStatus",
+    "seatHeatingRLPassStatus",
+    "seatHeatingRRPassStatus",
 )
+COMPOSITE_MEMBERS: dict[str, tuple[str, ...]] = {
+    "openings": OPENING_KEYS,
+    "heating": HEATING_KEYS,
+}
 
-BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = (
-    BinarySensorEntityDescription(
-        key="ignitionStatus",
-        translation_key="ignition",
-        device_class=BinarySensorDeviceClass.POWER,
-    ),
-    BinarySensorEntityDescription(
-        key="chargingStatus",
-        translation_key="charging",
-        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-    ),
-    BinarySensorEntityDescription(
-        key="centralLockingStatus",
-        translation_key="central_locking",
-        device_class=BinarySensorDeviceClass.LOCK,
-    ),
-    BinarySensorEntityDescription(
-        key="doorFLStatus",
-        translation_key="door_front_left",
-        device_class=BinarySensorDeviceClass.DOOR,
-    ),
-    BinarySensorEntityDescription(
-        key="doorFRStatus",
-        translation_key="door_front_right",
-        device_class=BinarySensorDeviceClass.DOOR,
-    ),
-    BinarySensorEntityDescription(
-        key="doorRLStatus",
-        translation_key="door_rear_left",
-        device_class=BinarySensorDeviceClass.DOOR,
-    ),
-    BinarySensorEntityDescription(
-        key="trunkStatus",
-        translation_key="trunk",
-        device_class=BinarySensorDeviceClass.DOOR,
-    ),
-    BinarySensorEntityDescription(
-        key="hatchStatus",
-        translation_key="hatch",
-        device_class=BinarySensorDeviceClass.DOOR,
-    ),
-    BinarySensorEntityDescription(
-        key="climateStatus",
-        translation_key="climate",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="securityStatus",
-        translation_key="security",
-        device_class=BinarySensorDeviceClass.SAFETY,
-    ),
-    BinarySensorEntityDescription(
-        key="headLightsStatus",
-        translation_key="headlights",
-        device_class=BinarySensorDeviceClass.LIGHT,
-    ),
-    BinarySensorEntityDescription(
-        key="ready",
-        translation_key="ready",
-        device_class=BinarySensorDeviceClass.POWER,
-    ),
-    BinarySensorEntityDescription(
-        key="airingStatus",
-        translation_key="airing",
-        device_class=BinarySensorDeviceClass.OPENING,
-    ),
-    BinarySensorEntityDescription(
-        key="climateFWindowStatus",
-        translation_key="climate_front_window",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="mirrorsHeatingStatus",
-        translation_key="mirrors_heating",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="climateWheelHeatingStatus",
-        translation_key="wheel_heating",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="seatHeatingDriverStatus",
-        translation_key="seat_heating_driver",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="seatHeatingFPassStatus",
-        translation_key="seat_heating_front_passenger",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="seatHeatingRLPassStatus",
-        translation_key="seat_heating_rear_left",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
-    BinarySensorEntityDescription(
-        key="seatHeatingRRPassStatus",
-        translation_key="seat_heating_rear_right",
-        device_class=BinarySensorDeviceClass.RUNNING,
-    ),
+# sensorsData keys with a dedicated binary sensor. Kept as a plain set so setup can
+# decide whether the binary_sensor platform is needed without building its descriptions.
+BINARY_SENSOR_KEYS: frozenset[str] = frozenset(
+    {
+        "ignitionStatus",
+        "chargingStatus",
+        "centralLockingStatus",
+        "doorFLStatus",
+        "doorFRStatus",
+        "doorRLStatus",
+        "trunkStatus",
+        "hatchStatus",
+        "climateStatus",
+        "securityStatus",
+        "headLightsStatus",
+        "ready",
+        "airingStatus",
+        "climateFWindowStatus",
+        "mirrorsHeatingStatus",
+        "climateWheelHeatingStatus",
+        "seatHeatingDriverStatus",
+        "seatHeatingFPassStatus",
+        "seatHeatingRLPassStatus",
+        "seatHeatingRRPassStatus",
+    }
 )
+
+# Identifier of the integration-level device that carries the fleet aggregates.
+FLEET_DEVICE_ID = "fleet"
+
+# Entity descriptions are built per platform on first access (see __getattr__) so
+# that importing this module, which every other module does, does not pull in the
+# sensor and binary_sensor components; binary sensor descriptions are only built
+# once that platform is set up.
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...]
+BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...]
+COMPOSITE_BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...]
+TRIP_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...]
+CONSUMPTION_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...]
+FLEET_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...]
+
+
+def _build_sensor_descriptions() -> dict[str, tuple[Any, ...]]:
+    """Build the sensor platform's description tables."""
+    from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription, SensorStateClass  # noqa: PLC0415
+
+    sensor_descriptions = (
+        SensorEntityDescription(
+            key="batteryPercentage",
+            translation_key="battery_percentage",
+            native_unit_of_measurement=PERCENTAGE,
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="remainsMileage",
+            translation_key="remains_mileage",
+            native_unit_of_measurement=UnitOfLength.KILOMETERS,
+            device_class=SensorDeviceClass.DISTANCE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="fuelPercentage",
+            translation_key="fuel_percentage",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:gas-station",
+        ),
+        SensorEntityDescription(
+            key="remainsMileageFuel",
+            translation_key="remains_mileage_fuel",
+            native_unit_of_measurement=UnitOfLength.KILOMETERS,
+            device_class=SensorDeviceClass.DISTANCE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="12VBatteryVoltage",
+            translation_key="battery_voltage_12v",
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="odometer",
+            translation_key="odometer",
+            native_unit_of_measurement=UnitOfLength.KILOMETERS,
+            device_class=SensorDeviceClass.DISTANCE,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:counter",
+        ),
+        SensorEntityDescription(
+            key="outsideTemp",
+            translation_key="outside_temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="inBoardTemp",
+            translation_key="inboard_temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="batteryTemp",
+            translation_key="battery_temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="coolantTemp",
+            translation_key="coolant_temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="climateTargetTemp",
+            translation_key="climate_target_temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="climateFanSpeed",
+            translation_key="climate_fan_speed",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:fan",
+        ),
+        SensorEntityDescription(
+            key="tirePressureFL",
+            translation_key="tire_pressure_front_left",
+            native_unit_of_measurement=UnitOfPressure.BAR,
+            device_class=SensorDeviceClass.PRESSURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="tirePressureFR",
+            translation_key="tire_pressure_front_right",
+            native_unit_of_measurement=UnitOfPressure.BAR,
+            device_class=SensorDeviceClass.PRESSURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="tirePressureRL",
+            translation_key="tire_pressure_rear_left",
+            native_unit_of_measurement=UnitOfPressure.BAR,
+            device_class=SensorDeviceClass.PRESSURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="tirePressureRR",
+            translation_key="tire_pressure_rear_right",
+            native_unit_of_measurement=UnitOfPressure.BAR,
+            device_class=SensorDeviceClass.PRESSURE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key="speed",
+            translation_key="speed",
+            native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+            device_class=SensorDeviceClass.SPEED,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+    )
+
+    trip_sensor_descriptions = (
+        SensorEntityDescription(
+            key="distance",
+            translation_key="last_trip_distance",
+            native_unit_of_measurement=UnitOfLength.KILOMETERS,
+            device_class=SensorDeviceClass.DISTANCE,
+            icon="mdi:map-marker-distance",
+        ),
+        SensorEntityDescription(
+            key="duration",
+            translation_key="last_trip_duration",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            suggested_unit_of_measurement=UnitOfTime.MINUTES,
+            device_class=SensorDeviceClass.DURATION,
+        ),
+        SensorEntityDescription(
+            key="average_speed",
+            translation_key="last_trip_average_speed",
+            native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+            device_class=SensorDeviceClass.SPEED,
+        ),
+        SensorEntityDescription(
+            key="max_speed",
+            translation_key="last_trip_max_speed",
+            native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+            device_class=SensorDeviceClass.SPEED,
+        ),
+        SensorEntityDescription(
+            key="soc_used",
+            translation_key="last_trip_soc_used",
+            native_unit_of_measurement=PERCENTAGE,
+            icon="mdi:battery-arrow-down",
+        ),
+    )
+
+    consumption_sensor_descriptions = (
+        SensorEntityDescription(
+            key="rolling_pct_per_km",
+            translation_key="consumption_rolling_pct",
+            native_unit_of_measurement="%/km",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-arrow-down-outline",
+        ),
+        SensorEntityDescription(
+            key="trip_pct_per_km",
+            translation_key="consumption_trip_pct",
+            native_unit_of_measurement="%/km",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-arrow-down-outline",
+        ),
+        SensorEntityDescription(
+            key="rolling_kwh_per_100km",
+            translation_key="consumption_rolling_energy",
+            native_unit_of_measurement="kWh/100km",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:lightning-bolt-outline",
+        ),
+        SensorEntityDescription(
+            key="trip_kwh_per_100km",
+            translation_key="consumption_trip_energy",
+            native_unit_of_measurement="kWh/100km",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:lightning-bolt-outline",
+        ),
+    )
+
+    fleet_sensor_descriptions = (
+        SensorEntityDescription(
+            key="cars",
+            translation_key="fleet_cars",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:car-multiple",
+        ),
+        SensorEntityDescription(
+            key="charging",
+            translation_key="fleet_charging",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:ev-station",
+        ),
+        SensorEntityDescription(
+            key="doors_open",
+            translation_key="fleet_doors_open",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:car-door",
+        ),
+        SensorEntityDescription(
+            key="average_battery",
+            translation_key="fleet_average_battery",
+            native_unit_of_measurement=PERCENTAGE,
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+        ),
+        SensorEntityDescription(
+            key="total_odometer",
+            translation_key="fleet_total_odometer",
+            native_unit_of_measurement=UnitOfLength.KILOMETERS,
+            device_class=SensorDeviceClass.DISTANCE,
+            state_class=SensorStateClass.TOTAL,
+            suggested_display_precision=0,
+        ),
+    )
+
+    return {
+        "SENSOR_DESCRIPTIONS": sensor_descriptions,
+        "TRIP_SENSOR_DESCRIPTIONS": trip_sensor_descriptions,
+        "CONSUMPTION_SENSOR_DESCRIPTIONS": consumption_sensor_descriptions,
+        "FLEET_SENSOR_DESCRIPTIONS": fleet_sensor_descriptions,
+    }
+
+
+def _build_binary_sensor_descriptions() -> dict[str, tuple[Any, ...]]:
+    """Build the binary_sensor platform's description tables."""
+    from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntityDescription  # noqa: PLC0415
+
+    binary_sensor_descriptions = (
+        BinarySensorEntityDescription(
+            key="ignitionStatus",
+            translation_key="ignition",
+            device_class=BinarySensorDeviceClass.POWER,
+        ),
+        BinarySensorEntityDescription(
+            key="chargingStatus",
+            translation_key="charging",
+            device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+        ),
+        BinarySensorEntityDescription(
+            key="centralLockingStatus",
+            translation_key="central_locking",
+            device_class=BinarySensorDeviceClass.LOCK,
+        ),
+        BinarySensorEntityDescription(
+            key="doorFLStatus",
+            translation_key="door_front_left",
+            device_class=BinarySensorDeviceClass.DOOR,
+        ),
+        BinarySensorEntityDescription(
+            key="doorFRStatus",
+            translation_key="door_front_right",
+            device_class=BinarySensorDeviceClass.DOOR,
+        ),
+        BinarySensorEntityDescription(
+            key="doorRLStatus",
+            translation_key="door_rear_left",
+            device_class=BinarySensorDeviceClass.DOOR,
+        ),
+        BinarySensorEntityDescription(
+            key="trunkStatus",
+            translation_key="trunk",
+            device_class=BinarySensorDeviceClass.DOOR,
+        ),
+        BinarySensorEntityDescription(
+            key="hatchStatus",
+            translation_key="hatch",
+            device_class=BinarySensorDeviceClass.DOOR,
+        ),
+        BinarySensorEntityDescription(
+            key="climateStatus",
+            translation_key="climate",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="securityStatus",
+            translation_key="security",
+            device_class=BinarySensorDeviceClass.SAFETY,
+        ),
+        BinarySensorEntityDescription(
+            key="headLightsStatus",
+            translation_key="headlights",
+            device_class=BinarySensorDeviceClass.LIGHT,
+        ),
+        BinarySensorEntityDescription(
+            key="ready",
+            translation_key="ready",
+            device_class=BinarySensorDeviceClass.POWER,
+        ),
+        BinarySensorEntityDescription(
+            key="airingStatus",
+            translation_key="airing",
+            device_class=BinarySensorDeviceClass.OPENING,
+        ),
+        BinarySensorEntityDescription(
+            key="climateFWindowStatus",
+            translation_key="climate_front_window",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="mirrorsHeatingStatus",
+            translation_key="mirrors_heating",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="climateWheelHeatingStatus",
+            translation_key="wheel_heating",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="seatHeatingDriverStatus",
+            translation_key="seat_heating_driver",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="seatHeatingFPassStatus",
+            translation_key="seat_heating_front_passenger",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="seatHeatingRLPassStatus",
+            translation_key="seat_heating_rear_left",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        BinarySensorEntityDescription(
+            key="seatHeatingRRPassStatus",
+            translation_key="seat_heating_rear_right",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+    )
+
+    composite_binary_sensor_descriptions = (
+        BinarySensorEntityDescription(
+            key="openings",
+            translation_key="any_opening",
+            device_class=BinarySensorDeviceClass.OPENING,
+        ),
+        BinarySensorEntityDescription(
+            key="heating",
+            translation_key="any_heating",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+    )
+
+    return {
+        "BINARY_SENSOR_DESCRIPTIONS": binary_sensor_descriptions,
+        "COMPOSITE_BINARY_SENSOR_DESCRIPTIONS": composite_binary_sensor_descriptions,
+    }
+
+
+_DESCRIPTION_BUILDERS: dict[str, Callable[[], dict[str, tuple[Any, ...]]]] = {
+    "SENSOR_DESCRIPTIONS": _build_sensor_descriptions,
+    "TRIP_SENSOR_DESCRIPTIONS": _build_sensor_descriptions,
+    "CONSUMPTION_SENSOR_DESCRIPTIONS": _build_sensor_descriptions,
+    "FLEET_SENSOR_DESCRIPTIONS": _build_sensor_descriptions,
+    "BINARY_SENSOR_DESCRIPTIONS": _build_binary_sensor_descriptions,
+    "COMPOSITE_BINARY_SENSOR_DESCRIPTIONS": _build_binary_sensor_descriptions,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build a platform's description tables the first time one of them is imported."""
+    if (build := _DESCRIPTION_BUILDERS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals().update(build())
+    return globals()[name]
@@ -0,0 +1,130 @@
+"""Incremental energy consumption tracking for the Voyah integration."""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+MIN_ROLLING_DISTANCE_KM = 5.0
+MIN_TRIP_DISTANCE_KM = 1.0
+
+
+class ConsumptionTracker:
+    """Maintain rolling and per-trip consumption from odometer and SoC deltas.
+
+    Every snapshot contributes one (distance, soc_used) segment. Segments are
+    summed into the current trip and into a distance-bounded rolling window, so
+    each update is amortized O(1) and memory is bounded by the window length.
+
+    Charging intervals never count: while ``chargingStatus`` is on, or when SoC
+    rises while the car is parked, the baseline is reset instead of producing a
+    negative segment.
+    """
+
+    def __init__(self, window_km: float, battery_capacity: float | None = None) -> None:
+        self.window_km = window_km
+        self.battery_capacity = battery_capacity
+        self._segments: deque[tuple[float, float]] = deque()
+        self._window_distance = 0.0
+        self._window_soc = 0.0
+        self._trip_distance = 0.0
+        self._trip_soc = 0.0
+        self._last_odometer: float | None = None
+        self._last_soc: float | None = None
+        self._last_ignition = False
+
+    def update(self, data: dict[str, Any]) -> None:
+        """Consume one coordinator snapshot."""
+        sensors = data.get("sensors_data") or {}
+        odometer = sensors.get("odometer")
+        soc = sensors.get("batteryPercentage")
+        ignition = bool(sensors.get("ignitionStatus"))
+        charging = bool(sensors.get("chargingStatus"))
+
+        if ignition and not self._last_ignition:
+            self._trip_distance = 0.0
+            self._trip_soc = 0.0
+        self._last_ignition = ignition
+
+        last_odometer = self._last_odometer
+        last_soc = self._last_soc
+        self._last_odometer = odometer
+        self._last_soc = soc
+
+        if odometer is None or soc is None or last_odometer is None or last_soc is None:
+            return
+        if charging:
+            return
+
+        distance = odometer - last_odometer
+        soc_used = last_soc - soc
+        if distance < 0:
+            _LOGGER.debug("Odometer went backwards (%s -> %s), skipping segment", last_odometer, odometer)
+            return
+        if distance == 0 and not ignition:
+            # Parked: SoC drift or an unreported charge must not count as driving consumption.
+            return
+
+        self._add_segment(distance, soc_used)
+
+    def _add_segment(self, distance: float, soc_used: float) -> None:
+        self._trip_distance += distance
+        self._trip_soc += soc_used
+
+        self._segments.append((distance, soc_used))
+        self._window_distance += distance
+        self._window_soc += soc_used
+        self._trim()
+
+    def reconfigure(self, window_km: float, battery_capacity: float | None) -> None:
+        """Apply new settings, trimming the window if it shrank."""
+        self.window_km = window_km
+        self.battery_capacity = battery_capacity
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest segments while the window still covers window_km without them."""
+        while self._segments and self._window_distance - self._segments[0][0] >= self.window_km:
+            old_distance, old_soc = self._segments.popleft()
+            self._window_distance -= old_distance
+            self._window_soc -= old_soc
+
+    @staticmethod
+    def _per_km(soc: float, distance: float, min_distance: float) -> float | None:
+        if distance < min_distance:
+            return None
+        return round(soc / distance, 3)
+
+    def _to_kwh_per_100km(self, pct_per_km: float | None) -> float | None:
+        if pct_per_km is None or not self.battery_capacity:
+            return None
+        # pct/km * (capacity kWh / 100 pct) * 100 km
+        return round(pct_per_km * self.battery_capacity, 1)
+
+    @property
+    def rolling_pct_per_km(self) -> float | None:
+        """Battery percentage per km over the rolling window."""
+        return self._per_km(self._window_soc, self._window_distance, MIN_ROLLING_DISTANCE_KM)
+
+    @property
+    def rolling_kwh_per_100km(self) -> float | None:
+        """Energy per 100 km over the rolling window."""
+        return self._to_kwh_per_100km(self.rolling_pct_per_km)
+
+    @property
+    def trip_pct_per_km(self) -> float | None:
+        """Battery percentage per km over the current or last trip."""
+        return self._per_km(self._trip_soc, self._trip_distance, MIN_TRIP_DISTANCE_KM)
+
+    @property
+    def trip_kwh_per_100km(self) -> float | None:
+        """Energy per 100 km over the current or last trip."""
+        return self._to_kwh_per_100km(self.trip_pct_per_km)
+
+    @property
+    def window_distance(self) -> float:
+        """Distance currently covered by the rolling window."""
+        return round(self._window_distance, 1)
@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import VoyahApiAuthError, VoyahApiClient, VoyahApiError
-from .const import CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, DOMAIN
+from .car import VoyahCar
+from .chargers import VoyahChargerLog
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_BATTERY_CAPACITY,
+    CONF_CONSUMPTION_WINDOW,
+    CONF_DEADBANDS,
+    CONF_GRACE_PERIOD,
+    CONF_REFRESH_TOKEN,
+    CONF_STATISTICS_MODE,
+    DEFAULT_CONSUMPTION_WINDOW,
+    DEFAULT_DEADBANDS,
+    DEFAULT_GRACE_PERIOD,
+    DOMAIN,
+    EVENT_TELEMETRY_CHANGED,
+)
+from .consumption import ConsumptionTracker
+from .deadband import Deadband, build_deadbands
+from .fleet import FleetCar, FleetContribution, async_get_fleet_aggregates, async_get_fleet_index
+from .gps import MotionEstimator
+from .places import PlaceIndex
+from .polling import PollingPolicy, SleepBackoff
+from .route import VoyahRouteLog
+from .statistics import VoyahStatistics
+from .telemetry import diff_telemetry, flatten_telemetry
+from .trips import VoyahTripLog
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +55,7 @@ class VoyahDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         client: VoyahApiClient,
         entry: ConfigEntry,
         update_interval: int,
+        car: VoyahCar | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -37,30 +65,222 @@ class VoyahDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.client = client
         self._entry = entry
-        self._last_access_token = client.access_token
-        self._last_refresh_token = client.refresh_token
+        self.car = car or VoyahCar.from_entry(entry)
+        self.car_id = self.car.car_id
+        self.car_name = self.car.name
+        self._motion = MotionEstimator()
+        self.trips = VoyahTripLog(hass, self.car_id)
+        self.routes = VoyahRouteLog(hass, self.car_id)
+        self.chargers = VoyahChargerLog(hass, self.car_id)
+        self.consumption = ConsumptionTracker(
+            entry.options.get(CONF_CONSUMPTION_WINDOW, DEFAULT_CONSUMPTION_WINDOW),
+            entry.options.get(CONF_BATTERY_CAPACITY),
+        )
+        self.deadbands: dict[str, Deadband] = build_deadbands(DEFAULT_DEADBANDS, entry.options.get(CONF_DEADBANDS, {}))
+        self.places: PlaceIndex | None = None
+        self.place: str | None = None
+        self.policy = PollingPolicy.from_entry(entry)
+        self.boost_until: datetime | None = None
+        self._boost_interval: int | None = None
+        self.sleep = SleepBackoff()
+        self.grace_period = timedelta(seconds=entry.options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD))
+        # Time of the last good snapshot while it is served in place of failed polls.
+        # It stays fixed for the whole outage, so entities only write on entering and leaving it.
+        self.last_data: datetime | None = None
+        self._fetched_at: datetime | None = None
+        self.telemetry: dict[str, Any] | None = None
+        self.statistics: VoyahStatistics | None = None
+        if entry.options.get(CONF_STATISTICS_MODE):
+            self.statistics = VoyahStatistics(hass, self.car_id, self.car_name)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the API."""
         try:
-            data = await self.client.async_get_car_data()
+            data = await self.client.async_get_car_data(self.car_id)
         except VoyahApiAuthError as err:
             raise ConfigEntryAuthFailed(err) from err
         except VoyahApiError as err:
+            if (stale := self._last_known_data()) is not None:
+                _LOGGER.debug("Serving data from %s for %s: %s", self.last_data, self.car_name, err)
+                return stale
             raise UpdateFailed(f"Error fetching Voyah data: {err}") from err
 
+        self._fetched_at = dt_util.utcnow()
+        self.last_data = None
         self._persist_tokens_if_changed()
+        self._process_snapshot(data)
+        self.sleep.update(data)
+        self.update_interval = self._next_interval(data)
         return data
 
+    @callback
+    def async_apply_options(self) -> None:
+        """Pick up changed entry options without reloading the entry.
+
+        The polling policy, deadbands and consumption settings are read on
+        every refresh, so replacing them is enough; the pending poll is
+        rescheduled so that a shorter interval takes effect right away, and
+        listeners are told so that entities for a new battery capacity appear.
+        """
+        options = self._entry.options
+        self.consumption.reconfigure(
+            options.get(CONF_CONSUMPTION_WINDOW, DEFAULT_CONSUMPTION_WINDOW), options.get(CONF_BATTERY_CAPACITY)
+        )
+        self.grace_period = timedelta(seconds=options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD))
+        self.deadbands = build_deadbands(DEFAULT_DEADBANDS, options.get(CONF_DEADBANDS, {}))
+        if self.data is not None:
+            self.async_update_listeners()
+        policy = PollingPolicy.from_entry(self._entry)
+        if policy == self.policy:
+            return
+        self.policy = policy
+        self._reschedule()
+
+    @callback
+    def async_boost(self, interval: int, duration: timedelta) -> datetime:
+        """Poll at least every interval seconds for the given duration; return its end.
+
+        Overlapping boosts merge rather than stack: the shorter interval and the
+        later end win. The first poll after the end returns to the policy.
+        """
+        now = dt_util.utcnow()
+        until = now + duration
+        if self.boost_until is not None and self.boost_until > now and self._boost_interval is not None:
+            interval = min(interval, self._boost_interval)
+            until = max(until, self.boost_until)
+        self._boost_interval = interval
+        self.boost_until = until
+        self._reschedule()
+        return until
+
+    def _next_interval(self, data: dict[str, Any] | None) -> timedelta:
+        """Delay before the next poll under the policy, any running boost and sleep backoff."""
+        if self.boost_until is not None and dt_util.utcnow() >= self.boost_until:
+            self.boost_until = self._boost_interval = None
+        return self.policy.interval_for(data, self._boost_interval, backoff=self.sleep.level)
+
+    def _last_known_data(self) -> dict[str, Any] | None:
+        """Return the last good snapshot while it is within the grace period.
+
+        Entities then keep their values, with a last_data attribute, instead
+        of flapping to unavailable on every failed poll.
+        """
+        self.last_data = None
+        if self.data is None or self._fetched_at is None:
+            return None
+        if dt_util.utcnow() - self._fetched_at >= self.grace_period:
+            return None
+        self.last_data = self._fetched_at
+        self.update_interval = self._next_interval(self.data)
+        return self.data
+
+    def _reschedule(self) -> None:
+        """Replace the pending poll with one at the current interval."""
+        self.update_interval = self._next_interval(self.data)
+        self._schedule_refresh()
+
+    def _process_snapshot(self, data: dict[str, Any]) -> None:
+        """Feed a fresh snapshot to the incremental per-car trackers."""
+        now = dt_util.utcnow().timestamp()
+        self._derive_motion(data, now)
+        self.trips.process(data, now)
+        self.routes.process(data, now)
+        self.consumption.update(data)
+        self._resolve_place(data)
+        self.chargers.process(data, now, self.place)
+        self._update_fleet_index(data)
+        async_get_fleet_aggregates(self.hass).update(self.car_id, FleetContribution.from_data(data))
+        if self.statistics is not None:
+            self.statistics.async_process(data, now)
+        self._fire_telemetry_changes(data)
+
+    def _fire_telemetry_changes(self, data: dict[str, Any]) -> None:
+        """Fire one event listing the telemetry keys this snapshot changed.
+
+        Automations can match several keys changing in one poll on a single
+        event type instead of many entity state changes. The first snapshot
+        after setup has nothing to compare against and fires nothing.
+        """
+        previous = self.telemetry
+        self.telemetry = flatten_telemetry(data)
+        if previous is None or not (changes := diff_telemetry(previous, self.telemetry)):
+            return
+        device = dr.async_get(self.hass).async_get_device(identifiers=self.car.device_info["identifiers"])
+        self.hass.bus.async_fire(
+            EVENT_TELEMETRY_CHANGED,
+            {
+                "device_id": device.id if device is not None else None,
+                "car_id": self.car_id,
+                "changes": [{"key": key, "old": old, "new": new} for key, (old, new) in changes.items()],
+            },
+        )
+
+    def _derive_motion(self, data: dict[str, Any], now: float) -> None:
+        """Fill in speed and course from consecutive fixes when the car omits them.
+
+        Keys filled this way are listed in data["derived"].
+        """
+        position = data.get("position_data") or {}
+        lat = position.get("lat")
+        lon = position.get("lon")
+        if lat is None or lon is None:
+            return
+
+        speed, course = self._motion.update(lat, lon, data.get("time") or now)
+        derived: list[str] = []
+        if position.get("speed") is None and speed is not None:
+            data.setdefault("sensors_data", {})["speed"] = speed
+            derived.append("speed")
+        if position.get("course") is None and course is not None:
+            position["course"] = course
+            derived.append("course")
+        if derived:
+            data["derived"] = derived
+
+    def _resolve_place(self, data: dict[str, Any]) -> None:
+        """Look the current fix up in the offline place index, if one is loaded."""
+        if self.places is None:
+            return
+        position = data.get("position_data") or {}
+        lat = position.get("lat")
+        lon = position.get("lon")
+        if lat is not None and lon is not None:
+            self.place = self.places.lookup(lat, lon)
+
+    def _update_fleet_index(self, data: dict[str, Any]) -> None:
+        """Publish the car's latest position and state to the shared fleet index."""
+        position = data.get("position_data") or {}
+        lat = position.get("lat")
+        lon = position.get("lon")
+        if lat is None or lon is None:
+            return
+        sensors = data.get("sensors_data") or {}
+        charging = sensors.get("chargingStatus")
+        ignition = sensors.get("ignitionStatus")
+        async_get_fleet_index(self.hass).update(
+            FleetCar(
+                car_id=self.car_id,
+                name=self.car_name,
+                lat=lat,
+                lon=lon,
+                battery=sensors.get("batteryPercentage"),
+                charging=None if charging is None else bool(charging),
+                ignition=None if ignition is None else bool(ignition),
+            )
+        )
+
     def _persist_tokens_if_changed(self) -> None:
-        """Save refreshed tokens back to the config entry."""
+        """Save refreshed tokens back to the config entry.
+
+        The client is shared by all cars of the entry, so whichever car's
+        refresh notices new tokens first writes them once for everyone.
+        """
         new_access = self.client.access_token
         new_refresh = self.client.refresh_token
 
-        if new_access != self._last_access_token or new_refresh != self._last_refresh_token:
-            self._last_access_token = new_access
-            self._last_refresh_token = new_refresh
-
+        if new_access != self._entry.data.get(CONF_ACCESS_TOKEN) or new_refresh != self._entry.data.get(
+            CONF_REFRESH_TOKEN
+        ):
             new_data = {**self._entry.data}
             new_data[CONF_ACCESS_TOKEN] = new_access
             new_data[CONF_REFRESH_TOKEN] = new_refresh
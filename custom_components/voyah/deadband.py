@@ -0,0 +1,50 @@
+"""Significant-change filtering for Voyah sensor states."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class Deadband:
+    """Thresholds a new value must cross before it is written as state.
+
+    A change is significant when it reaches either the absolute or the relative
+    threshold; with neither set, every change is significant. ``min_interval``
+    limits how often significant changes are written, in seconds.
+    """
+
+    absolute: float | None = None
+    relative: float | None = None
+    min_interval: float = 0
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> Deadband:
+        """Build from an options dict with optional absolute/relative/min_interval."""
+        return cls(
+            absolute=config.get("absolute"),
+            relative=config.get("relative"),
+            min_interval=config.get("min_interval", 0),
+        )
+
+    def is_significant(self, old: Any, new: Any) -> bool:
+        """Return whether moving from old to new should produce a state write."""
+        if old == new:
+            return False
+        if not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+            return True
+        if self.absolute is None and self.relative is None:
+            return True
+        delta = abs(new - old)
+        if self.absolute is not None and delta >= self.absolute:
+            return True
+        return self.relative is not None and delta >= self.relative * abs(old)
+
+
+def build_deadbands(defaults: dict[str, dict[str, Any]], overrides: dict[str, dict[str, Any]]) -> dict[str, Deadband]:
+    """Merge per-key option overrides over the defaults."""
+    merged = {key: dict(config) for key, config in defaults.items()}
+    for key, config in overrides.items():
+        merged.setdefault(key, {}).update(config)
+    return {key: Deadband.from_dict(config) for key, config in merged.items()}
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Any
+
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_CAR_ID, CONF_CAR_NAME, DOMAIN
+from .account import VoyahAccount
+from .const import DOMAIN
 from .coordinator import VoyahDataUpdateCoordinator
-
-HDOP_TO_METERS = 5.0
+from .entity import VoyahEntity
+from .gps import PositionFilter, hdop_to_accuracy
 
 
 async def async_setup_entry(
@@ -22,36 +24,99 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Voyah device tracker."""
-    coordinator: VoyahDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    account: VoyahAccount = hass.data[DOMAIN][entry.entry_id]
+    for coordinator in account.coordinators.values():
+        _async_setup_car(entry, coordinator, async_add_entities)
 
-    position_data = coordinator.data.get("position_data", {})
-    if position_data.get("lat") is not None and position_data.get("lon") is not None:
-        async_add_entities([VoyahDeviceTracker(coordinator, entry)])
 
+def _has_position(data: dict[str, Any]) -> bool:
+    position = data.get("position_data") or {}
+    return position.get("lat") is not None and position.get("lon") is not None
 
-class VoyahDeviceTracker(CoordinatorEntity[VoyahDataUpdateCoordinator], TrackerEntity):
-    """Voyah vehicle GPS tracker."""
 
-    _attr_has_entity_name = True
-    _attr_translation_key = "location"
+@callback
+def _async_setup_car(
+    entry: ConfigEntry,
+    coordinator: VoyahDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add the car's tracker now, or once it first reports a position."""
+    if _has_position(coordinator.data):
+        async_add_entities([VoyahDeviceTracker(coordinator)])
+        return
+    added = False
 
-    def __init__(
-        self,
-        coordinator: VoyahDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        super().__init__(coordinator)
-        car_id = entry.data.get(CONF_CAR_ID, entry.entry_id)
-        self._attr_unique_id = f"{car_id}_location"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, car_id)},
-            name=entry.data.get(CONF_CAR_NAME, "Voyah"),
-            manufacturer="Voyah",
-        )
+    @callback
+    def _async_on_coordinator_update() -> None:
+        nonlocal added
+        if not added and _has_position(coordinator.data):
+            added = True
+            async_add_entities([VoyahDeviceTracker(coordinator)])
 
-    @property
-    def _position(self) -> dict:
-        return self.coordinator.data.get("position_data") or {}
+    entry.async_on_unload(coordinator.async_add_listener(_async_on_coordinator_update))
+
+
+class VoyahDeviceTracker(VoyahEntity, TrackerEntity):
+    """Voyah vehicle GPS tracker."""
+
+    _attr_translation_key = "location"
+    # These change on nearly every poll while driving; keep them out of the recorder.
+    _unrecorded_attributes = frozenset({"course", "altitude", "satellites", "hdop"})
+
+    def __init__(self, coordinator: VoyahDataUpdateCoordinator) -> None:
+        super().__init__(coordinator, "location")
+        self._status_written: tuple[bool, datetime | None] | None = None
+        self._attributes_key: tuple | None = None
+        self._attributes: dict[str, float | int | None] = {}
+        self._update_attributes()
+        self._filter = PositionFilter()
+        self._update_position()
+
+    def _update_position(self) -> bool:
+        """Run the latest fix through the jitter filter; return whether the output moved."""
+        before = self._filter.position
+        pos = self.position_data
+        speed = pos.get("speed")
+        if speed is None:
+            speed = self.sensors_data.get("speed")
+        after = self._filter.update(pos.get("lat"), pos.get("lon"), hdop_to_accuracy(pos.get("hdop")), speed)
+        return after is not before
+
+    def _update_attributes(self) -> bool:
+        """Rebuild the attribute dict only when the underlying fields changed."""
+        pos = self.position_data
+        key = (pos.get("course"), pos.get("height"), pos.get("sats"), pos.get("hdop"))
+        if key == self._attributes_key:
+            return False
+        self._attributes_key = key
+        self._attributes = {
+            "course": key[0],
+            "altitude": key[1],
+            "satellites": key[2],
+            "hdop": key[3],
+        }
+        return True
+
+    def _should_write(self) -> bool:
+        """Feed the latest snapshot; return whether the state needs writing.
+
+        While the position is locked, changes to the unrecorded high-churn
+        attributes alone (satellites, hdop, altitude) do not write: a parked
+        car would otherwise write on nearly every poll. The latest values go
+        out with the next write.
+        """
+        moved = self._update_position()
+        self._update_attributes()
+        if moved or self._status != self._status_written:
+            self._status_written = self._status
+            return True
+        return False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the filtered position, availability or data age changed."""
+        if self._should_write():
+            super()._handle_coordinator_update()
 
     @property
     def source_type(self) -> SourceType:
@@ -59,25 +124,20 @@ class VoyahDeviceTracker(CoordinatorEntity[VoyahDataUpdateCoordinator], TrackerE
 
     @property
     def latitude(self) -> float | None:
-        return self._position.get("lat")
+        position = self._filter.position
+        return position.lat if position else None
 
     @property
     def longitude(self) -> float | None:
-        return self._position.get("lon")
+        position = self._filter.position
+        return position.lon if position else None
 
     @property
     def location_accuracy(self) -> int:
-        hdop = self._position.get("hdop")
-        if hdop is not None:
-            return int(hdop * HDOP_TO_METERS)
+        position = self._filter.position
+        if position is not None and position.accuracy is not None:
+            return int(position.accuracy)
         return 0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, float | int | None]:
-        pos = self._position
-        return {
-            "course": pos.get("course"),
-            "altitude": pos.get("height"),
-            "satellites": pos.get("sats"),
-            "hdop": pos.get("hdop"),
-        }
+    def _extra_attributes(self) -> dict[str, float | int | None]:
+        return self._attributes
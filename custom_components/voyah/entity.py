@@ -0,0 +1,49 @@
+"""Base entity for the Voyah integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import VoyahDataUpdateCoordinator
+
+
+class VoyahEntity(CoordinatorEntity[VoyahDataUpdateCoordinator]):
+    """Entity bound to one car; device info and ids come from the shared VoyahCar."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: VoyahDataUpdateCoordinator, unique_id_suffix: str) -> None:
+        super().__init__(coordinator)
+        car = coordinator.car
+        self._attr_unique_id = car.unique_id(unique_id_suffix)
+        self._attr_device_info = car.device_info
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the entity's own attributes, plus last_data while stale data is served."""
+        attributes = self._extra_attributes()
+        if self.coordinator.last_data is None:
+            return attributes
+        return {**(attributes or {}), "last_data": self.coordinator.last_data}
+
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Entity-specific state attributes."""
+        return None
+
+    @property
+    def _status(self) -> tuple[bool, datetime | None]:
+        """Availability and stale-data time; filtered entities write whenever either changes."""
+        return self.available, self.coordinator.last_data
+
+    @property
+    def sensors_data(self) -> dict[str, Any]:
+        """The sensorsData part of the latest snapshot."""
+        return self.coordinator.data.get("sensors_data") or {}
+
+    @property
+    def position_data(self) -> dict[str, Any]:
+        """The positionData part of the latest snapshot."""
+        return self.coordinator.data.get("position_data") or {}
@@ -0,0 +1,301 @@
+"""Fleet-wide state shared by all Voyah config entries."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+import heapq
+import math
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN, OPENING_KEYS
+from .gps import haversine_m
+
+DATA_FLEET_INDEX = f"{DOMAIN}_fleet_index"
+DATA_FLEET_AGGREGATES = f"{DOMAIN}_fleet_aggregates"
+
+# Grid cell size in degrees (~11 km of latitude).
+FLEET_CELL_DEG = 0.1
+METERS_PER_DEG = 111_195.0
+# Cells around the globe in longitude; cell columns wrap at ±180°.
+LON_CELLS = round(360 / FLEET_CELL_DEG)
+# Rings walked before falling back to a scan of the whole fleet (~220 km).
+MAX_RINGS = 20
+
+
+@dataclass(slots=True)
+class FleetCar:
+    """Latest position and filterable state of one car."""
+
+    car_id: str
+    name: str
+    lat: float
+    lon: float
+    battery: float | None
+    charging: bool | None
+    ignition: bool | None
+
+    def as_dict(self, distance: float) -> dict[str, Any]:
+        """Serializable form for service responses."""
+        return {
+            "car_id": self.car_id,
+            "name": self.name,
+            "latitude": self.lat,
+            "longitude": self.lon,
+            "distance": round(distance),
+            "battery": self.battery,
+            "charging": self.charging,
+            "ignition": self.ignition,
+        }
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / FLEET_CELL_DEG), _wrap_lon_cell(math.floor(lon / FLEET_CELL_DEG))
+
+
+def _wrap_lon_cell(cell_lon: int) -> int:
+    return (cell_lon + LON_CELLS // 2) % LON_CELLS - LON_CELLS // 2
+
+
+class FleetIndex:
+    """Uniform grid over the latest car positions with k-nearest search.
+
+    Updates move a car between cells in O(1). A query walks square rings of
+    cells outwards from the query point and stops once the k-th best distance
+    is closer than anything an unvisited ring could contain. Rings grow
+    quadratically, so past MAX_RINGS the query scans the whole fleet instead,
+    which keeps far-apart cars (Moscow and Vladivostok) cheap.
+    """
+
+    def __init__(self) -> None:
+        self.cars: dict[str, FleetCar] = {}
+        self._cells: dict[str, tuple[int, int]] = {}
+        self._grid: dict[tuple[int, int], set[str]] = {}
+
+    def update(self, car: FleetCar) -> None:
+        """Insert or move a car."""
+        cell = _cell(car.lat, car.lon)
+        old_cell = self._cells.get(car.car_id)
+        self.cars[car.car_id] = car
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            self._unindex(old_cell, car.car_id)
+        self._cells[car.car_id] = cell
+        self._grid.setdefault(cell, set()).add(car.car_id)
+
+    def remove(self, car_id: str) -> None:
+        """Forget a car, e.g. when its entry unloads."""
+        self.cars.pop(car_id, None)
+        if (cell := self._cells.pop(car_id, None)) is not None:
+            self._unindex(cell, car_id)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        count: int = 1,
+        predicate: Callable[[FleetCar], bool] | None = None,
+    ) -> list[tuple[float, FleetCar]]:
+        """Return up to count (distance, car) pairs matching predicate, nearest first."""
+        best: list[tuple[float, str]] = []  # max-heap via negated distances
+        seen = 0
+        for ring in range(MAX_RINGS + 1):
+            # Every car in ring r or beyond is at least (r - 1) cells away.
+            if seen >= len(self.cars) or (len(best) == count and -best[0][0] <= self._ring_bound(lat, ring)):
+                break
+            for cell in self._ring_cells(lat, lon, ring):
+                for car_id in self._grid.get(cell, ()):
+                    seen += 1
+                    car = self.cars[car_id]
+                    if predicate is not None and not predicate(car):
+                        continue
+                    distance = haversine_m(lat, lon, car.lat, car.lon)
+                    if len(best) < count:
+                        heapq.heappush(best, (-distance, car_id))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, car_id))
+        else:
+            return self._scan(lat, lon, count, predicate)
+        return [(-neg, self.cars[car_id]) for neg, car_id in sorted(best, reverse=True)]
+
+    def _scan(
+        self, lat: float, lon: float, count: int, predicate: Callable[[FleetCar], bool] | None
+    ) -> list[tuple[float, FleetCar]]:
+        """Nearest cars by distance over the whole fleet."""
+        return heapq.nsmallest(
+            count,
+            (
+                (haversine_m(lat, lon, car.lat, car.lon), car)
+                for car in self.cars.values()
+                if predicate is None or predicate(car)
+            ),
+            key=lambda pair: pair[0],
+        )
+
+    @staticmethod
+    def _ring_bound(lat: float, ring: int) -> float:
+        if ring <= 1:
+            return 0.0
+        edge_lat = min(abs(lat) + ring * FLEET_CELL_DEG, 89.0)
+        return (ring - 1) * FLEET_CELL_DEG * METERS_PER_DEG * math.cos(math.radians(edge_lat))
+
+    @staticmethod
+    def _ring_cells(lat: float, lon: float, ring: int) -> Iterator[tuple[int, int]]:
+        cell_lat, cell_lon = _cell(lat, lon)
+        if ring == 0:
+            yield cell_lat, cell_lon
+            return
+        for dlon in range(-ring, ring + 1):
+            yield cell_lat - ring, _wrap_lon_cell(cell_lon + dlon)
+            yield cell_lat + ring, _wrap_lon_cell(cell_lon + dlon)
+        for dlat in range(-ring + 1, ring):
+            yield cell_lat + dlat, _wrap_lon_cell(cell_lon - ring)
+            yield cell_lat + dlat, _wrap_lon_cell(cell_lon + ring)
+
+    def _unindex(self, cell: tuple[int, int], car_id: str) -> None:
+        members = self._grid[cell]
+        members.discard(car_id)
+        if not members:
+            del self._grid[cell]
+
+
+# Bits of the packed openings mask that are doors; the trunk and hatch do not count.
+DOOR_BITS = sum(1 << index for index, key in enumerate(OPENING_KEYS) if key.startswith("door"))
+
+
+@dataclass(slots=True, frozen=True)
+class FleetContribution:
+    """What one car adds to the fleet totals."""
+
+    charging: bool = False
+    doors_open: bool = False
+    battery: float | None = None
+    odometer: float | None = None
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> FleetContribution:
+        """Extract the contribution from a coordinator snapshot."""
+        sensors = data.get("sensors_data") or {}
+        return cls(
+            charging=bool(sensors.get("chargingStatus")),
+            doors_open=bool((data.get("openings") or 0) & DOOR_BITS),
+            battery=sensors.get("batteryPercentage"),
+            odometer=sensors.get("odometer"),
+        )
+
+
+class FleetAggregates:
+    """Fleet totals maintained from per-car deltas.
+
+    Each refresh replaces one car's contribution: its old values are
+    subtracted and the new ones added, so an update costs O(1) regardless of
+    fleet size. Listeners are only called when a total actually changes.
+
+    The fleet sensors live on one config entry, the owner. Every loaded entry
+    offers to carry them; when the owner unloads, the next one takes over.
+    """
+
+    def __init__(self) -> None:
+        self.owner_entry_id: str | None = None
+        self._candidates: dict[str, CALLBACK_TYPE] = {}
+        self._contributions: dict[str, FleetContribution] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        self.charging = 0
+        self.doors_open = 0
+        self._battery_sum = 0.0
+        self._battery_count = 0
+        self._odometer_sum = 0.0
+
+    @property
+    def cars(self) -> int:
+        """Number of cars reporting."""
+        return len(self._contributions)
+
+    @property
+    def average_battery(self) -> float | None:
+        """Mean state of charge over cars reporting one."""
+        if not self._battery_count:
+            return None
+        return round(self._battery_sum / self._battery_count, 1)
+
+    @property
+    def total_odometer(self) -> float | None:
+        """Sum of odometers over cars reporting one."""
+        if not self._contributions:
+            return None
+        return round(self._odometer_sum, 1)
+
+    def update(self, car_id: str, contribution: FleetContribution) -> None:
+        """Replace a car's contribution."""
+        old = self._contributions.get(car_id)
+        if old == contribution:
+            return
+        if old is not None:
+            self._apply(old, -1)
+        self._contributions[car_id] = contribution
+        self._apply(contribution, 1)
+        self._notify()
+
+    def remove(self, car_id: str) -> None:
+        """Drop a car's contribution."""
+        if (old := self._contributions.pop(car_id, None)) is not None:
+            self._apply(old, -1)
+            self._notify()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for total changes; returns a function that removes the listener."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @callback
+    def async_offer_owner(self, entry_id: str, add_sensors: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Offer an entry as owner of the fleet sensors.
+
+        add_sensors is called once the entry becomes the owner, at once if
+        there is none. Returns a function that withdraws the offer and hands
+        ownership to another entry.
+        """
+        self._candidates[entry_id] = add_sensors
+        if self.owner_entry_id is None:
+            self._hand_over()
+        return lambda: self._withdraw(entry_id)
+
+    def _withdraw(self, entry_id: str) -> None:
+        self._candidates.pop(entry_id, None)
+        if self.owner_entry_id == entry_id:
+            self.owner_entry_id = None
+            self._hand_over()
+
+    def _hand_over(self) -> None:
+        if self._candidates:
+            self.owner_entry_id, add_sensors = next(iter(self._candidates.items()))
+            add_sensors()
+
+    def _apply(self, contribution: FleetContribution, sign: int) -> None:
+        self.charging += sign * contribution.charging
+        self.doors_open += sign * contribution.doors_open
+        if contribution.battery is not None:
+            self._battery_sum += sign * contribution.battery
+            self._battery_count += sign
+        if contribution.odometer is not None:
+            self._odometer_sum += sign * contribution.odometer
+
+    def _notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+@callback
+def async_get_fleet_aggregates(hass: HomeAssistant) -> FleetAggregates:
+    """Return the fleet aggregates shared by all entries, creating them on first use."""
+    return hass.data.setdefault(DATA_FLEET_AGGREGATES, FleetAggregates())
+
+
+@callback
+def async_get_fleet_index(hass: HomeAssistant) -> FleetIndex:
+    """Return the fleet index shared by all entries, creating it on first use."""
+    return hass.data.setdefault(DATA_FLEET_INDEX, FleetIndex())
@@ -0,0 +1,165 @@
+"""GPS helpers for the Voyah integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import pairwise
+import math
+
+EARTH_RADIUS_M = 6_371_008.8
+
+HDOP_TO_METERS = 5.0
+# Accuracy assumed for filtering when a fix comes without HDOP.
+DEFAULT_ACCURACY_M = 10.0
+# Fixes below this speed count as stationary.
+STATIONARY_SPEED_KMH = 3.0
+# Process noise added per update while stationary, in m².
+STATIONARY_PROCESS_NOISE_M2 = 1.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in metres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial great-circle bearing from the first point to the second, in degrees."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dlmb = math.radians(lon2 - lon1)
+    x = math.sin(dlmb) * math.cos(phi2)
+    y = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(dlmb)
+    return (math.degrees(math.atan2(x, y)) + 360) % 360
+
+
+def _motion(prev: tuple[float, float, float], cur: tuple[float, float, float]) -> tuple[float | None, float | None]:
+    """Speed (km/h) and bearing between two (lat, lon, time) fixes."""
+    dt = cur[2] - prev[2]
+    if dt <= 0:
+        return None, None
+    distance = haversine_m(prev[0], prev[1], cur[0], cur[1])
+    bearing = initial_bearing(prev[0], prev[1], cur[0], cur[1]) if distance > 0 else None
+    return round(distance / dt * 3.6, 1), None if bearing is None else round(bearing)
+
+
+def derive_motion(fixes: Iterable[tuple[float, float, float]]) -> list[tuple[float | None, float | None]]:
+    """Derive speed and bearing for every fix of a history in one pass.
+
+    The first fix has no predecessor and gets (None, None). Intended for
+    backfilling history; use MotionEstimator for one fix per poll.
+    """
+    fixes = list(fixes)
+    if not fixes:
+        return []
+    return [(None, None)] + [_motion(prev, cur) for prev, cur in pairwise(fixes)]
+
+
+class MotionEstimator:
+    """Derive speed and bearing from consecutive fixes in O(1) per poll."""
+
+    def __init__(self) -> None:
+        self._last_fix: tuple[float, float, float] | None = None
+        self._last_motion: tuple[float | None, float | None] = (None, None)
+
+    def update(self, lat: float, lon: float, timestamp: float) -> tuple[float | None, float | None]:
+        """Return (speed km/h, bearing degrees) for the new fix."""
+        fix = (lat, lon, timestamp)
+        last = self._last_fix
+        if last is not None and timestamp <= last[2]:
+            # Same report as last poll: the car has not sent anything new.
+            return self._last_motion
+        self._last_fix = fix
+        if last is None:
+            return self._last_motion
+        speed, bearing = _motion(last, fix)
+        if bearing is None:
+            bearing = self._last_motion[1]
+        self._last_motion = (speed, bearing)
+        return self._last_motion
+
+
+def hdop_to_accuracy(hdop: float | None) -> float | None:
+    """Convert HDOP into an approximate horizontal accuracy in metres."""
+    if hdop is None:
+        return None
+    return hdop * HDOP_TO_METERS
+
+
+@dataclass(slots=True)
+class FilteredPosition:
+    """Position reported to Home Assistant after filtering."""
+
+    lat: float
+    lon: float
+    accuracy: float | None
+
+
+class PositionFilter:
+    """Suppress sub-accuracy GPS jitter while parked.
+
+    While the car is stationary the reported position is locked. Incoming fixes
+    refine a scalar Kalman estimate of the true position, weighted by their
+    HDOP-derived accuracy, and the lock only moves when that estimate leaves
+    the accuracy radius. A fix that is moving (speed above
+    STATIONARY_SPEED_KMH) or lies outside the combined accuracy radius is
+    treated as real motion and passed through immediately.
+    """
+
+    def __init__(self) -> None:
+        self._output: FilteredPosition | None = None
+        self._est_lat = 0.0
+        self._est_lon = 0.0
+        self._variance = 0.0
+
+    @property
+    def position(self) -> FilteredPosition | None:
+        """Last filtered position."""
+        return self._output
+
+    def update(
+        self,
+        lat: float | None,
+        lon: float | None,
+        accuracy: float | None,
+        speed: float | None,
+    ) -> FilteredPosition | None:
+        """Feed one fix and return the position to report."""
+        if lat is None or lon is None:
+            return self._output
+
+        radius = accuracy or DEFAULT_ACCURACY_M
+        output = self._output
+        moving = speed is not None and speed > STATIONARY_SPEED_KMH
+        if output is None or moving:
+            return self._reset(lat, lon, accuracy)
+
+        lock_radius = max(radius, output.accuracy or DEFAULT_ACCURACY_M)
+        if haversine_m(output.lat, output.lon, lat, lon) > lock_radius:
+            return self._reset(lat, lon, accuracy)
+
+        # Stationary jitter: refine the estimate, keep reporting the lock.
+        measurement_variance = radius * radius
+        self._variance += STATIONARY_PROCESS_NOISE_M2
+        gain = self._variance / (self._variance + measurement_variance)
+        self._est_lat += gain * (lat - self._est_lat)
+        self._est_lon += gain * (lon - self._est_lon)
+        self._variance *= 1 - gain
+
+        # Re-lock once the smoothed estimate shows the lock itself came from an outlier fix.
+        if haversine_m(output.lat, output.lon, self._est_lat, self._est_lon) > lock_radius / 2:
+            self._output = FilteredPosition(self._est_lat, self._est_lon, output.accuracy)
+        return self._output
+
+    def _reset(self, lat: float, lon: float, accuracy: float | None) -> FilteredPosition:
+        radius = accuracy or DEFAULT_ACCURACY_M
+        self._est_lat = lat
+        self._est_lon = lon
+        self._variance = radius * radius
+        self._output = FilteredPosition(lat, lon, accuracy)
+        return self._output
@@ -0,0 +1,148 @@
+"""Offline reverse geocoding against a local GeoJSON place file."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+import json
+import logging
+import math
+from typing import Any
+
+from .gps import EARTH_RADIUS_M, haversine_m
+
+_LOGGER = logging.getLogger(__name__)
+
+# Grid cell size in degrees (~1.1 km of latitude).
+GRID_CELL_DEG = 0.01
+# Radius given to Point features that do not carry a "radius" property, in metres.
+DEFAULT_POINT_RADIUS_M = 100.0
+
+Ring = list[tuple[float, float]]
+
+
+@dataclass(slots=True, frozen=True)
+class Place:
+    """A named area: polygons (lon/lat rings) or a point with a radius."""
+
+    name: str
+    polygons: tuple[tuple[Ring, ...], ...]
+    center: tuple[float, float] | None
+    radius: float
+    area: float
+
+    def contains(self, lat: float, lon: float) -> bool:
+        """Return whether the coordinate lies within the place."""
+        if self.center is not None:
+            return haversine_m(self.center[0], self.center[1], lat, lon) <= self.radius
+        return any(_polygon_contains(polygon, lon, lat) for polygon in self.polygons)
+
+
+def _ring_contains(ring: Ring, x: float, y: float) -> bool:
+    inside = False
+    j = len(ring) - 1
+    for i, (xi, yi) in enumerate(ring):
+        xj, yj = ring[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _polygon_contains(polygon: tuple[Ring, ...], x: float, y: float) -> bool:
+    """Outer ring minus holes."""
+    if not _ring_contains(polygon[0], x, y):
+        return False
+    return not any(_ring_contains(hole, x, y) for hole in polygon[1:])
+
+
+def _ring_area(ring: Ring) -> float:
+    return abs(sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1], strict=True))) / 2
+
+
+def _cell(value: float) -> int:
+    return math.floor(value / GRID_CELL_DEG)
+
+
+class PlaceIndex:
+    """Uniform grid over place bounding boxes for microsecond lookups.
+
+    Each place is registered in every grid cell its bounding box touches, so a
+    lookup only tests the handful of places registered in one cell. When
+    places overlap, the smallest one wins (a depot inside a city polygon).
+    """
+
+    def __init__(self, places: list[Place]) -> None:
+        self._grid: dict[tuple[int, int], list[Place]] = defaultdict(list)
+        for place in sorted(places, key=lambda place: place.area):
+            min_lat, min_lon, max_lat, max_lon = _bbox(place)
+            for cell_lat in range(_cell(min_lat), _cell(max_lat) + 1):
+                for cell_lon in range(_cell(min_lon), _cell(max_lon) + 1):
+                    self._grid[(cell_lat, cell_lon)].append(place)
+        self._grid = dict(self._grid)
+        self.size = len(places)
+
+    def lookup(self, lat: float, lon: float) -> str | None:
+        """Return the name of the smallest place containing the coordinate."""
+        for place in self._grid.get((_cell(lat), _cell(lon)), ()):
+            if place.contains(lat, lon):
+                return place.name
+        return None
+
+
+def _bbox(place: Place) -> tuple[float, float, float, float]:
+    if place.center is not None:
+        lat, lon = place.center
+        dlat = math.degrees(place.radius / EARTH_RADIUS_M)
+        dlon = dlat / max(math.cos(math.radians(lat)), 1e-6)
+        return lat - dlat, lon - dlon, lat + dlat, lon + dlon
+    lons = [x for polygon in place.polygons for x, _ in polygon[0]]
+    lats = [y for polygon in place.polygons for _, y in polygon[0]]
+    return min(lats), min(lons), max(lats), max(lons)
+
+
+def _parse_feature(feature: dict[str, Any]) -> Place | None:
+    properties = feature.get("properties") or {}
+    geometry = feature.get("geometry") or {}
+    name = properties.get("name")
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+    if not name or not coordinates:
+        return None
+
+    if kind == "Point":
+        radius = float(properties.get("radius", DEFAULT_POINT_RADIUS_M))
+        lon, lat = coordinates[:2]
+        return Place(str(name), (), (lat, lon), radius, math.pi * radius * radius)
+
+    if kind == "Polygon":
+        raw_polygons = [coordinates]
+    elif kind == "MultiPolygon":
+        raw_polygons = coordinates
+    else:
+        return None
+
+    polygons = tuple(tuple([(x, y) for x, y, *_ in ring] for ring in polygon) for polygon in raw_polygons)
+    if not polygons or any(not polygon or len(polygon[0]) < 3 for polygon in polygons):
+        raise ValueError("polygon without an outer ring")
+    area = sum(_ring_area(polygon[0]) for polygon in polygons) * (111_195**2)
+    return Place(str(name), polygons, None, 0.0, area)
+
+
+def load_place_index(path: str) -> PlaceIndex:
+    """Read a GeoJSON FeatureCollection into a PlaceIndex. Runs in the executor."""
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+
+    features = document.get("features", []) if document.get("type") == "FeatureCollection" else [document]
+    places: list[Place] = []
+    for number, feature in enumerate(features):
+        try:
+            place = _parse_feature(feature)
+        except (AttributeError, TypeError, KeyError, ValueError) as err:
+            _LOGGER.warning("Skipping malformed feature %d in %s: %s", number, path, err)
+            continue
+        if place is not None:
+            places.append(place)
+    _LOGGER.debug("Loaded %d places from %s", len(places), path)
+    return PlaceIndex(places)
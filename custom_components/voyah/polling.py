@@ -0,0 +1,220 @@
+"""Polling policy for the Voyah integration."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_CARS,
+    CONF_RATE_BUDGET,
+    CONF_SCAN_INTERVAL,
+    CONF_SCHEDULES,
+    DEFAULT_RATE_BUDGET,
+    DEFAULT_SCAN_INTERVAL,
+)
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+MIN_SCHEDULE_INTERVAL = 10
+# A car that has not pinged the server for this long, in seconds, may be asleep.
+SLEEP_PING_THRESHOLD = 600
+MAX_BACKOFF_LEVEL = 6
+# Backoff never stretches a parked car's interval beyond this, in seconds.
+MAX_BACKOFF_INTERVAL = 3600
+
+
+def _parse_cron_field(spec: str, low: int, high: int) -> set[int]:
+    """Expand one cron field ("*", "5", "1-5", "*/15", "0-30/10", comma lists)."""
+    values: set[int] = set()
+    for part in spec.split(","):
+        value_range, _, step_spec = part.partition("/")
+        step = int(step_spec) if step_spec else 1
+        if value_range == "*":
+            start, end = low, high
+        else:
+            start_spec, _, end_spec = value_range.partition("-")
+            start = int(start_spec)
+            end = int(end_spec) if end_spec else (high if step_spec else start)
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"invalid cron field {spec!r}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def _cron_minutes(cron: str) -> list[int]:
+    """Minutes of the week (Monday 00:00 = 0) matched by a cron expression.
+
+    Day of month and month must be "*": a weekly table cannot express them.
+    Day of week follows cron, with 0 and 7 both meaning Sunday.
+    """
+    fields = cron.split()
+    if len(fields) != 5 or fields[2] != "*" or fields[3] != "*":
+        raise ValueError(f"expected 'minute hour * * weekday', got {cron!r}")
+    minutes = _parse_cron_field(fields[0], 0, 59)
+    hours = _parse_cron_field(fields[1], 0, 23)
+    weekdays = {(day - 1) % 7 for day in _parse_cron_field(fields[4], 0, 7)}
+    return [
+        weekday * MINUTES_PER_DAY + hour * 60 + minute for weekday in weekdays for hour in hours for minute in minutes
+    ]
+
+
+@dataclass(slots=True, frozen=True)
+class PollingSchedule:
+    """Time-of-day polling windows compiled into per-minute weekly tables.
+
+    Each window is a cron expression mapped to an interval; the first window
+    matching a minute wins. Compiling fills one slot per minute of the week
+    with the interval in force and the minutes until it next changes, so a
+    lookup is two array reads regardless of how many windows there are.
+    """
+
+    windows: tuple[tuple[str, int], ...]
+    _intervals: array = field(init=False, compare=False, repr=False)
+    _minutes_to_change: array = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        intervals = array("I", bytes(4 * MINUTES_PER_WEEK))  # 0: no window
+        for cron, interval in reversed(self.windows):
+            for minute in _cron_minutes(cron):
+                intervals[minute] = interval
+
+        to_change = array("H", bytes(2 * MINUTES_PER_WEEK))  # 0: never changes
+        if len(set(intervals)) > 1:
+            # Walk the week backwards from a minute just before a change, wrapping past Sunday.
+            start = next(
+                minute
+                for minute in range(MINUTES_PER_WEEK)
+                if intervals[minute] != intervals[(minute + 1) % MINUTES_PER_WEEK]
+            )
+            for step in range(MINUTES_PER_WEEK):
+                minute = (start - step) % MINUTES_PER_WEEK
+                following = (minute + 1) % MINUTES_PER_WEEK
+                same = intervals[minute] == intervals[following]
+                to_change[minute] = to_change[following] + 1 if same else 1
+        object.__setattr__(self, "_intervals", intervals)
+        object.__setattr__(self, "_minutes_to_change", to_change)
+
+    @classmethod
+    def from_options(cls, windows: list[dict[str, Any]]) -> PollingSchedule:
+        """Build from option dicts with "cron" and "interval" keys; raises ValueError."""
+        try:
+            parsed = tuple((str(window["cron"]), int(window["interval"])) for window in windows)
+        except (KeyError, TypeError) as err:
+            raise ValueError(f"invalid schedule window: {err}") from err
+        if any(interval < MIN_SCHEDULE_INTERVAL for _, interval in parsed):
+            raise ValueError(f"schedule intervals must be at least {MIN_SCHEDULE_INTERVAL} s")
+        return cls(parsed)
+
+    def lookup(self, now: datetime) -> tuple[int | None, float | None, int | None]:
+        """Return the interval at now, seconds until it changes, and the interval after that."""
+        minute = now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+        interval = self._intervals[minute] or None
+        minutes_to_change = self._minutes_to_change[minute]
+        if not minutes_to_change:
+            return interval, None, None
+        seconds = minutes_to_change * 60 - now.second - now.microsecond / 1_000_000
+        upcoming = self._intervals[(minute + minutes_to_change) % MINUTES_PER_WEEK] or None
+        return interval, seconds, upcoming
+
+
+def _is_active(data: dict[str, Any] | None) -> bool:
+    sensors = (data or {}).get("sensors_data") or {}
+    return bool(sensors.get("ignitionStatus") or sensors.get("chargingStatus"))
+
+
+class SleepBackoff:
+    """Tracks whether a car's telematics unit is asleep from its last_ping.
+
+    While the unit is asleep the server keeps returning the same snapshot and
+    last_ping only grows. Each poll that sees it grow past
+    SLEEP_PING_THRESHOLD raises the backoff level by one, up to
+    MAX_BACKOFF_LEVEL; a smaller last_ping (the car pinged again) or a car
+    that is driving or charging drops it back to zero.
+    """
+
+    def __init__(self) -> None:
+        self.level = 0
+        self._last_ping: float | None = None
+
+    def update(self, data: dict[str, Any]) -> int:
+        """Feed one snapshot and return the new backoff level."""
+        last_ping = data.get("last_ping")
+        previous, self._last_ping = self._last_ping, last_ping
+        if last_ping is None or _is_active(data):
+            self.level = 0
+        elif previous is not None and last_ping > previous and last_ping >= SLEEP_PING_THRESHOLD:
+            self.level = min(self.level + 1, MAX_BACKOFF_LEVEL)
+        elif previous is None or last_ping < previous:
+            self.level = 0
+        return self.level
+
+
+@dataclass(slots=True, frozen=True)
+class PollingPolicy:
+    """How often one car is polled.
+
+    A car that is driving or charging is polled every ``active_interval``
+    seconds, otherwise every ``interval``, or the interval of the schedule
+    window in force. A parked car's poll is brought forward to the start of
+    a window that polls more often. A non-zero ``rate_budget`` caps the
+    requests per hour of the whole entry: its cars share the budget, so each
+    car's interval is stretched to at least ``3600 * cars / rate_budget``.
+    A sleeping car's parked interval doubles with each backoff level, up to
+    MAX_BACKOFF_INTERVAL.
+    """
+
+    interval: int = DEFAULT_SCAN_INTERVAL
+    active_interval: int = DEFAULT_SCAN_INTERVAL
+    rate_budget: int = DEFAULT_RATE_BUDGET
+    cars: int = 1
+    schedule: PollingSchedule | None = None
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> PollingPolicy:
+        """Build the policy from entry options, falling back to the entry data."""
+        interval = entry.options.get(CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        schedules = entry.options.get(CONF_SCHEDULES)
+        return cls(
+            interval=interval,
+            active_interval=entry.options.get(CONF_ACTIVE_SCAN_INTERVAL, interval),
+            rate_budget=entry.options.get(CONF_RATE_BUDGET, DEFAULT_RATE_BUDGET),
+            cars=len(entry.data.get(CONF_CARS) or (None,)),
+            schedule=PollingSchedule.from_options(schedules) if schedules else None,
+        )
+
+    def interval_for(
+        self,
+        data: dict[str, Any] | None,
+        boost: int | None = None,
+        now: datetime | None = None,
+        backoff: int = 0,
+    ) -> timedelta:
+        """Return the delay before the next poll after a snapshot.
+
+        A boost interval shortens the delay but stays within the rate budget.
+        """
+        if _is_active(data):
+            seconds: float = self.active_interval
+        else:
+            seconds = self.interval
+            until_change = upcoming = None
+            if self.schedule is not None:
+                scheduled, until_change, upcoming = self.schedule.lookup(now or dt_util.now())
+                seconds = scheduled or self.interval
+            if backoff:
+                seconds = min(seconds * 2**backoff, max(seconds, MAX_BACKOFF_INTERVAL))
+            if until_change is not None and (upcoming or self.interval) < seconds:
+                seconds = min(seconds, math.ceil(until_change))
+        if boost is not None:
+            seconds = min(seconds, boost)
+        if self.rate_budget:
+            seconds = max(seconds, math.ceil(3600 * self.cars / self.rate_budget))
+        return timedelta(seconds=seconds)
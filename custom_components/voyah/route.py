@@ -0,0 +1,306 @@
+"""Route trace recording, compression and export for the Voyah integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+import itertools
+import json
+import logging
+import math
+import os
+import re
+from typing import Any
+from xml.sax.saxutils import escape
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .gps import EARTH_RADIUS_M
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+MAX_STORED_ROUTES = 500
+# Exports kept per car in <config>/voyah/exports; older ones are deleted on each export.
+MAX_EXPORT_FILES = 10
+# Maximum distance, in metres, between a dropped fix and the simplified track.
+ROUTE_EPSILON_M = 10.0
+# Raw fixes buffered before the simplifier runs; bounds memory while driving.
+ROUTE_BUFFER_POINTS = 120
+COORD_PRECISION = 1e5
+
+Point = tuple[float, float, int]
+
+
+def _encode_value(value: int, out: list[str]) -> None:
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        out.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    out.append(chr(value + 63))
+
+
+def encode_polyline(points: list[Point]) -> str:
+    """Encode (lat, lon, time) points as a delta polyline string.
+
+    Uses the Google encoded-polyline scheme with a third dimension for the
+    timestamp in seconds, so a typical fix costs a handful of ASCII bytes.
+    """
+    out: list[str] = []
+    prev = (0, 0, 0)
+    for lat, lon, timestamp in points:
+        cur = (round(lat * COORD_PRECISION), round(lon * COORD_PRECISION), int(timestamp))
+        for value, last in zip(cur, prev, strict=True):
+            _encode_value(value - last, out)
+        prev = cur
+    return "".join(out)
+
+
+def decode_polyline(encoded: str) -> Iterator[Point]:
+    """Lazily decode a string produced by encode_polyline."""
+    index = 0
+    current = [0, 0, 0]
+    length = len(encoded)
+    while index < length:
+        for dim in range(3):
+            shift = 0
+            result = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            current[dim] += ~(result >> 1) if result & 1 else result >> 1
+        yield current[0] / COORD_PRECISION, current[1] / COORD_PRECISION, current[2]
+
+
+def _offset_m(origin: Point, point: Point) -> tuple[float, float]:
+    """Local equirectangular projection of point around origin, in metres."""
+    x = math.radians(point[1] - origin[1]) * math.cos(math.radians(origin[0])) * EARTH_RADIUS_M
+    y = math.radians(point[0] - origin[0]) * EARTH_RADIUS_M
+    return x, y
+
+
+def _segment_distance_m(point: Point, start: Point, end: Point) -> float:
+    px, py = _offset_m(start, point)
+    ex, ey = _offset_m(start, end)
+    length_sq = ex * ex + ey * ey
+    if length_sq == 0:
+        return math.hypot(px, py)
+    t = max(0.0, min(1.0, (px * ex + py * ey) / length_sq))
+    return math.hypot(px - t * ex, py - t * ey)
+
+
+def douglas_peucker(points: list[Point], epsilon: float) -> list[Point]:
+    """Simplify a polyline so that no dropped point is farther than epsilon metres."""
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_distance = 0.0
+        index = first
+        for i in range(first + 1, last):
+            distance = _segment_distance_m(points[i], points[first], points[last])
+            if distance > max_distance:
+                max_distance = distance
+                index = i
+        if max_distance > epsilon:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep, strict=True) if kept]
+
+
+class RouteSimplifier:
+    """Apply Douglas–Peucker online over bounded chunks of incoming fixes."""
+
+    def __init__(self, epsilon: float = ROUTE_EPSILON_M, buffer_points: int = ROUTE_BUFFER_POINTS) -> None:
+        self._epsilon = epsilon
+        self._buffer_points = buffer_points
+        self.points: list[Point] = []
+        self._buffer: list[Point] = []
+
+    def add(self, point: Point) -> None:
+        """Add one fix, simplifying the buffered chunk once it is full."""
+        if self._buffer and self._buffer[-1][:2] == point[:2]:
+            return
+        self._buffer.append(point)
+        if len(self._buffer) >= self._buffer_points:
+            self._flush()
+
+    def finish(self) -> list[Point]:
+        """Simplify what is left and return the whole simplified track."""
+        self._flush()
+        return self.points
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        simplified = douglas_peucker(self._buffer, self._epsilon)
+        # The first point of a chunk is the last point of the previous one.
+        self.points.extend(simplified[1:] if self.points else simplified)
+        self._buffer = [self._buffer[-1]]
+
+    @property
+    def raw_buffered(self) -> int:
+        """Number of fixes waiting for the next simplification pass."""
+        return len(self._buffer)
+
+    def to_row(self) -> list[str]:
+        """Return the simplified points and the pending buffer as encoded polylines."""
+        return [encode_polyline(self.points), encode_polyline(self._buffer)]
+
+    @classmethod
+    def from_row(cls, row: list[str]) -> RouteSimplifier:
+        """Rebuild a simplifier saved with to_row."""
+        simplifier = cls()
+        simplifier.points = list(decode_polyline(row[0]))
+        simplifier._buffer = list(decode_polyline(row[1]))
+        return simplifier
+
+
+@dataclass(slots=True, frozen=True)
+class RouteTrack:
+    """A stored, encoded trip track."""
+
+    start_time: int
+    end_time: int
+    encoded: str
+
+    def points(self) -> Iterator[Point]:
+        """Lazily decode the track points."""
+        return decode_polyline(self.encoded)
+
+
+class VoyahRouteLog:
+    """Record per-trip polylines for one car, fed by the coordinator."""
+
+    def __init__(self, hass: HomeAssistant, car_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{car_id}.routes")
+        self.tracks: list[RouteTrack] = []
+        self._current: RouteSimplifier | None = None
+
+    async def async_load(self) -> None:
+        """Load stored tracks and the in-progress track."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self.tracks = [RouteTrack(*row) for row in stored.get("tracks", [])]
+        if active := stored.get("active"):
+            self._current = RouteSimplifier.from_row(active)
+
+    def process(self, data: dict[str, Any], now: float) -> RouteTrack | None:
+        """Append the snapshot's fix to the active track; close it on ignition off."""
+        sensors = data.get("sensors_data") or {}
+        position = data.get("position_data") or {}
+        ignition = sensors.get("ignitionStatus")
+        lat = position.get("lat")
+        lon = position.get("lon")
+        timestamp = int(data.get("time") or now)
+
+        if ignition and self._current is None:
+            self._current = RouteSimplifier()
+        if self._current is not None and lat is not None and lon is not None:
+            self._current.add((lat, lon, timestamp))
+        if self._current is None:
+            return None
+        # Saved while driving too, so a restart mid-trip keeps the track so far.
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        if ignition or ignition is None:
+            return None
+
+        points = self._current.finish()
+        self._current = None
+        if len(points) < 2:
+            return None
+
+        track = RouteTrack(points[0][2], points[-1][2], encode_polyline(points))
+        self.tracks.append(track)
+        if len(self.tracks) > MAX_STORED_ROUTES:
+            del self.tracks[: len(self.tracks) - MAX_STORED_ROUTES]
+        _LOGGER.debug("Route recorded: %d points, %d bytes", len(points), len(track.encoded))
+        return track
+
+    def query(self, start: float | None, end: float | None) -> list[RouteTrack]:
+        """Return tracks overlapping [start, end]."""
+        return [
+            track
+            for track in self.tracks
+            if (start is None or track.end_time >= start) and (end is None or track.start_time <= end)
+        ]
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "tracks": [[track.start_time, track.end_time, track.encoded] for track in self.tracks],
+            "active": self._current.to_row() if self._current is not None else None,
+        }
+
+
+def _iso(timestamp: int) -> str:
+    return dt_util.utc_from_timestamp(timestamp).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def iter_gpx(tracks: list[RouteTrack], name: str) -> Iterator[str]:
+    """Yield a GPX document chunk by chunk."""
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<gpx version="1.1" creator="Home Assistant Voyah" xmlns="http://www.topografix.com/GPX/1/1">\n'
+    for track in tracks:
+        yield f"<trk><name>{escape(name)} {_iso(track.start_time)}</name><trkseg>\n"
+        for lat, lon, timestamp in track.points():
+            yield f'<trkpt lat="{lat:.5f}" lon="{lon:.5f}"><time>{_iso(timestamp)}</time></trkpt>\n'
+        yield "</trkseg></trk>\n"
+    yield "</gpx>\n"
+
+
+def iter_geojson(tracks: list[RouteTrack], name: str) -> Iterator[str]:
+    """Yield a GeoJSON FeatureCollection chunk by chunk."""
+    yield '{"type":"FeatureCollection","features":['
+    for index, track in enumerate(tracks):
+        properties = json.dumps({"name": name, "start_time": _iso(track.start_time), "end_time": _iso(track.end_time)})
+        yield f'{"," if index else ""}{{"type":"Feature","properties":{properties},'
+        yield '"geometry":{"type":"LineString","coordinates":['
+        for point_index, (lat, lon, _timestamp) in enumerate(track.points()):
+            yield f"{',' if point_index else ''}[{lon:.5f},{lat:.5f}]"
+        yield "]}}"
+    yield "]}\n"
+
+
+def write_export(path: str, chunks: Iterator[str]) -> tuple[str, int]:
+    """Write chunks to a new file, returning its path and size in bytes. Runs in the executor.
+
+    An existing file is never overwritten: when path is taken, a "-<n>" suffix
+    is added before the extension.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    root, ext = os.path.splitext(path)
+    candidate = path
+    for attempt in itertools.count(1):
+        try:
+            file = open(candidate, "x", encoding="utf-8")
+            break
+        except FileExistsError:
+            candidate = f"{root}-{attempt}{ext}"
+    size = 0
+    with file:
+        for chunk in chunks:
+            size += file.write(chunk)
+    return candidate, size
+
+
+def prune_exports(directory: str, prefix: str, keep: int = MAX_EXPORT_FILES) -> None:
+    """Delete all but the newest keep "<prefix>_<timestamp>[-<n>].<format>" exports. Runs in the executor."""
+    pattern = re.compile(rf"{re.escape(prefix)}_(\d{{14}})(?:-(\d+))?\.\w+")
+    exports = sorted(
+        (match[1], int(match[2] or 0), name) for name in os.listdir(directory) if (match := pattern.fullmatch(name))
+    )
+    for *_, name in exports[: max(len(exports) - keep, 0)]:
+        os.remove(os.path.join(directory, name))
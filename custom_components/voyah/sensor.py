@@ -3,25 +3,49 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 import logging
+import time
+from typing import Any
 
+from homeassistant.components import zone
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTime
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import CONF_CAR_ID, CONF_CAR_NAME, DOMAIN, SENSOR_DESCRIPTIONS
+from homeassistant.helpers.event import async_call_later
+
+from .account import VoyahAccount
+from .const import (
+    BINARY_SENSOR_KEYS,
+    COMPOSITE_MEMBERS,
+    CONSUMPTION_SENSOR_DESCRIPTIONS,
+    DOMAIN,
+    FLEET_DEVICE_ID,
+    FLEET_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    STATISTICS_RESOLUTION,
+    TRIP_SENSOR_DESCRIPTIONS,
+)
 from .coordinator import VoyahDataUpdateCoordinator
+from .entity import VoyahEntity
+from .fleet import FleetAggregates, async_get_fleet_aggregates
 
 _LOGGER = logging.getLogger(__name__)
 
 TARGET_BATTERY_PCT = 100
 RATE_WINDOW_POINTS = 4  # 4 data points = 3% sliding window
 
+# sensorsData keys covered by a dedicated entity; any other key gets a generic diagnostic sensor.
+HANDLED_SENSOR_KEYS = frozenset(
+    [description.key for description in SENSOR_DESCRIPTIONS]
+    + list(BINARY_SENSOR_KEYS)
+    + [key for members in COMPOSITE_MEMBERS.values() for key in members]
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,81 +53,233 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Voyah sensor entities."""
-    coordinator: VoyahDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    account: VoyahAccount = hass.data[DOMAIN][entry.entry_id]
+
+    entities: list[SensorEntity] = []
+    for coordinator in account.coordinators.values():
+        entities.extend(_car_entities(entry, coordinator, async_add_entities))
+
+    _LOGGER.debug("Creating %d sensor entities", len(entities))
+    async_add_entities(entities)
+
+    # One loaded entry carries the integration-level fleet device; another
+    # takes it over when that entry unloads.
+    aggregates = async_get_fleet_aggregates(hass)
 
+    @callback
+    def _add_fleet_sensors() -> None:
+        async_add_entities(VoyahFleetSensor(aggregates, description) for description in FLEET_SENSOR_DESCRIPTIONS)
+
+    entry.async_on_unload(aggregates.async_offer_owner(entry.entry_id, _add_fleet_sensors))
+
+
+def _car_entities(
+    entry: ConfigEntry,
+    coordinator: VoyahDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> list[SensorEntity]:
+    """Create one car's sensors and add more as new keys appear."""
     _LOGGER.debug(
-        "Setting up sensors. coordinator.data type=%s, value=%s",
+        "Setting up sensors for %s. coordinator.data type=%s, value=%s",
+        coordinator.car_id,
         type(coordinator.data).__name__,
         coordinator.data,
     )
 
-    sensors_data = coordinator.data.get("sensors_data", {})
+    seen_keys: set[str] = set()
+
+    @callback
+    def _new_key_entities() -> list[SensorEntity]:
+        """Create entities for sensor keys not seen in earlier snapshots."""
+        new_keys = coordinator.data.get("sensors_data", {}).keys() - seen_keys
+        if not new_keys:
+            return []
+        seen_keys.update(new_keys)
+        new_entities: list[SensorEntity] = [
+            VoyahSensorEntity(coordinator, description)
+            for description in SENSOR_DESCRIPTIONS
+            if description.key in new_keys
+        ]
+        new_entities.extend(VoyahDiagnosticSensor(coordinator, key) for key in sorted(new_keys - HANDLED_SENSOR_KEYS))
+        return new_entities
+
+    def _has(*keys: str) -> Callable[[], bool]:
+        return lambda: all(key in coordinator.data.get("sensors_data", {}) for key in keys)
+
+    # Derived entity groups, each created once on the first snapshot that has what
+    # it needs; a car asleep at startup gets them when it wakes up.
+    pending_groups: dict[str, tuple[Callable[[], bool], Callable[[], list[SensorEntity]]]] = {
+        "charging_end_time": (
+            _has("batteryPercentage", "chargingStatus"),
+            lambda: [VoyahChargingEndTimeSensor(coordinator)],
+        ),
+        "charging_location": (_has("chargingStatus"), lambda: [VoyahChargingLocationSensor(coordinator)]),
+        "last_ping": (lambda: "last_ping" in coordinator.data, lambda: [VoyahLastPingSensor(coordinator)]),
+        "last_trip": (
+            _has("ignitionStatus", "odometer"),
+            lambda: [VoyahLastTripSensor(coordinator, description) for description in TRIP_SENSOR_DESCRIPTIONS],
+        ),
+        "consumption": (
+            _has("batteryPercentage", "odometer"),
+            lambda: [
+                VoyahConsumptionSensor(coordinator, description)
+                for description in CONSUMPTION_SENSOR_DESCRIPTIONS
+                if "kwh" not in description.key
+            ],
+        ),
+        # The kWh sensors also wait for a battery capacity, which may be set later in the options.
+        "consumption_kwh": (
+            lambda: bool(coordinator.consumption.battery_capacity) and _has("batteryPercentage", "odometer")(),
+            lambda: [
+                VoyahConsumptionSensor(coordinator, description)
+                for description in CONSUMPTION_SENSOR_DESCRIPTIONS
+                if "kwh" in description.key
+            ],
+        ),
+    }
 
-    entities: list[SensorEntity] = [
-        VoyahSensorEntity(coordinator, description, entry)
-        for description in SENSOR_DESCRIPTIONS
-        if description.key in sensors_data
-    ]
+    @callback
+    def _group_entities() -> list[SensorEntity]:
+        """Create the pending entity groups whose data is now available."""
+        new_entities: list[SensorEntity] = []
+        for name, (ready, create) in list(pending_groups.items()):
+            if ready():
+                del pending_groups[name]
+                new_entities.extend(create())
+        return new_entities
 
-    if "batteryPercentage" in sensors_data and "chargingStatus" in sensors_data:
-        entities.append(VoyahChargingEndTimeSensor(coordinator, entry))
+    @callback
+    def _async_on_coordinator_update() -> None:
+        if new_entities := _new_key_entities() + _group_entities():
+            _LOGGER.debug("Adding %d sensor entities for new keys", len(new_entities))
+            async_add_entities(new_entities)
 
-    if "last_ping" in coordinator.data:
-        entities.append(VoyahLastPingSensor(coordinator, entry))
+    entities = _new_key_entities() + _group_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_on_coordinator_update))
 
-    _LOGGER.debug("Creating %d sensor entities", len(entities))
-    async_add_entities(entities)
+    if coordinator.places is not None:
+        entities.append(VoyahPlaceSensor(coordinator))
 
+    return entities
 
-class VoyahSensorEntity(CoordinatorEntity[VoyahDataUpdateCoordinator], SensorEntity):
-    """Representation of a Voyah sensor."""
 
-    _attr_has_entity_name = True
+class VoyahSensorEntity(VoyahEntity, SensorEntity):
+    """Representation of a Voyah sensor."""
 
     def __init__(
         self,
         coordinator: VoyahDataUpdateCoordinator,
         description: SensorEntityDescription,
-        entry: ConfigEntry,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
-        car_id = entry.data.get(CONF_CAR_ID, entry.entry_id)
-        self._attr_unique_id = f"{car_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, car_id)},
-            name=entry.data.get(CONF_CAR_NAME, "Voyah"),
-            manufacturer="Voyah",
-        )
+        self._resolution: float | None = None
+        if coordinator.statistics is not None and description.key in STATISTICS_RESOLUTION:
+            # Fine-grained history goes to external statistics; keep the entity coarse.
+            self._resolution = STATISTICS_RESOLUTION[description.key]
+            self._attr_state_class = None
+
+        self._value = self._read_value()
+        self._status_written: tuple[bool, datetime | None] | None = None
+        self._written_at: float | None = None
+        self._cancel_pending: CALLBACK_TYPE | None = None
+
+    def _read_value(self) -> float | int | None:
+        value = self.sensors_data.get(self.entity_description.key)
+        if value is None or self._resolution is None:
+            return value
+        return round(round(value / self._resolution) * self._resolution, 1)
 
     @property
     def native_value(self) -> float | int | None:
-        """Return the sensor value."""
-        sensors_data = self.coordinator.data.get("sensors_data", {})
-        return sensors_data.get(self.entity_description.key)
+        """Return the last value that passed the deadband filter."""
+        return self._value
 
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Flag values computed by the integration rather than reported by the car."""
+        if self.entity_description.key in self.coordinator.data.get("derived", ()):
+            return {"derived": True}
+        return None
 
-class VoyahChargingEndTimeSensor(CoordinatorEntity[VoyahDataUpdateCoordinator], SensorEntity):
-    """Estimates charging completion time assuming linear charge rate."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only for significant changes, at most once per min_interval."""
+        value = self._read_value()
+        deadband = self.coordinator.deadbands.get(self.entity_description.key)
+        if deadband is None or self._status != self._status_written:
+            self._async_write_value(value)
+            return
+
+        if not deadband.is_significant(self._value, value):
+            self._async_cancel_pending()
+            return
+
+        wait = 0.0
+        if self._written_at is not None:
+            wait = self._written_at + deadband.min_interval - time.monotonic()
+        if wait <= 0:
+            self._async_write_value(value)
+        elif self._cancel_pending is None:
+            self._cancel_pending = async_call_later(self.hass, wait, self._async_write_pending)
 
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TIMESTAMP
-    _attr_translation_key = "charging_end_time"
-    _attr_icon = "mdi:battery-clock"
+    @callback
+    def _async_write_pending(self, _now: datetime) -> None:
+        self._cancel_pending = None
+        self._async_write_value(self._read_value())
+
+    @callback
+    def _async_cancel_pending(self) -> None:
+        if self._cancel_pending is not None:
+            self._cancel_pending()
+            self._cancel_pending = None
+
+    @callback
+    def _async_write_value(self, value: float | int | None) -> None:
+        self._async_cancel_pending()
+        self._value = value
+        self._written_at = time.monotonic()
+        self._status_written = self._status
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a deferred write when the entity goes away."""
+        self._async_cancel_pending()
+        await super().async_will_remove_from_hass()
+
+
+class VoyahDiagnosticSensor(VoyahEntity, SensorEntity):
+    """Disabled-by-default sensor exposing a sensorsData key without a dedicated entity."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
 
     def __init__(
         self,
         coordinator: VoyahDataUpdateCoordinator,
-        entry: ConfigEntry,
+        key: str,
     ) -> None:
-        super().__init__(coordinator)
-        car_id = entry.data.get(CONF_CAR_ID, entry.entry_id)
-        self._attr_unique_id = f"{car_id}_charging_end_time"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, car_id)},
-            name=entry.data.get(CONF_CAR_NAME, "Voyah"),
-            manufacturer="Voyah",
-        )
+        super().__init__(coordinator, f"raw_{key}")
+        self._key = key
+        self._attr_name = key
+
+    @property
+    def native_value(self) -> str | float | int | None:
+        """Return the raw value if it is a scalar."""
+        value = self.sensors_data.get(self._key)
+        if isinstance(value, (str, int, float)):
+            return value
+        return None
+
+
+class VoyahChargingEndTimeSensor(VoyahEntity, SensorEntity):
+    """Estimates charging completion time assuming linear charge rate."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_translation_key = "charging_end_time"
+    _attr_icon = "mdi:battery-clock"
+
+    def __init__(self, coordinator: VoyahDataUpdateCoordinator) -> None:
+        super().__init__(coordinator, "charging_end_time")
 
         self._pct_history: deque[tuple[float, float]] = deque(maxlen=RATE_WINDOW_POINTS)
         self._last_seen_pct: float | None = None
@@ -114,7 +290,7 @@ class VoyahChargingEndTimeSensor(CoordinatorEntity[VoyahDataUpdateCoordinator],
 
     def _init_tracking(self) -> None:
         """Seed tracking state from the first coordinator snapshot."""
-        sensors = self.coordinator.data.get("sensors_data", {})
+        sensors = self.sensors_data
         if sensors.get("chargingStatus"):
             pct = sensors.get("batteryPercentage")
             api_time = self.coordinator.data.get("time")
@@ -179,7 +355,7 @@ class VoyahChargingEndTimeSensor(CoordinatorEntity[VoyahDataUpdateCoordinator],
     @callback
     def _handle_coordinator_update(self) -> None:
         """Recalculate only when charging state or battery percentage changes."""
-        sensors = self.coordinator.data.get("sensors_data", {})
+        sensors = self.sensors_data
         is_charging = bool(sensors.get("chargingStatus"))
 
         if not is_charging:
@@ -220,31 +396,153 @@ class VoyahChargingEndTimeSensor(CoordinatorEntity[VoyahDataUpdateCoordinator],
         return self._cached_end_time
 
 
-class VoyahLastPingSensor(CoordinatorEntity[VoyahDataUpdateCoordinator], SensorEntity):
+class VoyahLastPingSensor(VoyahEntity, SensorEntity):
     """Sensor reporting seconds since the car last connected to the server."""
 
-    _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_translation_key = "last_ping"
     _attr_icon = "mdi:timer-outline"
 
+    def __init__(self, coordinator: VoyahDataUpdateCoordinator) -> None:
+        super().__init__(coordinator, "last_ping")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return seconds since the last ping from the car."""
+        return self.coordinator.data.get("last_ping")
+
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the sleep backoff level polling is currently at."""
+        return {"backoff_level": self.coordinator.sleep.level}
+
+
+class VoyahLastTripSensor(VoyahEntity, SensorEntity):
+    """Sensor exposing one metric of the most recently completed trip."""
+
+    def __init__(
+        self,
+        coordinator: VoyahDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, f"last_trip_{description.key}")
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the metric of the last trip."""
+        trip = self.coordinator.trips.last_trip
+        if trip is None:
+            return None
+        return getattr(trip, self.entity_description.key)
+
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Return trip boundaries on the distance sensor only."""
+        trip = self.coordinator.trips.last_trip
+        if trip is None or self.entity_description.key != "distance":
+            return None
+        details = trip.as_dict()
+        return {
+            "start_time": details["start_time"],
+            "end_time": details["end_time"],
+            "start_position": details["start_position"],
+            "end_position": details["end_position"],
+        }
+
+
+class VoyahConsumptionSensor(VoyahEntity, SensorEntity):
+    """Sensor exposing an incrementally computed consumption figure."""
+
     def __init__(
         self,
         coordinator: VoyahDataUpdateCoordinator,
-        entry: ConfigEntry,
+        description: SensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator)
-        car_id = entry.data.get(CONF_CAR_ID, entry.entry_id)
-        self._attr_unique_id = f"{car_id}_last_ping"
+        super().__init__(coordinator, f"consumption_{description.key}")
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the consumption value from the coordinator tracker."""
+        return getattr(self.coordinator.consumption, self.entity_description.key)
+
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Return the window length behind rolling values."""
+        if not self.entity_description.key.startswith("rolling"):
+            return None
+        return {
+            "window": self.coordinator.consumption.window_km,
+            "window_distance": self.coordinator.consumption.window_distance,
+        }
+
+
+class VoyahPlaceSensor(VoyahEntity, SensorEntity):
+    """Sensor naming the place from the offline places file the car is in."""
+
+    _attr_translation_key = "place"
+    _attr_icon = "mdi:map-marker-radius"
+
+    def __init__(self, coordinator: VoyahDataUpdateCoordinator) -> None:
+        super().__init__(coordinator, "place")
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the resolved place name."""
+        return self.coordinator.place
+
+
+class VoyahChargingLocationSensor(VoyahEntity, SensorEntity):
+    """Sensor naming the learned location where the car last started charging."""
+
+    _attr_translation_key = "charging_location"
+    _attr_icon = "mdi:ev-station"
+
+    def __init__(self, coordinator: VoyahDataUpdateCoordinator) -> None:
+        super().__init__(coordinator, "charging_location")
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the label of the last charging location."""
+        cluster = self.coordinator.chargers.current
+        return cluster.label if cluster is not None else None
+
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Return the location centre, its session count and whether it is home."""
+        cluster = self.coordinator.chargers.current
+        if cluster is None:
+            return None
+        attributes: dict[str, Any] = {
+            "latitude": round(cluster.lat, 6),
+            "longitude": round(cluster.lon, 6),
+            "sessions": cluster.sessions,
+        }
+        if (home := self.hass.states.get(zone.ENTITY_ID_HOME)) is not None:
+            attributes["home"] = zone.in_zone(home, cluster.lat, cluster.lon)
+        return attributes
+
+
+class VoyahFleetSensor(SensorEntity):
+    """Sensor exposing one aggregate over all loaded cars."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, aggregates: FleetAggregates, description: SensorEntityDescription) -> None:
+        self.entity_description = description
+        self._aggregates = aggregates
+        self._attr_unique_id = f"{FLEET_DEVICE_ID}_{description.key}"
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, car_id)},
-            name=entry.data.get(CONF_CAR_NAME, "Voyah"),
+            identifiers={(DOMAIN, FLEET_DEVICE_ID)},
+            name="Voyah fleet",
             manufacturer="Voyah",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the fleet totals change."""
+        self.async_on_remove(self._aggregates.async_add_listener(self.async_write_ha_state))
+
     @property
-    def native_value(self) -> float | None:
-        """Return seconds since the last ping from the car."""
-        return self.coordinator.data.get("last_ping")
+    def native_value(self) -> float | int | None:
+        """Return the aggregate value."""
+        return getattr(self._aggregates, self.entity_description.key)
@@ -0,0 +1,207 @@
+"""Services for the Voyah integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from typing import Any
+
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util import dt as dt_util, slugify
+import voluptuous as vol
+
+from .account import async_iter_coordinators
+from .const import DOMAIN
+from .coordinator import VoyahDataUpdateCoordinator
+from .fleet import FleetCar, async_get_fleet_index
+from .route import iter_geojson, iter_gpx, prune_exports, write_export
+
+SERVICE_GET_TRIPS = "get_trips"
+SERVICE_EXPORT_ROUTE = "export_route"
+SERVICE_GET_CHARGING_LOCATIONS = "get_charging_locations"
+SERVICE_FIND_NEAREST_CARS = "find_nearest_cars"
+SERVICE_BOOST_POLLING = "boost_polling"
+
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_FORMAT = "format"
+ATTR_COUNT = "count"
+ATTR_MIN_BATTERY = "min_battery"
+ATTR_CHARGING = "charging"
+ATTR_IGNITION = "ignition"
+ATTR_INTERVAL = "interval"
+ATTR_DURATION = "duration"
+
+EXPORT_FORMATS = {"gpx": iter_gpx, "geojson": iter_geojson}
+
+GET_TRIPS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+EXPORT_ROUTE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FORMAT, default="gpx"): vol.In(list(EXPORT_FORMATS)),
+    }
+)
+
+GET_CHARGING_LOCATIONS_SCHEMA = vol.Schema({vol.Required(ATTR_DEVICE_ID): cv.string})
+
+FIND_NEAREST_CARS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_LATITUDE): cv.latitude,
+        vol.Required(ATTR_LONGITUDE): cv.longitude,
+        vol.Optional(ATTR_COUNT, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(ATTR_MIN_BATTERY): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional(ATTR_CHARGING): cv.boolean,
+        vol.Optional(ATTR_IGNITION): cv.boolean,
+    }
+)
+
+BOOST_POLLING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+        vol.Required(ATTR_DURATION): vol.All(cv.time_period, cv.positive_timedelta),
+    }
+)
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, device_id: str) -> VoyahDataUpdateCoordinator:
+    """Return the coordinator for the car behind a device registry id."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        raise ServiceValidationError(f"Unknown device: {device_id}")
+
+    car_ids = {identifier for domain, identifier in device.identifiers if domain == DOMAIN}
+    for coordinator in async_iter_coordinators(hass):
+        if coordinator.car_id in car_ids:
+            return coordinator
+
+    raise ServiceValidationError(f"Device {device_id} is not a loaded Voyah car")
+
+
+def _car_filter(call: ServiceCall) -> Callable[[FleetCar], bool]:
+    """Build the predicate for the optional find_nearest_cars filters."""
+    min_battery = call.data.get(ATTR_MIN_BATTERY)
+    charging = call.data.get(ATTR_CHARGING)
+    ignition = call.data.get(ATTR_IGNITION)
+
+    def _matches(car: FleetCar) -> bool:
+        if min_battery is not None and (car.battery is None or car.battery < min_battery):
+            return False
+        if charging is not None and car.charging != charging:
+            return False
+        return ignition is None or car.ignition == ignition
+
+    return _matches
+
+
+def _timestamp(call: ServiceCall, key: str) -> float | None:
+    value = call.data.get(key)
+    if value is None:
+        return None
+    return dt_util.as_utc(value).timestamp()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration-level services."""
+
+    async def async_get_trips(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        trips = coordinator.trips.query(
+            start=_timestamp(call, ATTR_START),
+            end=_timestamp(call, ATTR_END),
+            limit=call.data.get(ATTR_LIMIT),
+        )
+        result: list[dict[str, Any]] = [trip.as_dict() for trip in trips]
+        return {"trips": result}
+
+    async def async_export_route(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        export_format = call.data[ATTR_FORMAT]
+        tracks = coordinator.routes.query(_timestamp(call, ATTR_START), _timestamp(call, ATTR_END))
+        stamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+        prefix = slugify(coordinator.car_id)
+        directory = hass.config.path(DOMAIN, "exports")
+        path = os.path.join(directory, f"{prefix}_{stamp}.{export_format}")
+        chunks = EXPORT_FORMATS[export_format](tracks, coordinator.car_name)
+        path, size = await hass.async_add_executor_job(write_export, path, chunks)
+        await hass.async_add_executor_job(prune_exports, directory, prefix)
+        return {"path": path, "tracks": len(tracks), "size": size}
+
+    async def async_get_charging_locations(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        result: list[dict[str, Any]] = [cluster.as_dict() for cluster in coordinator.chargers.locations()]
+        return {"locations": result}
+
+    async def async_find_nearest_cars(call: ServiceCall) -> ServiceResponse:
+        matches = async_get_fleet_index(hass).nearest(
+            call.data[ATTR_LATITUDE],
+            call.data[ATTR_LONGITUDE],
+            call.data[ATTR_COUNT],
+            _car_filter(call),
+        )
+        device_registry = dr.async_get(hass)
+        result: list[dict[str, Any]] = []
+        for distance, car in matches:
+            item = car.as_dict(distance)
+            device = device_registry.async_get_device(identifiers={(DOMAIN, car.car_id)})
+            item[ATTR_DEVICE_ID] = device.id if device is not None else None
+            result.append(item)
+        return {"cars": result}
+
+    async def async_boost_polling(call: ServiceCall) -> ServiceResponse:
+        coordinator = async_get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        until = coordinator.async_boost(call.data[ATTR_INTERVAL], call.data[ATTR_DURATION])
+        await coordinator.async_request_refresh()
+        return {"until": until.isoformat(), "interval": coordinator.update_interval.total_seconds()}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRIPS,
+        async_get_trips,
+        schema=GET_TRIPS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_ROUTE,
+        async_export_route,
+        schema=EXPORT_ROUTE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHARGING_LOCATIONS,
+        async_get_charging_locations,
+        schema=GET_CHARGING_LOCATIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_NEAREST_CARS,
+        async_find_nearest_cars,
+        schema=FIND_NEAREST_CARS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BOOST_POLLING,
+        async_boost_polling,
+        schema=BOOST_POLLING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
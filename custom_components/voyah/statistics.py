@@ -0,0 +1,209 @@
+"""External long-term statistics for high-frequency Voyah telemetry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util, slugify
+
+from . import const
+from .const import DOMAIN, STATISTICS_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+# The recorder only accepts hour-aligned rows for imported statistics.
+BUCKET_SECONDS = 3600
+
+UNIT_CLASSES: dict[str, str] = {
+    "speed": "speed",
+    "12VBatteryVoltage": "voltage",
+    "outsideTemp": "temperature",
+    "inBoardTemp": "temperature",
+    "batteryTemp": "temperature",
+    "coolantTemp": "temperature",
+}
+
+
+@dataclass(slots=True)
+class StatisticsBucket:
+    """Running mean/min/max of one key within one bucket."""
+
+    start: int
+    count: int = 0
+    total: float = 0.0
+    min: float = field(default=float("inf"))
+    max: float = field(default=float("-inf"))
+
+    def add(self, value: float) -> None:
+        """Fold one sample into the bucket."""
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of the samples."""
+        return self.total / self.count
+
+
+class StatisticsAggregator:
+    """Fold samples into fixed buckets and hand out buckets once they close.
+
+    A bucket closes when a later sample for its key starts a new bucket or
+    when flush() is called at an hour boundary or on shutdown. Samples older
+    than a key's open or last closed bucket are dropped: the closed rows are
+    already imported and reopening them would overwrite them with a partial
+    hour.
+    """
+
+    def __init__(self, keys: tuple[str, ...], bucket_seconds: int = BUCKET_SECONDS) -> None:
+        self._keys = keys
+        self._bucket_seconds = bucket_seconds
+        self._open: dict[str, StatisticsBucket] = {}
+        self._closed: dict[str, list[StatisticsBucket]] = {}
+        # Per key, the earliest bucket start still accepted.
+        self._floors: dict[str, int] = {}
+        self._last_time: float | None = None
+
+    def add_snapshot(self, sensors: dict[str, Any], timestamp: float) -> None:
+        """Add the tracked keys of one snapshot taken at timestamp."""
+        if timestamp == self._last_time:
+            # The car did not report anything new; do not overweight stale values.
+            return
+        self._last_time = timestamp
+
+        start = int(timestamp) - int(timestamp) % self._bucket_seconds
+        for key in self._keys:
+            value = sensors.get(key)
+            if value is None:
+                continue
+            bucket = self._open.get(key)
+            if start < self._floors.get(key, start) or (bucket is not None and start < bucket.start):
+                _LOGGER.debug("Dropping %s sample from %s: its hour is already imported", key, timestamp)
+                continue
+            if bucket is None or bucket.start != start:
+                if bucket is not None:
+                    self._close(key, bucket)
+                bucket = self._open[key] = StatisticsBucket(start)
+            bucket.add(float(value))
+
+    def flush(self, now: float | None = None) -> None:
+        """Close open buckets that ended by now, or all of them when now is None."""
+        for key, bucket in list(self._open.items()):
+            if now is None or bucket.start + self._bucket_seconds <= now:
+                del self._open[key]
+                self._close(key, bucket)
+
+    def _close(self, key: str, bucket: StatisticsBucket) -> None:
+        self._closed.setdefault(key, []).append(bucket)
+        self._floors[key] = bucket.start + self._bucket_seconds
+
+    def pop_closed(self) -> dict[str, list[StatisticsBucket]]:
+        """Return and forget all buckets that can no longer change."""
+        closed, self._closed = self._closed, {}
+        return closed
+
+
+class VoyahStatistics:
+    """Push aggregated telemetry of one car into the recorder as external statistics."""
+
+    def __init__(self, hass: HomeAssistant, car_id: str, car_name: str) -> None:
+        self._hass = hass
+        self._car_id = car_id
+        self._car_name = car_name
+        self.aggregator = StatisticsAggregator(STATISTICS_KEYS)
+        self._stopped = False
+        self._units = {
+            description.key: description.native_unit_of_measurement
+            for description in const.SENSOR_DESCRIPTIONS
+            if description.key in STATISTICS_KEYS
+        }
+
+    def statistic_id(self, key: str) -> str:
+        """External statistic id for a telemetry key."""
+        return f"{DOMAIN}:{slugify(f'{self._car_id}_{key}')}"
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Import finished hours on the clock and on shutdown; return a callback that stops and flushes.
+
+        A sleeping car keeps reporting the same time, so without the hourly
+        timer its last hour would stay open until it wakes up.
+        """
+        cancel_hourly = async_track_utc_time_change(self._hass, self._async_on_hour, minute=0, second=0)
+        cancel_stop = self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_on_stop)
+
+        @callback
+        def _async_stop() -> None:
+            cancel_hourly()
+            if not self._stopped:
+                cancel_stop()
+            self.async_flush()
+
+        return _async_stop
+
+    @callback
+    def _async_on_hour(self, now: datetime) -> None:
+        self.async_flush(now.timestamp())
+
+    @callback
+    def _async_on_stop(self, _event: Event) -> None:
+        self._stopped = True
+        self.async_flush()
+
+    @callback
+    def async_flush(self, now: float | None = None) -> None:
+        """Import open buckets that ended by now, or all of them when now is None."""
+        self.aggregator.flush(now)
+        if closed := self.aggregator.pop_closed():
+            self._async_import(closed)
+
+    @callback
+    def async_process(self, data: dict[str, Any], now: float) -> None:
+        """Aggregate a snapshot and import every bucket that closed."""
+        self.aggregator.add_snapshot(data.get("sensors_data") or {}, data.get("time") or now)
+        closed = self.aggregator.pop_closed()
+        if closed:
+            self._async_import(closed)
+
+    @callback
+    def _async_import(self, closed: dict[str, list[StatisticsBucket]]) -> None:
+        if "recorder" not in self._hass.config.components:
+            _LOGGER.debug("Recorder not loaded; dropping %d statistics series", len(closed))
+            return
+        # Imported lazily: the recorder is only needed when this optional mode is enabled.
+        from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData  # noqa: PLC0415
+        from homeassistant.components.recorder.statistics import async_add_external_statistics  # noqa: PLC0415
+
+        for key, buckets in closed.items():
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=f"{self._car_name} {key}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(key),
+                unit_class=UNIT_CLASSES.get(key),
+                unit_of_measurement=self._units.get(key),
+            )
+            statistics = [
+                StatisticData(
+                    start=_bucket_start(bucket),
+                    mean=bucket.mean,
+                    min=bucket.min,
+                    max=bucket.max,
+                )
+                for bucket in buckets
+            ]
+            _LOGGER.debug("Importing %d statistics rows for %s", len(statistics), metadata["statistic_id"])
+            async_add_external_statistics(self._hass, metadata, statistics)
+
+
+def _bucket_start(bucket: StatisticsBucket) -> datetime:
+    return dt_util.utc_from_timestamp(bucket.start)
@@ -0,0 +1,29 @@
+"""Flat telemetry views of coordinator snapshots and the changes between them."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Position keys are prefixed so they cannot clash with sensor keys such as "speed".
+POSITION_PREFIX = "position."
+
+
+def flatten_telemetry(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the sensor and position values of a snapshot as one flat mapping.
+
+    last_ping and the snapshot time change on every poll and the packed status
+    masks repeat sensor keys, so they are left out.
+    """
+    telemetry = dict(data.get("sensors_data") or {})
+    for key, value in (data.get("position_data") or {}).items():
+        telemetry[POSITION_PREFIX + key] = value
+    return telemetry
+
+
+def diff_telemetry(old: dict[str, Any], new: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+    """Return {key: (old, new)} for every key whose value changed; missing keys read as None."""
+    changes = {key: (old.get(key), value) for key, value in new.items() if old.get(key) != value}
+    for key in old.keys() - new.keys():
+        if old[key] is not None:
+            changes[key] = (old[key], None)
+    return changes
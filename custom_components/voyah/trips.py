@@ -0,0 +1,263 @@
+"""Streaming trip detection for the Voyah integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+import logging
+from operator import attrgetter
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+MAX_STORED_TRIPS = 1000
+MIN_TRIP_DISTANCE_KM = 0.1
+
+_start_time = attrgetter("start_time")
+
+
+@dataclass(slots=True, frozen=True)
+class TripRecord:
+    """A single completed trip."""
+
+    start_time: float
+    end_time: float
+    distance: float
+    max_speed: float | None
+    soc_start: float | None
+    soc_end: float | None
+    start_lat: float | None
+    start_lon: float | None
+    end_lat: float | None
+    end_lon: float | None
+
+    @property
+    def duration(self) -> float:
+        """Trip duration in seconds."""
+        return self.end_time - self.start_time
+
+    @property
+    def average_speed(self) -> float | None:
+        """Average speed in km/h over the whole trip."""
+        if self.duration <= 0:
+            return None
+        return round(self.distance / (self.duration / 3600), 1)
+
+    @property
+    def soc_used(self) -> float | None:
+        """Battery percentage consumed during the trip."""
+        if self.soc_start is None or self.soc_end is None:
+            return None
+        return round(self.soc_start - self.soc_end, 1)
+
+    def to_row(self) -> list[Any]:
+        """Serialize to a positional row for compact storage."""
+        return [
+            self.start_time,
+            self.end_time,
+            self.distance,
+            self.max_speed,
+            self.soc_start,
+            self.soc_end,
+            self.start_lat,
+            self.start_lon,
+            self.end_lat,
+            self.end_lon,
+        ]
+
+    @classmethod
+    def from_row(cls, row: list[Any]) -> TripRecord:
+        """Deserialize a row produced by to_row."""
+        return cls(*row)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly representation for services and attributes."""
+        return {
+            "start_time": dt_util.utc_from_timestamp(self.start_time).isoformat(),
+            "end_time": dt_util.utc_from_timestamp(self.end_time).isoformat(),
+            "distance": self.distance,
+            "duration": self.duration,
+            "average_speed": self.average_speed,
+            "max_speed": self.max_speed,
+            "soc_used": self.soc_used,
+            "start_position": [self.start_lat, self.start_lon],
+            "end_position": [self.end_lat, self.end_lon],
+        }
+
+
+class TripDetector:
+    """Segment consecutive coordinator snapshots into trips by ignition cycle.
+
+    Each snapshot is processed in O(1): the detector keeps only the running
+    aggregates of the active trip and emits a TripRecord on the falling edge
+    of ``ignitionStatus``.
+    """
+
+    def __init__(self) -> None:
+        self._active: dict[str, Any] | None = None
+
+    @property
+    def active(self) -> dict[str, Any] | None:
+        """Running state of the trip in progress, if any."""
+        return self._active
+
+    def restore(self, active: dict[str, Any] | None) -> None:
+        """Restore the in-progress trip saved before a restart."""
+        self._active = active
+
+    def update(self, data: dict[str, Any], now: float) -> TripRecord | None:
+        """Consume one snapshot and return a trip when one has just ended."""
+        sensors = data.get("sensors_data") or {}
+        position = data.get("position_data") or {}
+        ignition = sensors.get("ignitionStatus")
+        if ignition is None:
+            return None
+
+        sample = {
+            "time": data.get("time") or now,
+            "odometer": sensors.get("odometer"),
+            "speed": sensors.get("speed"),
+            "soc": sensors.get("batteryPercentage"),
+            "lat": position.get("lat"),
+            "lon": position.get("lon"),
+        }
+
+        active = self._active
+        if ignition:
+            if active is None:
+                self._active = {
+                    "start_time": sample["time"],
+                    "end_time": sample["time"],
+                    "odo_start": sample["odometer"],
+                    "odo_end": sample["odometer"],
+                    "max_speed": sample["speed"],
+                    "soc_start": sample["soc"],
+                    "soc_end": sample["soc"],
+                    "start_lat": sample["lat"],
+                    "start_lon": sample["lon"],
+                    "end_lat": sample["lat"],
+                    "end_lon": sample["lon"],
+                }
+                _LOGGER.debug("Trip started at %s (odometer=%s)", sample["time"], sample["odometer"])
+                return None
+            self._extend(active, sample)
+            return None
+
+        if active is None:
+            return None
+
+        self._extend(active, sample)
+        self._active = None
+        return self._finish(active)
+
+    @staticmethod
+    def _extend(active: dict[str, Any], sample: dict[str, Any]) -> None:
+        active["end_time"] = sample["time"]
+        odometer = sample["odometer"]
+        if odometer is not None:
+            if active["odo_start"] is None:
+                active["odo_start"] = odometer
+            active["odo_end"] = odometer
+        speed = sample["speed"]
+        if speed is not None and (active["max_speed"] is None or speed > active["max_speed"]):
+            active["max_speed"] = speed
+        soc = sample["soc"]
+        if soc is not None:
+            if active["soc_start"] is None:
+                active["soc_start"] = soc
+            active["soc_end"] = soc
+        if sample["lat"] is not None and sample["lon"] is not None:
+            if active["start_lat"] is None:
+                active["start_lat"] = sample["lat"]
+                active["start_lon"] = sample["lon"]
+            active["end_lat"] = sample["lat"]
+            active["end_lon"] = sample["lon"]
+
+    @staticmethod
+    def _finish(active: dict[str, Any]) -> TripRecord | None:
+        odo_start = active["odo_start"]
+        odo_end = active["odo_end"]
+        if odo_start is None or odo_end is None:
+            _LOGGER.debug("Discarding trip without odometer readings")
+            return None
+
+        distance = round(odo_end - odo_start, 1)
+        if distance < MIN_TRIP_DISTANCE_KM:
+            _LOGGER.debug("Discarding stationary ignition cycle (distance=%s)", distance)
+            return None
+
+        return TripRecord(
+            start_time=active["start_time"],
+            end_time=active["end_time"],
+            distance=distance,
+            max_speed=active["max_speed"],
+            soc_start=active["soc_start"],
+            soc_end=active["soc_end"],
+            start_lat=active["start_lat"],
+            start_lon=active["start_lon"],
+            end_lat=active["end_lat"],
+            end_lon=active["end_lon"],
+        )
+
+
+class VoyahTripLog:
+    """Persisted trip history for one car, fed by the coordinator."""
+
+    def __init__(self, hass: HomeAssistant, car_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{car_id}.trips")
+        self.detector = TripDetector()
+        self.trips: list[TripRecord] = []
+
+    @property
+    def last_trip(self) -> TripRecord | None:
+        """Most recently completed trip."""
+        return self.trips[-1] if self.trips else None
+
+    async def async_load(self) -> None:
+        """Load stored trips and the in-progress trip."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self.trips = [TripRecord.from_row(row) for row in stored.get("trips", [])]
+        self.detector.restore(stored.get("active"))
+
+    def process(self, data: dict[str, Any], now: float) -> TripRecord | None:
+        """Feed a snapshot to the detector and record a finished trip."""
+        was_active = self.detector.active is not None
+        trip = self.detector.update(data, now)
+        if trip is not None:
+            self.trips.append(trip)
+            if len(self.trips) > MAX_STORED_TRIPS:
+                del self.trips[: len(self.trips) - MAX_STORED_TRIPS]
+            _LOGGER.debug("Trip finished: %s km in %s s", trip.distance, trip.duration)
+        if trip is not None or was_active or self.detector.active is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return trip
+
+    def query(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        limit: int | None = None,
+    ) -> list[TripRecord]:
+        """Return trips that started within [start, end], newest last."""
+        lo = bisect_left(self.trips, start, key=_start_time) if start is not None else 0
+        hi = bisect_right(self.trips, end, key=_start_time) if end is not None else len(self.trips)
+        result = self.trips[lo:hi]
+        if limit is not None:
+            result = result[-limit:]
+        return result
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "trips": [trip.to_row() for trip in self.trips],
+            "active": self.detector.active,
+        }
@@ -0,0 +1,64 @@
+"""WebSocket API for the Voyah integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+import voluptuous as vol
+
+from .account import async_iter_coordinators
+from .const import EVENT_TELEMETRY_CHANGED
+from .services import async_get_coordinator
+
+ATTR_DEVICE_IDS = "device_ids"
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the Voyah WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voyah/subscribe",
+        vol.Optional(ATTR_DEVICE_IDS): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+@callback
+def websocket_subscribe(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Stream per-car telemetry: one full snapshot, then only the changed keys.
+
+    The snapshot maps each car id to its name and flat telemetry; every later
+    message carries one car id and its changed keys with their new values
+    (None for a key that disappeared). Without device_ids all loaded cars are
+    streamed, so a fleet view needs a single subscription.
+    """
+    car_ids: set[str] | None = None
+    if device_ids := msg.get(ATTR_DEVICE_IDS):
+        try:
+            car_ids = {async_get_coordinator(hass, device_id).car_id for device_id in device_ids}
+        except ServiceValidationError as err:
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+            return
+
+    @callback
+    def _forward_changes(event: Event) -> None:
+        car_id = event.data["car_id"]
+        if car_ids is not None and car_id not in car_ids:
+            return
+        changes = {change["key"]: change["new"] for change in event.data["changes"]}
+        connection.send_message(websocket_api.event_message(msg["id"], {"car_id": car_id, "changes": changes}))
+
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(EVENT_TELEMETRY_CHANGED, _forward_changes)
+    connection.send_result(msg["id"])
+    snapshot = {
+        coordinator.car_id: {"name": coordinator.car_name, "telemetry": coordinator.telemetry or {}}
+        for coordinator in async_iter_coordinators(hass)
+        if car_ids is None or coordinator.car_id in car_ids
+    }
+    connection.send_message(websocket_api.event_message(msg["id"], {"snapshot": snapshot}))
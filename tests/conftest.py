@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.voyah.account import VoyahAccount
 from custom_components.voyah.const import (
     CONF_ACCESS_TOKEN,
     CONF_CAR_ID,
@@ -89,11 +90,20 @@ def make_coordinator(hass: HomeAssistant, data: dict):
     """Create a VoyahDataUpdateCoordinator with pre-set data."""
     entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG_DATA)
     entry.add_to_hass(hass)
-    coordinator = VoyahDataUpdateCoordinator(hass, MagicMock(), entry, update_interval=60)
+    client = MagicMock(access_token=MOCK_ACCESS_TOKEN, refresh_token=MOCK_REFRESH_TOKEN)
+    coordinator = VoyahDataUpdateCoordinator(hass, client, entry, update_interval=60)
     coordinator.data = data
     return coordinator
 
 
+def register_account(hass: HomeAssistant, *coordinators: VoyahDataUpdateCoordinator) -> VoyahAccount:
+    """Load coordinators as the cars of their entry's account."""
+    account = VoyahAccount(coordinators[0].client)
+    account.coordinators = {coordinator.car_id: coordinator for coordinator in coordinators}
+    hass.data.setdefault(DOMAIN, {})[coordinators[0]._entry.entry_id] = account
+    return account
+
+
 def make_config_entry(hass: HomeAssistant) -> MockConfigEntry:
     """Create and register a MockConfigEntry."""
     entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG_DATA)
@@ -1,5 +1,6 @@
 """Tests for Voyah API client."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,7 +11,7 @@ from .conftest import MOCK_ACCESS_TOKEN, MOCK_CAR_ID, MOCK_REFRESH_TOKEN
 
 
 def _make_client(session: MagicMock) -> VoyahApiClient:
-    return VoyahApiClient(session, MOCK_CAR_ID, MOCK_ACCESS_TOKEN, MOCK_REFRESH_TOKEN)
+    return VoyahApiClient(session, MOCK_ACCESS_TOKEN, MOCK_REFRESH_TOKEN)
 
 
 def _mock_response(status: int, json_data: dict) -> MagicMock:
@@ -22,6 +23,14 @@ def _mock_response(status: int, json_data: dict) -> MagicMock:
     return resp
 
 
+def _yielding_enter(resp: MagicMock) -> AsyncMock:
+    async def _enter(*args: object) -> MagicMock:
+        await asyncio.sleep(0)
+        return resp
+
+    return AsyncMock(side_effect=_enter)
+
+
 async def test_parse_extracts_fields() -> None:
     """_parse pulls sensorsData, positionData and time."""
     raw = {
@@ -46,6 +55,17 @@ async def test_parse_merges_speed_from_position() -> None:
     assert result["sensors_data"]["speed"] == 60
 
 
+async def test_parse_packs_status_bits() -> None:
+    """Opening and heating statuses are packed into bitmasks."""
+    raw = {
+        "sensorsData": {"doorFLStatus": 1, "trunkStatus": 1, "hatchStatus": 0, "seatHeatingDriverStatus": 0},
+        "positionData": {},
+    }
+    result = VoyahApiClient._parse(raw)
+    assert result["openings"] == 0b10001
+    assert result["heating"] == 0
+
+
 async def test_get_car_data_success() -> None:
     """async_get_car_data returns parsed data on 200."""
     raw = {
@@ -57,7 +77,7 @@ async def test_get_car_data_success() -> None:
     session.request = MagicMock(return_value=_mock_response(200, raw))
 
     client = _make_client(session)
-    data = await client.async_get_car_data()
+    data = await client.async_get_car_data(MOCK_CAR_ID)
     assert data["sensors_data"]["batteryPercentage"] == 80
 
 
@@ -73,7 +93,7 @@ async def test_get_car_data_refreshes_token_on_401() -> None:
     session.post = MagicMock(return_value=refresh_resp)
 
     client = _make_client(session)
-    data = await client.async_get_car_data()
+    data = await client.async_get_car_data(MOCK_CAR_ID)
 
     assert data["sensors_data"]["batteryPercentage"] == 50
     assert client.access_token == "new-access"
@@ -90,7 +110,25 @@ async def test_get_car_data_raises_auth_error_when_refresh_fails() -> None:
 
     client = _make_client(session)
     with pytest.raises(VoyahApiAuthError):
-        await client.async_get_car_data()
+        await client.async_get_car_data(MOCK_CAR_ID)
+
+
+async def test_concurrent_401s_refresh_once() -> None:
+    """Cars sharing a client that hit 401 together spend the refresh token once."""
+    raw = {"sensorsData": {}, "positionData": {}, "time": 0}
+    responses = [_mock_response(401, {}), _mock_response(401, {}), _mock_response(200, raw), _mock_response(200, raw)]
+    for resp in responses:
+        # Yield on enter so both cars' first requests are in flight before either refreshes.
+        resp.__aenter__ = _yielding_enter(resp)
+    session = MagicMock()
+    session.request = MagicMock(side_effect=responses)
+    session.post = MagicMock(return_value=_mock_response(200, {"accessToken": "new", "refreshToken": "new-refresh"}))
+
+    client = _make_client(session)
+    await asyncio.gather(client.async_get_car_data("car-1"), client.async_get_car_data("car-2"))
+
+    assert session.post.call_count == 1
+    assert client.access_token == "new"
 
 
 async def test_request_sms_raises_connection_error_on_5xx() -> None:
@@ -2,19 +2,31 @@
 
 from homeassistant.core import HomeAssistant
 
-from custom_components.voyah.binary_sensor import VoyahBinarySensorEntity
-from custom_components.voyah.const import BINARY_SENSOR_DESCRIPTIONS
+from custom_components.voyah.binary_sensor import (
+    VoyahBinarySensorEntity,
+    VoyahCompositeBinarySensorEntity,
+    async_setup_entry,
+)
+from custom_components.voyah.const import (
+    BINARY_SENSOR_DESCRIPTIONS,
+    BINARY_SENSOR_KEYS,
+    COMPOSITE_BINARY_SENSOR_DESCRIPTIONS,
+)
 
-from .conftest import MOCK_CAR_DATA, MOCK_CONFIG_DATA, make_config_entry, make_coordinator
+from .conftest import MOCK_CAR_DATA, MOCK_CAR_ID, MOCK_CONFIG_DATA, make_coordinator, register_account
+
+
+def test_binary_sensor_keys_match_descriptions() -> None:
+    """The plain key set used at setup lists exactly the described binary sensors."""
+    assert {description.key for description in BINARY_SENSOR_DESCRIPTIONS} == BINARY_SENSOR_KEYS
 
 
 async def test_binary_sensor_is_on_when_value_truthy(hass: HomeAssistant) -> None:
     """is_on returns True for non-zero value."""
     data = {**MOCK_CAR_DATA, "sensors_data": {"ignitionStatus": 1}}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
     desc = next(d for d in BINARY_SENSOR_DESCRIPTIONS if d.key == "ignitionStatus")
-    sensor = VoyahBinarySensorEntity(coordinator, desc, entry)
+    sensor = VoyahBinarySensorEntity(coordinator, desc)
     assert sensor.is_on is True
 
 
@@ -22,9 +34,8 @@ async def test_binary_sensor_is_off_when_value_zero(hass: HomeAssistant) -> None
     """is_on returns False for zero value."""
     data = {**MOCK_CAR_DATA, "sensors_data": {"ignitionStatus": 0}}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
     desc = next(d for d in BINARY_SENSOR_DESCRIPTIONS if d.key == "ignitionStatus")
-    sensor = VoyahBinarySensorEntity(coordinator, desc, entry)
+    sensor = VoyahBinarySensorEntity(coordinator, desc)
     assert sensor.is_on is False
 
 
@@ -32,16 +43,47 @@ async def test_binary_sensor_returns_none_for_missing_key(hass: HomeAssistant) -
     """is_on returns None when key absent."""
     data = {**MOCK_CAR_DATA, "sensors_data": {}}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
     desc = next(d for d in BINARY_SENSOR_DESCRIPTIONS if d.key == "chargingStatus")
-    sensor = VoyahBinarySensorEntity(coordinator, desc, entry)
+    sensor = VoyahBinarySensorEntity(coordinator, desc)
     assert sensor.is_on is None
 
 
 async def test_binary_sensor_unique_id(hass: HomeAssistant) -> None:
     """Unique ID uses car_id + key."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
     desc = next(d for d in BINARY_SENSOR_DESCRIPTIONS if d.key == "ignitionStatus")
-    sensor = VoyahBinarySensorEntity(coordinator, desc, entry)
+    sensor = VoyahBinarySensorEntity(coordinator, desc)
     assert sensor.unique_id == f"{MOCK_CONFIG_DATA['car_id']}_ignitionStatus"
+
+
+async def test_composite_binary_sensor_lists_active_members(hass: HomeAssistant) -> None:
+    """The composite sensor is on when any member bit is set and names the members."""
+    coordinator = make_coordinator(hass, {**MOCK_CAR_DATA, "openings": 0b10010})
+    desc = next(d for d in COMPOSITE_BINARY_SENSOR_DESCRIPTIONS if d.key == "openings")
+    sensor = VoyahCompositeBinarySensorEntity(coordinator, desc)
+
+    assert sensor.is_on is True
+    assert sensor.extra_state_attributes == {"active": ["doorFRStatus", "trunkStatus"]}
+
+    coordinator.data = {**MOCK_CAR_DATA, "openings": 0}
+    assert sensor.is_on is False
+    assert sensor.extra_state_attributes == {"active": []}
+
+
+async def test_setup_adds_binary_sensors_for_keys_appearing_later(hass: HomeAssistant) -> None:
+    """Status keys and composite groups appearing after setup get entities."""
+    coordinator = make_coordinator(hass, {"sensors_data": {"ignitionStatus": 0}})
+    entry = coordinator._entry
+    register_account(hass, coordinator)
+    added: list[list] = []
+
+    await async_setup_entry(hass, entry, lambda entities: added.append(list(entities)))
+    coordinator.data = {"sensors_data": {"ignitionStatus": 0, "doorFLStatus": 1}, "openings": 1}
+    coordinator.async_update_listeners()
+    coordinator.data = {"sensors_data": {"ignitionStatus": 0, "doorFLStatus": 1, "trunkStatus": 0}}
+    coordinator.async_update_listeners()
+
+    assert [entity.unique_id for entity in added[0]] == [f"{MOCK_CAR_ID}_ignitionStatus"]
+    assert [entity.unique_id for entity in added[1]] == [f"{MOCK_CAR_ID}_doorFLStatus", f"{MOCK_CAR_ID}_openings"]
+    assert [entity.unique_id for entity in added[2]] == [f"{MOCK_CAR_ID}_trunkStatus"]
+    await coordinator.async_shutdown()
@@ -21,13 +21,13 @@ def _make_coordinator_with_heating_client(hass):
     client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
     coordinator = VoyahDataUpdateCoordinator(hass, client, entry, update_interval=60)
     coordinator.data = MOCK_CAR_DATA
-    return coordinator, entry
+    return coordinator
 
 
 async def test_button_press_calls_heating_and_refreshes(hass: HomeAssistant) -> None:
     """async_press sends heating command and triggers coordinator refresh."""
-    coordinator, entry = _make_coordinator_with_heating_client(hass)
-    button = VoyahStartHeatingButton(coordinator, entry)
+    coordinator = _make_coordinator_with_heating_client(hass)
+    button = VoyahStartHeatingButton(coordinator)
 
     with patch.object(coordinator, "async_request_refresh", new_callable=AsyncMock) as mock_refresh:
         await button.async_press()
@@ -38,6 +38,6 @@ async def test_button_press_calls_heating_and_refreshes(hass: HomeAssistant) ->
 
 async def test_button_unique_id(hass: HomeAssistant) -> None:
     """Button unique ID uses car_id."""
-    coordinator, entry = _make_coordinator_with_heating_client(hass)
-    button = VoyahStartHeatingButton(coordinator, entry)
+    coordinator = _make_coordinator_with_heating_client(hass)
+    button = VoyahStartHeatingButton(coordinator)
     assert button.unique_id == f"{MOCK_CONFIG_DATA['car_id']}_start_heating"
@@ -0,0 +1,69 @@
+"""Tests for Voyah charging location learning."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.voyah.chargers import CLUSTER_RADIUS_M, ChargerClusterer, VoyahChargerLog
+from custom_components.voyah.gps import haversine_m
+
+
+def _snapshot(charging: int, lat: float = 55.7558, lon: float = 37.6176, time: int = 1000) -> dict:
+    return {
+        "sensors_data": {"chargingStatus": charging},
+        "position_data": {"lat": lat, "lon": lon},
+        "time": time,
+    }
+
+
+def test_clusterer_merges_nearby_sessions() -> None:
+    """Sessions within the radius join one cluster; distant ones start another."""
+    clusterer = ChargerClusterer()
+    first = clusterer.add(55.7558, 37.6176, 1)
+    second = clusterer.add(55.7563, 37.6180, 2)
+    third = clusterer.add(55.8, 37.7, 3)
+
+    assert first is second
+    assert first.sessions == 2
+    assert 55.7558 < first.lat < 55.7563
+    assert third.id != first.id
+    assert len(clusterer.clusters) == 2
+
+
+def test_clusterer_finds_clusters_two_cells_east_at_high_latitude() -> None:
+    """At 55.75° N a longitude cell is ~125 m, so a cluster 140 m east lies two cells away."""
+    clusterer = ChargerClusterer()
+    first = clusterer.add(55.75, 37.6019, 1)
+    second = clusterer.add(55.75, 37.6041, 2)
+
+    assert haversine_m(55.75, 37.6019, 55.75, 37.6041) < CLUSTER_RADIUS_M
+    assert second is first
+    assert len(clusterer.clusters) == 1
+
+
+def test_clusterer_memory_is_bounded() -> None:
+    """Beyond the limit the least used cluster is evicted."""
+    clusterer = ChargerClusterer(max_clusters=3)
+    clusterer.add(55.0, 37.0, 1)
+    clusterer.add(55.0, 37.0, 2)
+    for i in range(1, 5):
+        clusterer.add(55.0 + i, 37.0, 2 + i)
+
+    assert len(clusterer.clusters) == 3
+    assert clusterer.nearest(55.0, 37.0).sessions == 2
+    assert clusterer.nearest(56.0, 37.0) is None
+
+
+async def test_log_counts_rising_edges_only(hass: HomeAssistant) -> None:
+    """Only a transition into charging is recorded, not the first snapshot."""
+    log = VoyahChargerLog(hass, "car")
+
+    assert log.process(_snapshot(1), 0) is None
+    log.process(_snapshot(1, time=1060), 0)
+    log.process(_snapshot(0, time=1120), 0)
+    cluster = log.process(_snapshot(1, time=1180), 0, place="Home")
+    log.process(_snapshot(0, time=1240), 0)
+    log.process(_snapshot(1, lat=55.7559, time=1300), 0)
+
+    assert cluster is log.current
+    assert cluster.sessions == 2
+    assert cluster.label == "Home"
+    assert [location.as_dict()["name"] for location in log.locations()] == ["Home"]
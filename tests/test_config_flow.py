@@ -77,8 +77,9 @@ async def test_full_flow_single_org_single_car(hass: HomeAssistant) -> None:
         result = await hass.config_entries.flow.async_configure(result["flow_id"], {"code": "123456"})
 
     assert result["type"] == FlowResultType.CREATE_ENTRY
-    assert result["data"]["car_id"] == MOCK_CAR_ID
+    assert result["data"]["cars"] == {MOCK_CAR_ID: "Free (VIN123)"}
     assert result["data"]["phone"] == MOCK_PHONE
+    assert result["result"].unique_id == f"{DOMAIN}_{MOCK_PHONE}_org-1"
 
 
 async def test_code_step_invalid_code(hass: HomeAssistant) -> None:
@@ -136,6 +137,38 @@ async def test_multiple_cars_shows_car_step(hass: HomeAssistant) -> None:
     assert result["type"] == FlowResultType.FORM
     assert result["step_id"] == "car"
 
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"cars": ["car-1", "car-2"]})
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == f"Voyah +{MOCK_PHONE} (My Org)"
+    assert result["data"]["cars"] == {"car-1": "Free", "car-2": "Dream"}
+
+
+async def test_new_cars_join_existing_account_entry(hass: HomeAssistant) -> None:
+    """Running the flow again for the same account adds the remaining cars to its entry."""
+    existing = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=f"{DOMAIN}_{MOCK_PHONE}_org-1",
+        data={**MOCK_CONFIG_DATA, "cars": {"car-1": "Free"}},
+    )
+    existing.add_to_hass(hass)
+    cars = [{"_id": "car-1", "model": "Free"}, {"_id": "car-2", "model": "Dream"}]
+
+    with (
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_request_sms", return_value=None),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_sign_in", return_value=MOCK_AUTH_RESPONSE),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_get_organizations", return_value=MOCK_ORGS),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_sign_in_org", return_value=MOCK_AUTH_RESPONSE),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_search_cars", return_value=cars),
+        patch("custom_components.voyah.async_setup_entry", return_value=True),
+    ):
+        result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"phone": MOCK_PHONE})
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"code": "123456"})
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert existing.data["cars"] == {"car-1": "Free", "car-2": "Dream"}
+
 
 async def test_no_cars_aborts(hass: HomeAssistant) -> None:
     """No cars found aborts the flow."""
@@ -246,3 +279,91 @@ def test_car_label_only_vin_when_no_model() -> None:
     car = {"_id": "abc123", "vin": "TEST0000000000002"}
     label = _car_label(car)
     assert label == "(TEST0000000000002)"
+
+
+async def test_cars_of_all_organizations_in_one_pass(hass: HomeAssistant) -> None:
+    """Cars of every organization are listed once and imported as one entry per organization."""
+    orgs = [{"_id": "org-1", "name": "Fleet A"}, {"_id": "org-2", "name": "Fleet B"}]
+    cars_by_token = {
+        "token-org-1": [{"_id": "car-1", "model": "Free"}, {"_id": "car-2", "model": "Dream"}],
+        "token-org-2": [{"_id": "car-2", "model": "Dream"}, {"_id": "car-3", "model": "Passion"}],
+    }
+
+    async def _sign_in_org(session, access_token, org_id):
+        return {"accessToken": f"token-{org_id}", "refreshToken": f"refresh-{org_id}"}
+
+    async def _search_cars(session, access_token):
+        return cars_by_token[access_token]
+
+    with (
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_request_sms", return_value=None),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_sign_in", return_value=MOCK_AUTH_RESPONSE),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_get_organizations", return_value=orgs),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_sign_in_org", side_effect=_sign_in_org),
+        patch("custom_components.voyah.config_flow.VoyahApiClient.async_search_cars", side_effect=_search_cars),
+        patch("custom_components.voyah.async_setup_entry", return_value=True),
+    ):
+        result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"})
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"phone": MOCK_PHONE})
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {"code": "123456"})
+        assert result["step_id"] == "car"
+        assert list(result["data_schema"].schema["cars"].options) == ["car-1", "car-2", "car-3"]
+
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"cars": ["car-1", "car-2", "car-3"]}
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    entries = {entry.data["organization"]: entry for entry in hass.config_entries.async_entries(DOMAIN)}
+    assert entries["org-1"].data["cars"] == {"car-1": "Free", "car-2": "Dream"}
+    assert entries["org-2"].data["cars"] == {"car-3": "Passion"}
+    assert entries["org-2"].data["access_token"] == "token-org-2"
+
+
+async def test_options_flow_saves_options_and_drops_cleared_fields(hass: HomeAssistant) -> None:
+    """The options form stores the polling policy; optional fields left empty are removed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG_DATA, options={"places_file": "old.geojson", "battery_capacity": 80}
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"scan_interval": 300, "active_scan_interval": 30, "rate_budget": 120, "deadbands": {"speed": "fast"}},
+    )
+    assert result["errors"] == {"deadbands": "invalid_deadbands"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"scan_interval": 300, "active_scan_interval": 30, "schedules": [{"cron": "0 25 * * *", "interval": 60}]},
+    )
+    assert result["errors"] == {"schedules": "invalid_schedules"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "scan_interval": 300,
+            "active_scan_interval": 30,
+            "rate_budget": 120,
+            "deadbands": {"speed": {"absolute": 5}},
+            "schedules": [{"cron": "* 0-5 * * *", "interval": 1800}],
+            "places_file": "places.geojson",
+        },
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        "places_file": "places.geojson",
+        "scan_interval": 300,
+        "active_scan_interval": 30,
+        "rate_budget": 120,
+        "deadbands": {"speed": {"absolute": 5}},
+        "schedules": [{"cron": "* 0-5 * * *", "interval": 1800}],
+        "grace_period": 900,
+        "consumption_window": 100,
+        "statistics_mode": False,
+    }
@@ -0,0 +1,62 @@
+"""Tests for Voyah consumption tracking."""
+
+from custom_components.voyah.consumption import ConsumptionTracker
+
+
+def _snapshot(odometer: float, soc: float, ignition: int = 1, charging: int = 0) -> dict:
+    return {
+        "sensors_data": {
+            "odometer": odometer,
+            "batteryPercentage": soc,
+            "ignitionStatus": ignition,
+            "chargingStatus": charging,
+        }
+    }
+
+
+def test_rolling_consumption_from_deltas() -> None:
+    """Consumption is SoC used over distance driven."""
+    tracker = ConsumptionTracker(window_km=100, battery_capacity=80)
+    tracker.update(_snapshot(1000, 90))
+    tracker.update(_snapshot(1010, 88))
+    tracker.update(_snapshot(1020, 86))
+
+    assert tracker.rolling_pct_per_km == 0.2
+    assert tracker.rolling_kwh_per_100km == 16.0
+    assert tracker.trip_pct_per_km == 0.2
+
+
+def test_rolling_window_drops_old_segments() -> None:
+    """Only the most recent window_km of driving contributes."""
+    tracker = ConsumptionTracker(window_km=10)
+    tracker.update(_snapshot(0, 100))
+    tracker.update(_snapshot(10, 90))  # 1 %/km
+    tracker.update(_snapshot(20, 88))  # 0.2 %/km
+
+    assert tracker.window_distance == 10
+    assert tracker.rolling_pct_per_km == 0.2
+
+
+def test_charging_does_not_corrupt_estimate() -> None:
+    """SoC gained while charging or parked is not counted as negative consumption."""
+    tracker = ConsumptionTracker(window_km=100)
+    tracker.update(_snapshot(0, 80))
+    tracker.update(_snapshot(10, 78))
+    tracker.update(_snapshot(10, 78, ignition=0))
+    tracker.update(_snapshot(10, 90, ignition=0, charging=1))
+    tracker.update(_snapshot(10, 95, ignition=0))
+    tracker.update(_snapshot(20, 93))
+
+    assert tracker.rolling_pct_per_km == 0.2
+
+
+def test_trip_resets_on_ignition_and_needs_distance() -> None:
+    """Trip consumption restarts with each ignition cycle."""
+    tracker = ConsumptionTracker(window_km=100)
+    tracker.update(_snapshot(0, 80))
+    tracker.update(_snapshot(10, 70))
+    tracker.update(_snapshot(10, 70, ignition=0))
+    tracker.update(_snapshot(10, 70))
+
+    assert tracker.trip_pct_per_km is None
+    assert tracker.rolling_kwh_per_100km is None
@@ -1,18 +1,21 @@
 """Tests for Voyah data update coordinator."""
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_capture_events
+import time_machine
 
 from custom_components.voyah.api import VoyahApiAuthError, VoyahApiError
-from custom_components.voyah.const import DOMAIN
+from custom_components.voyah.const import DOMAIN, EVENT_TELEMETRY_CHANGED, SENSOR_DESCRIPTIONS
 from custom_components.voyah.coordinator import VoyahDataUpdateCoordinator
+from custom_components.voyah.sensor import VoyahSensorEntity
 
-from .conftest import MOCK_CAR_DATA, MOCK_CONFIG_DATA
+from .conftest import MOCK_CAR_DATA, MOCK_CONFIG_DATA, make_coordinator
 
 
 def _make_coordinator_with_entry(
@@ -71,11 +74,103 @@ async def test_coordinator_persists_refreshed_tokens(hass: HomeAssistant) -> Non
     client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
 
     coordinator, entry = _make_coordinator_with_entry(hass, client)
-    # _last_* were set from original tokens, now client has new ones
-    coordinator._last_access_token = "old-access"
-    coordinator._last_refresh_token = "old-refresh"
-
     await coordinator._async_update_data()
 
     assert entry.data["access_token"] == "new-access"
     assert entry.data["refresh_token"] == "new-refresh"
+
+
+async def test_coordinator_derives_speed_when_position_speed_missing(hass: HomeAssistant) -> None:
+    """Speed and course are computed from consecutive fixes and marked as derived."""
+    client = MagicMock()
+    client.access_token = "token"
+    client.refresh_token = "refresh"
+    coordinator, _ = _make_coordinator_with_entry(hass, client)
+
+    def _snapshot(lat: float, time: int) -> dict:
+        return {"sensors_data": {}, "position_data": {"lat": lat, "lon": 37.0}, "time": time}
+
+    client.async_get_car_data = AsyncMock(return_value=_snapshot(55.0, 1000))
+    first = await coordinator._async_update_data()
+    assert "derived" not in first
+
+    client.async_get_car_data = AsyncMock(return_value=_snapshot(55.01, 1060))
+    data = await coordinator._async_update_data()
+
+    assert data["sensors_data"]["speed"] == pytest.approx(66.7, abs=0.1)
+    assert data["position_data"]["course"] == 0
+    assert data["derived"] == ["speed", "course"]
+
+
+async def test_coordinator_serves_last_known_data_within_grace_period(hass: HomeAssistant) -> None:
+    """Failed polls keep the last good snapshot, with its time, until the grace period runs out."""
+    coordinator = make_coordinator(hass, None)
+    coordinator.client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
+    start = datetime(2024, 1, 1, 12, tzinfo=UTC)
+
+    with time_machine.travel(start, tick=False):
+        await coordinator.async_refresh()
+    coordinator.client.async_get_car_data = AsyncMock(side_effect=VoyahApiError("timeout"))
+
+    with time_machine.travel(start + timedelta(seconds=600), tick=False):
+        await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data is MOCK_CAR_DATA
+    assert coordinator.last_data == start
+
+    sensor = VoyahSensorEntity(coordinator, next(d for d in SENSOR_DESCRIPTIONS if d.key == "batteryPercentage"))
+    assert sensor.available
+    assert sensor.native_value == 80
+    assert sensor.extra_state_attributes == {"last_data": start}
+    status = sensor._status
+
+    with time_machine.travel(start + timedelta(seconds=700), tick=False):
+        await coordinator.async_refresh()
+    assert sensor._status == status
+
+    with time_machine.travel(start + timedelta(seconds=901), tick=False):
+        await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.last_data is None
+    assert not sensor.available
+
+    coordinator.client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
+    with time_machine.travel(start + timedelta(seconds=1200), tick=False):
+        await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert sensor.extra_state_attributes is None
+    await coordinator.async_shutdown()
+
+
+async def test_grace_period_zero_disables_grace_mode(hass: HomeAssistant) -> None:
+    """With a zero grace period the first failed poll makes the car unavailable."""
+    coordinator = make_coordinator(hass, None)
+    hass.config_entries.async_update_entry(coordinator._entry, options={"grace_period": 0})
+    coordinator.async_apply_options()
+    coordinator.client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
+    await coordinator.async_refresh()
+
+    coordinator.client.async_get_car_data = AsyncMock(side_effect=VoyahApiError("timeout"))
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_fires_one_event_with_changed_keys(hass: HomeAssistant) -> None:
+    """Each refresh fires one event listing only the keys that changed; no event without changes."""
+    events = async_capture_events(hass, EVENT_TELEMETRY_CHANGED)
+    coordinator = make_coordinator(hass, None)
+    charging = {**MOCK_CAR_DATA, "sensors_data": {**MOCK_CAR_DATA["sensors_data"], "chargingStatus": 1}}
+
+    for snapshot in (MOCK_CAR_DATA, MOCK_CAR_DATA, charging):
+        coordinator.client.async_get_car_data = AsyncMock(return_value=snapshot)
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["car_id"] == coordinator.car_id
+    assert events[0].data["changes"] == [
+        {"key": "chargingStatus", "old": MOCK_CAR_DATA["sensors_data"]["chargingStatus"], "new": 1}
+    ]
+    await coordinator.async_shutdown()
@@ -0,0 +1,78 @@
+"""Tests for Voyah deadband filtering."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.voyah.const import SENSOR_DESCRIPTIONS
+from custom_components.voyah.deadband import Deadband, build_deadbands
+from custom_components.voyah.sensor import VoyahSensorEntity
+
+from .conftest import MOCK_CAR_DATA, make_coordinator
+
+
+def test_absolute_and_relative_thresholds() -> None:
+    """Either threshold makes a change significant."""
+    deadband = Deadband(absolute=0.1, relative=0.5)
+    assert not deadband.is_significant(12.49, 12.51)
+    assert deadband.is_significant(12.4, 12.6)
+    assert Deadband(relative=0.1).is_significant(10, 11)
+    assert not Deadband(relative=0.1).is_significant(10, 10.5)
+
+
+def test_none_and_unconfigured_changes_are_significant() -> None:
+    """Transitions to or from None, and keys without thresholds, always pass."""
+    assert Deadband(absolute=1).is_significant(None, 5)
+    assert Deadband(absolute=1).is_significant(5, None)
+    assert Deadband().is_significant(1, 2)
+    assert not Deadband().is_significant(2, 2)
+
+
+def test_options_override_defaults() -> None:
+    """Per-key options are merged over the defaults."""
+    deadbands = build_deadbands(
+        {"a": {"absolute": 1}},
+        {"a": {"min_interval": 60}, "b": {"relative": 0.1}},
+    )
+    assert deadbands["a"] == Deadband(absolute=1, min_interval=60)
+    assert deadbands["b"] == Deadband(relative=0.1)
+
+
+async def test_sensor_skips_insignificant_writes(hass: HomeAssistant) -> None:
+    """Jitter below the deadband keeps the previous state and skips the write."""
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    desc = next(d for d in SENSOR_DESCRIPTIONS if d.key == "12VBatteryVoltage")
+    sensor = VoyahSensorEntity(coordinator, desc)
+    sensor.hass = hass
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+
+        coordinator.data = {**MOCK_CAR_DATA, "sensors_data": {"12VBatteryVoltage": 12.55}}
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 1
+        assert sensor.native_value == 12.5
+
+        coordinator.data = {**MOCK_CAR_DATA, "sensors_data": {"12VBatteryVoltage": 12.7}}
+        sensor._handle_coordinator_update()
+        assert mock_write.call_count == 2
+        assert sensor.native_value == 12.7
+
+
+async def test_sensor_defers_write_within_min_interval(hass: HomeAssistant) -> None:
+    """A significant change inside min_interval is scheduled rather than written."""
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    coordinator.deadbands = {"12VBatteryVoltage": Deadband(absolute=0.1, min_interval=300)}
+    desc = next(d for d in SENSOR_DESCRIPTIONS if d.key == "12VBatteryVoltage")
+    sensor = VoyahSensorEntity(coordinator, desc)
+    sensor.hass = hass
+
+    with patch.object(sensor, "async_write_ha_state") as mock_write:
+        sensor._handle_coordinator_update()
+        coordinator.data = {**MOCK_CAR_DATA, "sensors_data": {"12VBatteryVoltage": 13.0}}
+        sensor._handle_coordinator_update()
+
+        assert mock_write.call_count == 1
+        assert sensor._cancel_pending is not None
+        sensor._async_cancel_pending()
@@ -5,14 +5,13 @@ from homeassistant.core import HomeAssistant
 
 from custom_components.voyah.device_tracker import VoyahDeviceTracker
 
-from .conftest import MOCK_CAR_DATA, MOCK_CONFIG_DATA, make_config_entry, make_coordinator
+from .conftest import MOCK_CAR_DATA, MOCK_CONFIG_DATA, make_coordinator
 
 
 async def test_tracker_returns_lat_lon(hass: HomeAssistant) -> None:
     """latitude and longitude come from position_data."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
 
     assert tracker.latitude == 55.7558
     assert tracker.longitude == 37.6176
@@ -21,16 +20,14 @@ async def test_tracker_returns_lat_lon(hass: HomeAssistant) -> None:
 async def test_tracker_source_type_is_gps(hass: HomeAssistant) -> None:
     """source_type is GPS."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
     assert tracker.source_type == SourceType.GPS
 
 
 async def test_tracker_accuracy_computed_from_hdop(hass: HomeAssistant) -> None:
     """location_accuracy = hdop * 5."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
     # MOCK_CAR_DATA has hdop=1.2 → int(1.2 * 5.0) = 6
     assert tracker.location_accuracy == 6
 
@@ -39,16 +36,14 @@ async def test_tracker_accuracy_zero_when_no_hdop(hass: HomeAssistant) -> None:
     """location_accuracy is 0 when hdop absent."""
     data = {**MOCK_CAR_DATA, "position_data": {"lat": 55.0, "lon": 37.0}}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
     assert tracker.location_accuracy == 0
 
 
 async def test_tracker_extra_state_attributes(hass: HomeAssistant) -> None:
     """Extra attributes include course, altitude, satellites, hdop."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
     attrs = tracker.extra_state_attributes
 
     assert attrs["course"] == 90
@@ -61,8 +56,7 @@ async def test_tracker_returns_none_when_position_missing(hass: HomeAssistant) -
     """lat/lon return None when position_data is empty."""
     data = {**MOCK_CAR_DATA, "position_data": {}}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
 
     assert tracker.latitude is None
     assert tracker.longitude is None
@@ -71,6 +65,42 @@ async def test_tracker_returns_none_when_position_missing(hass: HomeAssistant) -
 async def test_tracker_unique_id(hass: HomeAssistant) -> None:
     """Unique ID uses car_id + _location."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    tracker = VoyahDeviceTracker(coordinator, entry)
+    tracker = VoyahDeviceTracker(coordinator)
     assert tracker.unique_id == f"{MOCK_CONFIG_DATA['car_id']}_location"
+
+
+async def test_tracker_excludes_high_churn_attributes_from_recorder(hass: HomeAssistant) -> None:
+    """course/altitude/satellites/hdop are marked as unrecorded."""
+    assert VoyahDeviceTracker._unrecorded_attributes >= {"course", "altitude", "satellites", "hdop"}
+
+
+async def test_tracker_attributes_cached_until_position_changes(hass: HomeAssistant) -> None:
+    """The attribute dict is reused until one of its source fields changes."""
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    tracker = VoyahDeviceTracker(coordinator)
+    first = tracker.extra_state_attributes
+
+    coordinator.data = {**MOCK_CAR_DATA, "position_data": {**MOCK_CAR_DATA["position_data"], "lat": 56.0}}
+    tracker._update_attributes()
+    assert tracker.extra_state_attributes is first
+
+    coordinator.data = {**MOCK_CAR_DATA, "position_data": {**MOCK_CAR_DATA["position_data"], "sats": 11}}
+    tracker._update_attributes()
+    assert tracker.extra_state_attributes is not first
+    assert tracker.extra_state_attributes["satellites"] == 11
+
+
+async def test_tracker_skips_writes_for_attribute_churn_while_parked(hass: HomeAssistant) -> None:
+    """A parked car whose satellites/hdop flicker does not write; a move does."""
+    parked = {**MOCK_CAR_DATA["position_data"], "speed": 0}
+    coordinator = make_coordinator(hass, {**MOCK_CAR_DATA, "position_data": parked})
+    tracker = VoyahDeviceTracker(coordinator)
+    assert tracker._should_write()
+
+    coordinator.data = {**MOCK_CAR_DATA, "position_data": {**parked, "sats": 11, "hdop": 0.9}}
+    assert not tracker._should_write()
+    assert tracker.extra_state_attributes["satellites"] == 11
+
+    coordinator.data = {**MOCK_CAR_DATA, "position_data": {**parked, "lat": 55.8, "speed": 40}}
+    assert tracker._should_write()
+    assert tracker.latitude == 55.8
@@ -0,0 +1,121 @@
+"""Tests for the Voyah fleet index and aggregates."""
+
+import random
+from unittest.mock import patch
+
+from custom_components.voyah.fleet import MAX_RINGS, FleetAggregates, FleetCar, FleetContribution, FleetIndex
+from custom_components.voyah.gps import haversine_m
+
+
+def _car(car_id: str, lat: float, lon: float, battery: float = 80, charging: bool = False) -> FleetCar:
+    return FleetCar(car_id, car_id, lat, lon, battery, charging, False)
+
+
+def test_nearest_matches_brute_force() -> None:
+    """Ring search returns the same k nearest as a full scan."""
+    rng = random.Random(1)
+    index = FleetIndex()
+    cars = [_car(str(i), 55 + rng.uniform(-2, 2), 37 + rng.uniform(-3, 3)) for i in range(300)]
+    for car in cars:
+        index.update(car)
+
+    for _ in range(20):
+        lat, lon = 55 + rng.uniform(-3, 3), 37 + rng.uniform(-4, 4)
+        expected = sorted(cars, key=lambda car: haversine_m(lat, lon, car.lat, car.lon))[:5]
+        assert [car.car_id for _, car in index.nearest(lat, lon, 5)] == [car.car_id for car in expected]
+
+
+def test_nearest_applies_filters_and_moves() -> None:
+    """Filters skip cars; updates move cars between cells; removed cars vanish."""
+    index = FleetIndex()
+    index.update(_car("low", 55.0, 37.0, battery=10))
+    index.update(_car("charging", 55.01, 37.0, charging=True))
+    index.update(_car("far", 56.0, 37.0))
+
+    result = index.nearest(55.0, 37.0, 1, lambda car: car.battery >= 50 and not car.charging)
+    assert [car.car_id for _, car in result] == ["far"]
+
+    index.update(_car("far", 55.02, 37.0))
+    index.remove("low")
+    assert [car.car_id for _, car in index.nearest(55.0, 37.0, 5)] == ["charging", "far"]
+
+
+def test_nearest_far_apart_cars_falls_back_to_a_scan() -> None:
+    """Cars thousands of kilometres apart are found without walking rings to them."""
+    index = FleetIndex()
+    index.update(_car("moscow", 55.75, 37.62))
+    index.update(_car("vladivostok", 43.12, 131.89))
+
+    with patch.object(FleetIndex, "_ring_cells", wraps=FleetIndex._ring_cells) as ring_cells:
+        result = index.nearest(55.75, 37.6, 2)
+
+    assert [car.car_id for _, car in result] == ["moscow", "vladivostok"]
+    assert ring_cells.call_count <= MAX_RINGS + 1
+
+
+def test_nearest_wraps_at_the_antimeridian() -> None:
+    """A car just across ±180° longitude is in a neighbouring cell."""
+    index = FleetIndex()
+    index.update(_car("east", 65.0, 179.97))
+    index.update(_car("west", 65.0, -179.5))
+
+    ((distance, car),) = index.nearest(65.0, -179.97, 1)
+
+    assert car.car_id == "east"
+    assert distance < 3000
+
+
+def test_aggregates_follow_car_deltas() -> None:
+    """Totals track replaced and removed contributions without recomputing."""
+    aggregates = FleetAggregates()
+    calls = []
+    aggregates.async_add_listener(lambda: calls.append(1))
+
+    aggregates.update("a", FleetContribution.from_data({"sensors_data": {"batteryPercentage": 80, "odometer": 1000}}))
+    aggregates.update(
+        "b",
+        FleetContribution.from_data(
+            {"sensors_data": {"batteryPercentage": 40, "odometer": 500, "chargingStatus": 1}, "openings": 0b10010}
+        ),
+    )
+    assert (aggregates.cars, aggregates.charging, aggregates.doors_open) == (2, 1, 1)
+    assert aggregates.average_battery == 60
+    assert aggregates.total_odometer == 1500
+
+    aggregates.update("b", FleetContribution.from_data({"sensors_data": {"batteryPercentage": 50, "odometer": 510}}))
+    assert (aggregates.charging, aggregates.doors_open, aggregates.average_battery) == (0, 0, 65)
+
+    calls.clear()
+    aggregates.update("b", FleetContribution.from_data({"sensors_data": {"batteryPercentage": 50, "odometer": 510}}))
+    assert calls == []
+
+    aggregates.remove("a")
+    assert (aggregates.cars, aggregates.average_battery, aggregates.total_odometer) == (1, 50, 510)
+    assert calls == [1]
+
+
+def test_fleet_sensors_move_to_another_entry_when_the_owner_unloads() -> None:
+    """The first offer owns the sensors; withdrawing it hands them to the next entry."""
+    aggregates = FleetAggregates()
+    added: list[str] = []
+    withdraw_a = aggregates.async_offer_owner("a", lambda: added.append("a"))
+    withdraw_b = aggregates.async_offer_owner("b", lambda: added.append("b"))
+    assert aggregates.owner_entry_id == "a"
+    assert added == ["a"]
+
+    withdraw_a()
+    assert aggregates.owner_entry_id == "b"
+    assert added == ["a", "b"]
+
+    aggregates.async_offer_owner("a", lambda: added.append("a"))
+    assert added == ["a", "b"]
+
+    withdraw_b()
+    assert aggregates.owner_entry_id == "a"
+    assert added == ["a", "b", "a"]
+
+
+def test_only_doors_count_as_a_door_open() -> None:
+    """An open trunk or hatch alone does not count the car as having a door open."""
+    assert not FleetContribution.from_data({"openings": 0b110000}).doors_open
+    assert FleetContribution.from_data({"openings": 0b001000}).doors_open
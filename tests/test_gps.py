@@ -0,0 +1,78 @@
+"""Tests for Voyah GPS helpers."""
+
+import pytest
+
+from custom_components.voyah.gps import MotionEstimator, PositionFilter, derive_motion, haversine_m, initial_bearing
+
+# ~1 m of latitude in degrees
+M = 1 / 111_195
+
+
+def test_haversine_known_distance() -> None:
+    """One degree of latitude is ~111.2 km."""
+    assert haversine_m(55.0, 37.0, 56.0, 37.0) == pytest.approx(111_195, rel=1e-3)
+    assert haversine_m(55.0, 37.0, 55.0, 37.0) == 0
+
+
+def test_filter_locks_position_while_parked() -> None:
+    """Sub-accuracy drift while stationary keeps the reported position."""
+    position_filter = PositionFilter()
+    first = position_filter.update(55.0, 37.0, 6.0, 0)
+
+    for offset in (2, -3, 4, -1, 3):
+        reported = position_filter.update(55.0 + offset * M, 37.0, 6.0, 0)
+        assert reported is first
+
+
+def test_filter_passes_real_motion_immediately() -> None:
+    """A moving fix or a jump beyond accuracy is reported as is."""
+    position_filter = PositionFilter()
+    position_filter.update(55.0, 37.0, 6.0, 0)
+
+    moving = position_filter.update(55.0 + 2 * M, 37.0, 6.0, 30)
+    assert moving.lat == 55.0 + 2 * M
+
+    jumped = position_filter.update(55.0 + 50 * M, 37.0, 6.0, 0)
+    assert jumped.lat == 55.0 + 50 * M
+
+
+def test_filter_relocks_after_outlier_first_fix() -> None:
+    """A consistently offset estimate moves the lock off a bad first fix."""
+    position_filter = PositionFilter()
+    position_filter.update(55.0, 37.0, 10.0, 0)
+
+    for _ in range(20):
+        reported = position_filter.update(55.0 + 8 * M, 37.0, 10.0, 0)
+
+    assert haversine_m(reported.lat, reported.lon, 55.0 + 8 * M, 37.0) < 5
+
+
+def test_filter_ignores_missing_fix() -> None:
+    """Missing coordinates keep the previous output."""
+    position_filter = PositionFilter()
+    assert position_filter.update(None, None, None, None) is None
+    first = position_filter.update(55.0, 37.0, None, None)
+    assert position_filter.update(None, 37.0, None, None) is first
+
+
+def test_initial_bearing_cardinal_directions() -> None:
+    """Due north is 0°, due east is 90°."""
+    assert initial_bearing(55.0, 37.0, 56.0, 37.0) == pytest.approx(0)
+    assert initial_bearing(0.0, 37.0, 0.0, 38.0) == pytest.approx(90)
+
+
+def test_derive_motion_batch() -> None:
+    """Batch derivation yields one (speed, bearing) per fix."""
+    fixes = [(55.0, 37.0, 0), (55.0 + 1000 * M, 37.0, 60), (55.0 + 1000 * M, 37.0, 120)]
+
+    assert derive_motion(fixes) == [(None, None), (60.0, 0), (0.0, None)]
+    assert derive_motion([]) == []
+
+
+def test_motion_estimator_per_poll() -> None:
+    """The estimator reuses the last result for stale reports and keeps heading when stopped."""
+    estimator = MotionEstimator()
+    assert estimator.update(55.0, 37.0, 0) == (None, None)
+    assert estimator.update(55.0 + 500 * M, 37.0, 30) == (60.0, 0)
+    assert estimator.update(55.0 + 500 * M, 37.0, 30) == (60.0, 0)
+    assert estimator.update(55.0 + 500 * M, 37.0, 90) == (0.0, 0)
@@ -0,0 +1,179 @@
+"""Tests for Voyah entry setup."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.voyah import _platforms_with_data
+from custom_components.voyah.api import VoyahApiConnectionError
+from custom_components.voyah.const import DEFAULT_SCAN_INTERVAL, DOMAIN
+
+from .conftest import MOCK_ACCESS_TOKEN, MOCK_CAR_DATA, MOCK_PHONE, MOCK_REFRESH_TOKEN
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations in tests."""
+    return
+
+
+def test_platforms_follow_available_data() -> None:
+    """Binary sensors and the tracker are only set up once the car reports them."""
+    assert _platforms_with_data({}) == {Platform.SENSOR, Platform.BUTTON}
+    assert _platforms_with_data({"sensors_data": {"batteryPercentage": 80}}) == {Platform.SENSOR, Platform.BUTTON}
+    assert _platforms_with_data(MOCK_CAR_DATA) == {
+        Platform.SENSOR,
+        Platform.BUTTON,
+        Platform.BINARY_SENSOR,
+        Platform.DEVICE_TRACKER,
+    }
+
+
+def test_platforms_for_composite_member_only() -> None:
+    """A heating key alone is enough for the composite binary sensor."""
+    assert Platform.BINARY_SENSOR in _platforms_with_data({"sensors_data": {"mirrorsHeatingStatus": 0}})
+
+
+async def test_account_entry_shares_one_client(hass: HomeAssistant) -> None:
+    """Every car of an account entry becomes a device polled through one client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            "phone": MOCK_PHONE,
+            "access_token": MOCK_ACCESS_TOKEN,
+            "refresh_token": MOCK_REFRESH_TOKEN,
+            "cars": {"car-1": "Free", "car-2": "Dream"},
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.voyah.VoyahApiClient.async_get_car_data", AsyncMock(return_value=MOCK_CAR_DATA)
+    ) as get:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    account = hass.data[DOMAIN][entry.entry_id]
+    assert set(account.coordinators) == {"car-1", "car-2"}
+    assert {id(coordinator.client) for coordinator in account.coordinators.values()} == {id(account.client)}
+    assert sorted(call.args[0] for call in get.call_args_list) == ["car-1", "car-2"]
+    assert hass.states.get("device_tracker.dream_location") is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert entry.entry_id not in hass.data[DOMAIN]
+
+
+async def test_switching_statistics_mode_reloads_the_entry(hass: HomeAssistant) -> None:
+    """Statistics mode is picked up through a reload; other options apply in place."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            "phone": MOCK_PHONE,
+            "access_token": MOCK_ACCESS_TOKEN,
+            "refresh_token": MOCK_REFRESH_TOKEN,
+            "cars": {"car-1": "Free"},
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.voyah.VoyahApiClient.async_get_car_data", AsyncMock(return_value=MOCK_CAR_DATA)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = hass.data[DOMAIN][entry.entry_id].coordinators["car-1"]
+
+        hass.config_entries.async_update_entry(entry, options={"scan_interval": 600})
+        await hass.async_block_till_done()
+        assert hass.data[DOMAIN][entry.entry_id].coordinators["car-1"] is coordinator
+
+        hass.config_entries.async_update_entry(entry, options={"scan_interval": 600, "statistics_mode": True})
+        await hass.async_block_till_done()
+
+    reloaded = hass.data[DOMAIN][entry.entry_id].coordinators["car-1"]
+    assert reloaded is not coordinator
+    assert reloaded.statistics is not None
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_car_that_fails_setup_keeps_polling_without_reloading_the_entry(hass: HomeAssistant) -> None:
+    """One car failing its first refresh leaves the others loaded; it joins on its own next poll."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            "phone": MOCK_PHONE,
+            "access_token": MOCK_ACCESS_TOKEN,
+            "refresh_token": MOCK_REFRESH_TOKEN,
+            "cars": {"car-1": "Free", "car-2": "Dream"},
+        },
+        options={"places_file": "places.geojson"},
+    )
+    entry.add_to_hass(hass)
+    offline = {"car-2"}
+
+    async def _get_car_data(car_id: str) -> dict:
+        if car_id in offline:
+            raise VoyahApiConnectionError("timeout")
+        return MOCK_CAR_DATA
+
+    with (
+        patch("custom_components.voyah.VoyahApiClient.async_get_car_data", side_effect=_get_car_data),
+        patch("custom_components.voyah.load_place_index", side_effect=OSError("missing")) as load_places,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert entry.state is ConfigEntryState.LOADED
+        assert load_places.call_count == 1
+        coordinators = hass.data[DOMAIN][entry.entry_id].coordinators
+        assert not coordinators["car-2"].last_update_success
+        assert hass.states.get("button.dream_start_heating").state == "unavailable"
+        assert hass.states.get("device_tracker.dream_location") is None
+
+        offline.clear()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1))
+        await hass.async_block_till_done()
+        assert hass.data[DOMAIN][entry.entry_id].coordinators is coordinators
+        assert coordinators["car-2"].last_update_success
+        assert hass.states.get("device_tracker.dream_location") is not None
+
+        offline.update({"car-1", "car-2"})
+        assert await hass.config_entries.async_reload(entry.entry_id) is False
+        assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_token_refresh_does_not_reapply_options(hass: HomeAssistant) -> None:
+    """Entry updates that only change data, such as new tokens, leave the coordinators alone."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            "phone": MOCK_PHONE,
+            "access_token": MOCK_ACCESS_TOKEN,
+            "refresh_token": MOCK_REFRESH_TOKEN,
+            "cars": {"car-1": "Free"},
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.voyah.VoyahApiClient.async_get_car_data", AsyncMock(return_value=MOCK_CAR_DATA)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinators["car-1"]
+
+    with patch.object(coordinator, "async_apply_options") as apply_options:
+        hass.config_entries.async_update_entry(entry, data={**entry.data, "access_token": "new"})
+        await hass.async_block_till_done()
+        apply_options.assert_not_called()
+
+        hass.config_entries.async_update_entry(entry, options={"scan_interval": 600})
+        await hass.async_block_till_done()
+        apply_options.assert_called_once()
+    assert await hass.config_entries.async_unload(entry.entry_id)
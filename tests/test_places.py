@@ -0,0 +1,107 @@
+"""Tests for Voyah offline reverse geocoding."""
+
+import json
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.voyah.places import PlaceIndex, load_place_index
+
+from .conftest import make_coordinator
+
+PLACES = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"name": "City"},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[37.0, 55.0], [38.0, 55.0], [38.0, 56.0], [37.0, 56.0], [37.0, 55.0]]],
+            },
+        },
+        {
+            "type": "Feature",
+            "properties": {"name": "Office", "radius": 200},
+            "geometry": {"type": "Point", "coordinates": [37.6176, 55.7558]},
+        },
+        {
+            "type": "Feature",
+            "properties": {"name": "Ring road"},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [[39.0, 55.0], [40.0, 55.0], [40.0, 56.0], [39.0, 56.0], [39.0, 55.0]],
+                    [[39.2, 55.2], [39.8, 55.2], [39.8, 55.8], [39.2, 55.8], [39.2, 55.2]],
+                ],
+            },
+        },
+        {"type": "Feature", "properties": {}, "geometry": {"type": "Point", "coordinates": [0, 0]}},
+    ],
+}
+
+
+def _write_places(tmp_path: Path) -> str:
+    path = tmp_path / "places.geojson"
+    path.write_text(json.dumps(PLACES), encoding="utf-8")
+    return str(path)
+
+
+def test_lookup_prefers_smallest_place(tmp_path: Path) -> None:
+    """A point place inside a polygon wins over the polygon."""
+    index = load_place_index(_write_places(tmp_path))
+
+    assert index.size == 3
+    assert index.lookup(55.7560, 37.6178) == "Office"
+    assert index.lookup(55.5, 37.2) == "City"
+    assert index.lookup(54.0, 37.5) is None
+
+
+def test_lookup_respects_polygon_holes(tmp_path: Path) -> None:
+    """Coordinates inside a hole are not inside the polygon."""
+    index = load_place_index(_write_places(tmp_path))
+
+    assert index.lookup(55.1, 39.1) == "Ring road"
+    assert index.lookup(55.5, 39.5) is None
+
+
+def test_malformed_features_are_skipped(tmp_path: Path, caplog) -> None:
+    """One bad feature is logged and skipped instead of failing the whole file."""
+    document = {
+        "type": "FeatureCollection",
+        "features": [
+            *PLACES["features"],
+            {
+                "properties": {"name": "Bad radius", "radius": "wide"},
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+            },
+            {"properties": {"name": "Short point"}, "geometry": {"type": "Point", "coordinates": [1]}},
+            {"properties": {"name": "Flat"}, "geometry": {"type": "Polygon", "coordinates": [[[1, 2], [3, 4]]]}},
+            {"properties": {"name": "Scalar ring"}, "geometry": {"type": "Polygon", "coordinates": [5]}},
+            "not a feature",
+        ],
+    }
+    path = tmp_path / "places.geojson"
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+    index = load_place_index(str(path))
+
+    assert index.size == 3
+    assert caplog.text.count("Skipping malformed feature") == 5
+
+
+def test_empty_index() -> None:
+    """An index without places resolves nothing."""
+    assert PlaceIndex([]).lookup(55.0, 37.0) is None
+
+
+async def test_coordinator_resolves_place(hass: HomeAssistant, tmp_path: Path) -> None:
+    """The coordinator keeps the last resolved place across fixes without a position."""
+    coordinator = make_coordinator(hass, {})
+    coordinator.places = load_place_index(_write_places(tmp_path))
+
+    coordinator._process_snapshot({"sensors_data": {}, "position_data": {"lat": 55.7558, "lon": 37.6176}})
+    assert coordinator.place == "Office"
+
+    coordinator._process_snapshot({"sensors_data": {}, "position_data": {}})
+    assert coordinator.place == "Office"
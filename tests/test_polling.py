@@ -0,0 +1,148 @@
+"""Tests for the Voyah polling policy."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.voyah.polling import PollingPolicy, PollingSchedule, SleepBackoff
+
+from .conftest import MOCK_CAR_DATA, make_coordinator
+
+PARKED = {"sensors_data": {"ignitionStatus": 0, "chargingStatus": 0}}
+DRIVING = {"sensors_data": {"ignitionStatus": 1, "chargingStatus": 0}}
+CHARGING = {"sensors_data": {"ignitionStatus": 0, "chargingStatus": 1}}
+# 2024-01-01 is a Monday.
+MONDAY = datetime(2024, 1, 1)
+
+
+def test_active_cars_use_the_active_interval() -> None:
+    """Driving and charging cars are polled at the active interval."""
+    policy = PollingPolicy(interval=300, active_interval=30)
+
+    assert policy.interval_for(PARKED) == timedelta(seconds=300)
+    assert policy.interval_for(DRIVING) == timedelta(seconds=30)
+    assert policy.interval_for(CHARGING) == timedelta(seconds=30)
+    assert policy.interval_for(None) == timedelta(seconds=300)
+
+
+def test_rate_budget_is_shared_by_the_entry_cars() -> None:
+    """A budget of 360 requests per hour over 4 cars allows one poll per car every 40 s."""
+    policy = PollingPolicy(interval=300, active_interval=10, rate_budget=360, cars=4)
+
+    assert policy.interval_for(DRIVING) == timedelta(seconds=40)
+    assert policy.interval_for(PARKED) == timedelta(seconds=300)
+
+
+def test_schedule_lookup_wraps_the_week_and_first_match_wins() -> None:
+    """Windows are looked up per minute; the first listed window wins where they overlap."""
+    schedule = PollingSchedule.from_options(
+        [
+            {"cron": "* 0-5 * * *", "interval": 1800},
+            {"cron": "* 0-7 * * 1-5", "interval": 600},
+            {"cron": "*/30 22-23 * * 0", "interval": 900},
+        ]
+    )
+
+    assert schedule.lookup(MONDAY.replace(hour=5, minute=59, second=30)) == (1800, 30.0, 600)
+    assert schedule.lookup(MONDAY.replace(hour=7, minute=59)) == (600, 60.0, None)
+    assert schedule.lookup(MONDAY.replace(hour=12)) == (None, 12 * 3600.0, 1800)
+    # Sunday 23:30 reaches Monday 00:00 across the end of the week.
+    assert schedule.lookup(datetime(2024, 1, 7, 23, 30)) == (900, 60.0, None)
+    assert schedule.lookup(datetime(2024, 1, 7, 23, 59)) == (None, 60.0, 1800)
+
+
+@pytest.mark.parametrize(
+    "windows",
+    [
+        [{"cron": "0 25 * * *", "interval": 60}],
+        [{"cron": "0 1 1 * *", "interval": 60}],
+        [{"cron": "0 1 * *", "interval": 60}],
+        [{"cron": "0 1 * * *", "interval": 5}],
+        [{"cron": "0 1 * * *"}],
+    ],
+)
+def test_invalid_schedules_are_rejected(windows: list) -> None:
+    """Out-of-range fields, day-of-month or month restrictions and short intervals raise ValueError."""
+    with pytest.raises(ValueError):
+        PollingSchedule.from_options(windows)
+
+
+def test_schedule_sets_the_parked_interval() -> None:
+    """Parked cars use the window in force and wake up for a shorter one; active cars ignore it."""
+    schedule = PollingSchedule.from_options(
+        [{"cron": "* 0-5 * * *", "interval": 1800}, {"cron": "* 8-9 * * 1-5", "interval": 60}]
+    )
+    policy = PollingPolicy(interval=300, active_interval=30, schedule=schedule)
+
+    assert policy.interval_for(PARKED, now=MONDAY.replace(hour=2)) == timedelta(seconds=1800)
+    assert policy.interval_for(PARKED, now=MONDAY.replace(hour=5, minute=50)) == timedelta(seconds=600)
+    assert policy.interval_for(PARKED, now=MONDAY.replace(hour=7, minute=58)) == timedelta(seconds=120)
+    assert policy.interval_for(PARKED, now=MONDAY.replace(hour=12)) == timedelta(seconds=300)
+    assert policy.interval_for(DRIVING, now=MONDAY.replace(hour=2)) == timedelta(seconds=30)
+    assert policy.interval_for(PARKED, boost=20, now=MONDAY.replace(hour=2)) == timedelta(seconds=20)
+
+
+def test_sleep_backoff_rises_with_last_ping_and_resets_on_wake_up() -> None:
+    """A growing last_ping past the threshold backs off; a new ping or an active car resets it."""
+    backoff = SleepBackoff()
+
+    def level(last_ping: float | None, data: dict = PARKED) -> int:
+        return backoff.update({**data, "last_ping": last_ping})
+
+    assert level(700) == 0
+    assert level(1000) == 1
+    assert level(1600) == 2
+    assert [level(1600 + 600 * step) for step in range(1, 8)] == [3, 4, 5, 6, 6, 6, 6]
+    assert level(5) == 0
+    assert level(300) == 0  # pings still arrive often enough
+    assert level(900) == 1
+    assert level(1200, DRIVING) == 0
+    assert level(1500) == 1
+    assert level(None) == 0
+
+
+def test_backoff_stretches_the_parked_interval_up_to_the_cap() -> None:
+    """Each level doubles the parked interval up to an hour; active cars and boosts are unaffected."""
+    policy = PollingPolicy(interval=300, active_interval=30)
+
+    assert policy.interval_for(PARKED, backoff=1) == timedelta(seconds=600)
+    assert policy.interval_for(PARKED, backoff=3) == timedelta(seconds=2400)
+    assert policy.interval_for(PARKED, backoff=6) == timedelta(seconds=3600)
+    assert policy.interval_for(DRIVING, backoff=6) == timedelta(seconds=30)
+    assert policy.interval_for(PARKED, boost=60, backoff=6) == timedelta(seconds=60)
+    assert PollingPolicy(interval=7200).interval_for(PARKED, backoff=2) == timedelta(seconds=7200)
+
+
+async def test_coordinator_backs_off_while_the_car_sleeps(hass: HomeAssistant) -> None:
+    """The coordinator polls less often as last_ping grows and returns to normal on wake-up."""
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    asleep = {**MOCK_CAR_DATA, "sensors_data": PARKED["sensors_data"]}
+
+    intervals = []
+    for last_ping in (800, 1100, 1700, 5):
+        coordinator.client.async_get_car_data = AsyncMock(return_value={**asleep, "last_ping": last_ping})
+        await coordinator._async_update_data()
+        intervals.append(coordinator.update_interval.total_seconds())
+
+    assert intervals == [60, 120, 240, 60]
+    assert coordinator.sleep.level == 0
+    await coordinator.async_shutdown()
+
+
+async def test_options_apply_to_running_coordinator(hass: HomeAssistant) -> None:
+    """Changed options replace the policy and deadbands without a reload."""
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    entry = coordinator._entry
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={"scan_interval": 600, "active_scan_interval": 20, "deadbands": {"speed": {"absolute": 5}}},
+    )
+    coordinator.async_apply_options()
+
+    assert coordinator.policy == PollingPolicy(interval=600, active_interval=20)
+    assert coordinator.update_interval == timedelta(seconds=600)
+    assert coordinator.deadbands["speed"].absolute == 5
+    await coordinator.async_shutdown()
@@ -0,0 +1,129 @@
+"""Tests for Voyah route recording and export."""
+
+import json
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import flush_store
+
+from custom_components.voyah.route import (
+    RouteSimplifier,
+    RouteTrack,
+    VoyahRouteLog,
+    decode_polyline,
+    douglas_peucker,
+    encode_polyline,
+    iter_geojson,
+    iter_gpx,
+    prune_exports,
+    write_export,
+)
+
+
+def test_polyline_roundtrip() -> None:
+    """Encoded tracks decode back to the same points at 1e-5 precision."""
+    points = [(55.75580, 37.61760, 1700000000), (55.75612, 37.61801, 1700000060), (55.7, 37.5, 1700000120)]
+    decoded = list(decode_polyline(encode_polyline(points)))
+
+    assert [(round(lat, 5), round(lon, 5), t) for lat, lon, t in decoded] == points
+
+
+def test_douglas_peucker_drops_collinear_points() -> None:
+    """Points on a straight line collapse to the endpoints; corners stay."""
+    straight = [(55.0 + i * 0.001, 37.0, i) for i in range(10)]
+    assert douglas_peucker(straight, 5.0) == [straight[0], straight[-1]]
+
+    corner = [(55.0, 37.0, 0), (55.01, 37.0, 1), (55.01, 37.01, 2)]
+    assert douglas_peucker(corner, 5.0) == corner
+
+
+def test_simplifier_bounds_buffer_and_keeps_chunks_connected() -> None:
+    """The online simplifier flushes in chunks without duplicating joints."""
+    simplifier = RouteSimplifier(epsilon=5.0, buffer_points=4)
+    for i in range(10):
+        simplifier.add((55.0 + i * 0.001, 37.0, i))
+        assert simplifier.raw_buffered < 4
+
+    points = simplifier.finish()
+    assert points[0] == (55.0, 37.0, 0)
+    assert points[-1][2] == 9
+    assert len(points) == len(set(points))
+
+
+async def test_route_log_records_track_per_ignition_cycle(hass: HomeAssistant) -> None:
+    """A track is closed and stored when ignition turns off."""
+    log = VoyahRouteLog(hass, "car")
+    for i, ignition in enumerate((1, 1, 1, 0)):
+        log.process(
+            {
+                "sensors_data": {"ignitionStatus": ignition},
+                "position_data": {"lat": 55.0 + i * 0.01, "lon": 37.0 + (i % 2) * 0.01},
+                "time": 1000 + i * 60,
+            },
+            0,
+        )
+
+    assert len(log.tracks) == 1
+    assert (log.tracks[0].start_time, log.tracks[0].end_time) == (1000, 1180)
+    assert log.query(1100, None) == log.tracks
+    assert log.query(None, 900) == []
+
+
+@pytest.mark.parametrize("writer", [iter_gpx, iter_geojson])
+def test_export_writes_file(tmp_path, writer) -> None:
+    """GPX and GeoJSON exports are streamed to disk."""
+    track = RouteTrack(1000, 1060, encode_polyline([(55.0, 37.0, 1000), (55.01, 37.01, 1060)]))
+    path = str(tmp_path / "out" / "route")
+
+    written, size = write_export(path, writer([track, track], "car"))
+
+    assert written == path
+    content = (tmp_path / "out" / "route").read_text()
+    assert size == len(content)
+    if writer is iter_geojson:
+        assert len(json.loads(content)["features"]) == 2
+    else:
+        assert content.count("<trkpt") == 4
+
+
+async def test_route_log_restores_the_open_track(hass: HomeAssistant) -> None:
+    """A restart mid-trip keeps the fixes recorded so far."""
+    log = VoyahRouteLog(hass, "car")
+    for i in range(3):
+        log.process(
+            {"sensors_data": {"ignitionStatus": 1}, "position_data": {"lat": 55.0 + i * 0.01, "lon": 37.0}},
+            1000 + i * 60,
+        )
+    await flush_store(log._store)
+
+    restored = VoyahRouteLog(hass, "car")
+    await restored.async_load()
+    restored.process({"sensors_data": {"ignitionStatus": 0}, "position_data": {"lat": 55.03, "lon": 37.0}}, 1180)
+
+    assert len(restored.tracks) == 1
+    assert (restored.tracks[0].start_time, restored.tracks[0].end_time) == (1000, 1180)
+
+
+def test_gpx_escapes_the_track_name() -> None:
+    """Markup in the car name does not break the GPX document."""
+    track = RouteTrack(1000, 1060, encode_polyline([(55.0, 37.0, 1000), (55.01, 37.01, 1060)]))
+    content = "".join(iter_gpx([track], "Free <R&D>"))
+    assert "<name>Free &lt;R&amp;D&gt; " in content
+
+
+def test_prune_exports_keeps_the_newest_per_car(tmp_path) -> None:
+    """Only the newest exports of the car are kept; other cars and files are untouched."""
+    for second in range(5):
+        (tmp_path / f"car_2026010100000{second}.gpx").write_text("")
+    (tmp_path / "car_20260101000004-1.gpx").write_text("")
+    (tmp_path / "car_2_20260101000000.gpx").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+
+    prune_exports(str(tmp_path), "car", keep=2)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "car_20260101000004-1.gpx",
+        "car_20260101000004.gpx",
+        "car_2_20260101000000.gpx",
+        "notes.txt",
+    ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 from homeassistant.core import HomeAssistant
@@ -14,9 +14,10 @@ from custom_components.voyah.sensor import (
     VoyahChargingEndTimeSensor,
     VoyahLastPingSensor,
     VoyahSensorEntity,
+    async_setup_entry,
 )
 
-from .conftest import MOCK_CAR_DATA, make_config_entry, make_coordinator
+from .conftest import MOCK_CAR_DATA, MOCK_CAR_ID, make_coordinator, register_account
 
 # ── VoyahSensorEntity ────────────────────────────────────────────────────────
 
@@ -24,9 +25,8 @@ from .conftest import MOCK_CAR_DATA, make_config_entry, make_coordinator
 async def test_sensor_returns_value(hass: HomeAssistant) -> None:
     """Sensor reads value from coordinator data."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
     desc = next(d for d in SENSOR_DESCRIPTIONS if d.key == "batteryPercentage")
-    sensor = VoyahSensorEntity(coordinator, desc, entry)
+    sensor = VoyahSensorEntity(coordinator, desc)
     assert sensor.native_value == 80
 
 
@@ -34,35 +34,32 @@ async def test_sensor_returns_none_for_missing_key(hass: HomeAssistant) -> None:
     """Sensor returns None when key absent from data."""
     data = {**MOCK_CAR_DATA, "sensors_data": {}}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
     desc = next(d for d in SENSOR_DESCRIPTIONS if d.key == "batteryPercentage")
-    sensor = VoyahSensorEntity(coordinator, desc, entry)
+    sensor = VoyahSensorEntity(coordinator, desc)
     assert sensor.native_value is None
 
 
 async def test_inboard_temp_sensor_returns_value(hass: HomeAssistant) -> None:
     """inBoardTemp sensor reads value from coordinator sensors_data."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
     desc = next(d for d in SENSOR_DESCRIPTIONS if d.key == "inBoardTemp")
-    sensor = VoyahSensorEntity(coordinator, desc, entry)
+    sensor = VoyahSensorEntity(coordinator, desc)
     assert sensor.native_value == 22
 
 
 async def test_last_ping_sensor_returns_value(hass: HomeAssistant) -> None:
     """VoyahLastPingSensor reads last_ping from coordinator data."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahLastPingSensor(coordinator, entry)
+    sensor = VoyahLastPingSensor(coordinator)
     assert sensor.native_value == 6.614
+    assert sensor.extra_state_attributes == {"backoff_level": 0}
 
 
 async def test_last_ping_sensor_returns_none_when_missing(hass: HomeAssistant) -> None:
     """VoyahLastPingSensor returns None when last_ping is absent from data."""
     data = {k: v for k, v in MOCK_CAR_DATA.items() if k != "last_ping"}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahLastPingSensor(coordinator, entry)
+    sensor = VoyahLastPingSensor(coordinator)
     assert sensor.native_value is None
 
 
@@ -76,8 +73,7 @@ async def test_charging_sensor_not_charging_on_init(hass: HomeAssistant) -> None
         "sensors_data": {**MOCK_CAR_DATA["sensors_data"], "chargingStatus": 0},
     }
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
 
     assert sensor.native_value is None
     assert sensor._was_charging is False
@@ -91,8 +87,7 @@ async def test_charging_sensor_seeds_history_on_init_if_charging(hass: HomeAssis
         "time": 1000,
     }
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
 
     assert sensor._was_charging is True
     assert len(sensor._pct_history) == 1
@@ -105,8 +100,7 @@ async def test_charging_sensor_seeds_history_on_init_if_charging(hass: HomeAssis
 async def test_compute_end_time_returns_none_with_one_point(hass: HomeAssistant) -> None:
     """No estimate with only one data point."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._pct_history.append((50, 1000))
 
     assert sensor._compute_end_time() is None
@@ -115,8 +109,7 @@ async def test_compute_end_time_returns_none_with_one_point(hass: HomeAssistant)
 async def test_compute_end_time_returns_none_at_100_pct(hass: HomeAssistant) -> None:
     """No estimate when already at 100%."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._pct_history.append((99, 1000))
     sensor._pct_history.append((100, 2000))
 
@@ -126,8 +119,7 @@ async def test_compute_end_time_returns_none_at_100_pct(hass: HomeAssistant) ->
 async def test_compute_end_time_returns_none_when_rate_zero(hass: HomeAssistant) -> None:
     """No estimate when percentage did not change (rate = 0)."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._pct_history.append((50, 1000))
     sensor._pct_history.append((50, 2000))  # same pct
 
@@ -137,8 +129,7 @@ async def test_compute_end_time_returns_none_when_rate_zero(hass: HomeAssistant)
 async def test_compute_end_time_returns_none_when_delta_time_zero(hass: HomeAssistant) -> None:
     """No estimate when timestamps are identical."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._pct_history.append((50, 1000))
     sensor._pct_history.append((60, 1000))  # same timestamp
 
@@ -148,8 +139,7 @@ async def test_compute_end_time_returns_none_when_delta_time_zero(hass: HomeAssi
 async def test_compute_end_time_returns_none_when_rate_negative(hass: HomeAssistant) -> None:
     """No estimate when percentage decreased (discharging)."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._pct_history.append((60, 1000))
     sensor._pct_history.append((55, 2000))  # dropped
 
@@ -159,13 +149,12 @@ async def test_compute_end_time_returns_none_when_rate_negative(hass: HomeAssist
 async def test_compute_end_time_happy_path(hass: HomeAssistant) -> None:
     """Returns the correct future datetime when charging at a steady rate."""
     coordinator = make_coordinator(hass, MOCK_CAR_DATA)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     # 1% per 100 seconds → 40% remaining → exactly 4000 seconds to go
     sensor._pct_history.append((59, 0))
     sensor._pct_history.append((60, 100))
 
-    frozen_now = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+    frozen_now = datetime(2024, 6, 1, 12, 0, 0, tzinfo=UTC)
     with time_machine.travel(frozen_now, tick=False):
         result = sensor._compute_end_time()
 
@@ -183,8 +172,7 @@ async def test_update_starts_tracking_when_charging_begins(hass: HomeAssistant)
         "time": 1000,
     }
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     assert sensor._was_charging is False
 
     coordinator.data = {
@@ -207,8 +195,7 @@ async def test_update_resets_tracking_when_charging_stops(hass: HomeAssistant) -
         "time": 1000,
     }
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._was_charging = True
     sensor._pct_history.append((70, 1000))
 
@@ -232,8 +219,7 @@ async def test_update_adds_point_and_recalculates_on_pct_change(hass: HomeAssist
         "time": 1000,
     }
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     # Clear history seeded by _init_tracking to start fresh
     sensor._pct_history.clear()
     sensor._was_charging = True
@@ -262,11 +248,10 @@ async def test_update_skips_recalculation_when_pct_unchanged(hass: HomeAssistant
         "time": 1000,
     }
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._was_charging = True
     sensor._last_seen_pct = 50
-    sentinel = datetime(2099, 1, 1, tzinfo=timezone.utc)
+    sentinel = datetime(2099, 1, 1, tzinfo=UTC)
     sensor._cached_end_time = sentinel
 
     coordinator.data = {**data, "time": 2000}  # same pct=50
@@ -281,8 +266,7 @@ async def test_sliding_window_limited_to_max_points(hass: HomeAssistant) -> None
     base_sensors = {**MOCK_CAR_DATA["sensors_data"], "chargingStatus": 1}
     data = {**MOCK_CAR_DATA, "sensors_data": base_sensors, "time": 0}
     coordinator = make_coordinator(hass, data)
-    entry = make_config_entry(hass)
-    sensor = VoyahChargingEndTimeSensor(coordinator, entry)
+    sensor = VoyahChargingEndTimeSensor(coordinator)
     sensor._pct_history.clear()
     sensor._was_charging = True
 
@@ -298,3 +282,81 @@ async def test_sliding_window_limited_to_max_points(hass: HomeAssistant) -> None
             sensor._handle_coordinator_update()
 
     assert len(sensor._pct_history) == RATE_WINDOW_POINTS
+
+
+# ── Dynamic entity creation ──────────────────────────────────────────────────
+
+
+async def test_setup_adds_entities_for_keys_appearing_later(hass: HomeAssistant) -> None:
+    """Keys missing from the first snapshot get entities when they show up."""
+    coordinator = make_coordinator(hass, {"sensors_data": {"batteryPercentage": 80}})
+    entry = coordinator._entry
+    register_account(hass, coordinator)
+    added: list[list] = []
+
+    await async_setup_entry(hass, entry, lambda entities: added.append(list(entities)))
+    assert [entity.unique_id for entity in added[0] if entity.unique_id.startswith(MOCK_CAR_ID)] == [
+        f"{MOCK_CAR_ID}_batteryPercentage"
+    ]
+
+    coordinator.data = {"sensors_data": {"batteryPercentage": 80, "tirePressureFL": 2.3, "newKey": 1}}
+    coordinator.async_update_listeners()
+    assert [entity.unique_id for entity in added[-1]] == [f"{MOCK_CAR_ID}_tirePressureFL", f"{MOCK_CAR_ID}_raw_newKey"]
+    assert added[-1][1].entity_registry_enabled_default is False
+
+    count = len(added)
+    coordinator.data = {"sensors_data": {"batteryPercentage": 81, "tirePressureFL": 2.3}}
+    coordinator.async_update_listeners()
+    assert len(added) == count
+    await coordinator.async_shutdown()
+
+
+async def test_car_asleep_at_startup_gets_derived_sensors_on_wake(hass: HomeAssistant) -> None:
+    """Charging, trip, consumption and last-ping sensors follow once the car reports their keys."""
+    coordinator = make_coordinator(hass, {"sensors_data": {}})
+    entry = coordinator._entry
+    register_account(hass, coordinator)
+    added: list[list] = []
+
+    await async_setup_entry(hass, entry, lambda entities: added.append(list(entities)))
+    assert not [entity for entity in added[0] if entity.unique_id.startswith(MOCK_CAR_ID)]
+
+    coordinator.data = MOCK_CAR_DATA
+    coordinator.async_update_listeners()
+    unique_ids = {entity.unique_id for entity in added[-1]}
+    assert {
+        f"{MOCK_CAR_ID}_charging_end_time",
+        f"{MOCK_CAR_ID}_charging_location",
+        f"{MOCK_CAR_ID}_last_ping",
+        f"{MOCK_CAR_ID}_last_trip_distance",
+        f"{MOCK_CAR_ID}_consumption_rolling_pct_per_km",
+    } <= unique_ids
+
+    count = len(added)
+    coordinator.async_update_listeners()
+    assert len(added) == count
+    await coordinator.async_shutdown()
+
+
+async def test_battery_capacity_set_later_adds_kwh_sensors(hass: HomeAssistant) -> None:
+    """Setting a battery capacity in the options adds the kWh consumption sensors without a reload."""
+    coordinator = make_coordinator(hass, {"sensors_data": {"batteryPercentage": 80, "odometer": 1000}})
+    entry = coordinator._entry
+    register_account(hass, coordinator)
+    added: list[list] = []
+
+    await async_setup_entry(hass, entry, lambda entities: added.append(list(entities)))
+    assert not [entity for entity in added[0] if "kwh" in entity.unique_id]
+
+    hass.config_entries.async_update_entry(entry, options={"consumption_window": 50, "battery_capacity": 80})
+    coordinator.async_apply_options()
+
+    assert coordinator.consumption.window_km == 50
+    assert [entity.unique_id for entity in added[-1]] == [
+        f"{MOCK_CAR_ID}_consumption_rolling_kwh_per_100km",
+        f"{MOCK_CAR_ID}_consumption_trip_kwh_per_100km",
+    ]
+    count = len(added)
+    coordinator.async_apply_options()
+    assert len(added) == count
+    await coordinator.async_shutdown()
@@ -0,0 +1,165 @@
+"""Tests for Voyah services."""
+
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+import pytest
+import time_machine
+
+from custom_components.voyah.const import DOMAIN
+from custom_components.voyah.route import RouteTrack, encode_polyline
+from custom_components.voyah.services import async_setup_services
+from custom_components.voyah.trips import TripRecord
+
+from .conftest import MOCK_CAR_DATA, MOCK_CAR_ID, make_coordinator, register_account
+
+
+def _register(hass: HomeAssistant):
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    entry = coordinator._entry
+    register_account(hass, coordinator)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, MOCK_CAR_ID)},
+    )
+    async_setup_services(hass)
+    return coordinator, device
+
+
+async def test_get_trips_returns_records(hass: HomeAssistant) -> None:
+    """get_trips responds with the stored trips of the car."""
+    coordinator, device = _register(hass)
+    coordinator.trips.trips = [TripRecord(1700000000, 1700000600, 5.0, 60, 80, 78, 55.0, 37.0, 55.1, 37.1)]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_trips",
+        {"device_id": device.id},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert len(response["trips"]) == 1
+    assert response["trips"][0]["distance"] == 5.0
+    assert response["trips"][0]["soc_used"] == 2
+
+
+async def test_get_trips_rejects_unknown_device(hass: HomeAssistant) -> None:
+    """Unknown device ids raise a validation error."""
+    _register(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_trips",
+            {"device_id": "missing"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_get_charging_locations(hass: HomeAssistant) -> None:
+    """get_charging_locations lists learned clusters, most used first."""
+    coordinator, device = _register(hass)
+    clusterer = coordinator.chargers.clusterer
+    clusterer.add(55.8, 37.7, 1700000000)
+    clusterer.add(55.7558, 37.6176, 1700000100)
+    clusterer.add(55.7558, 37.6176, 1700000200)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_charging_locations",
+        {"device_id": device.id},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert [location["sessions"] for location in response["locations"]] == [2, 1]
+    assert response["locations"][1]["name"] == "Charger 1"
+
+
+async def test_find_nearest_cars(hass: HomeAssistant) -> None:
+    """find_nearest_cars answers from the fleet index fed by refreshes."""
+    coordinator, device = _register(hass)
+    coordinator._process_snapshot(
+        {
+            "sensors_data": {"batteryPercentage": 80, "chargingStatus": 0, "ignitionStatus": 0},
+            "position_data": {"lat": 55.7558, "lon": 37.6176},
+        }
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "find_nearest_cars",
+        {"latitude": 55.75, "longitude": 37.61, "min_battery": 50, "charging": False},
+        blocking=True,
+        return_response=True,
+    )
+    assert [car["device_id"] for car in response["cars"]] == [device.id]
+    assert 0 < response["cars"][0]["distance"] < 1000
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "find_nearest_cars",
+        {"latitude": 55.75, "longitude": 37.61, "min_battery": 90},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["cars"] == []
+
+
+async def test_boost_polling_overlapping_boosts_merge(hass: HomeAssistant) -> None:
+    """A second boost keeps the shorter interval and the later end."""
+    coordinator, device = _register(hass)
+    coordinator.client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
+
+    first = await hass.services.async_call(
+        DOMAIN,
+        "boost_polling",
+        {"device_id": device.id, "interval": 15, "duration": {"minutes": 30}},
+        blocking=True,
+        return_response=True,
+    )
+    second = await hass.services.async_call(
+        DOMAIN,
+        "boost_polling",
+        {"device_id": device.id, "interval": 30, "duration": {"minutes": 10}},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert first["interval"] == 15
+    assert second == first
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+    coordinator.boost_until = dt_util.utcnow() - timedelta(seconds=1)
+    await coordinator.async_refresh()
+    assert coordinator.boost_until is None
+    assert coordinator.update_interval == timedelta(seconds=60)
+    await coordinator.async_shutdown()
+
+
+async def test_export_route_names_tracks_after_the_car_and_keeps_both_files(hass: HomeAssistant, tmp_path) -> None:
+    """Tracks carry the car's name; two exports in the same second get separate files."""
+    hass.config.config_dir = str(tmp_path)
+    coordinator, device = _register(hass)
+    coordinator.routes.tracks = [RouteTrack(1000, 1060, encode_polyline([(55.0, 37.0, 1000), (55.01, 37.01, 1060)]))]
+
+    with time_machine.travel(dt_util.utcnow(), tick=False):
+        responses = [
+            await hass.services.async_call(
+                DOMAIN, "export_route", {"device_id": device.id, "format": "gpx"}, blocking=True, return_response=True
+            )
+            for _ in range(2)
+        ]
+
+    first, second = (response["path"] for response in responses)
+    assert first != second
+    assert second == first.replace(".gpx", "-1.gpx")
+    content = await hass.async_add_executor_job(Path(second).read_text, "utf-8")
+    assert f"<name>{coordinator.car_name} " in content
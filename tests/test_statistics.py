@@ -0,0 +1,99 @@
+"""Tests for Voyah external statistics aggregation."""
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.voyah.const import SENSOR_DESCRIPTIONS
+from custom_components.voyah.sensor import VoyahSensorEntity
+from custom_components.voyah.statistics import StatisticsAggregator, VoyahStatistics
+
+from .conftest import MOCK_CAR_DATA, make_coordinator
+
+
+def test_aggregator_closes_bucket_on_boundary() -> None:
+    """Samples within one bucket fold into mean/min/max; the next bucket closes it."""
+    aggregator = StatisticsAggregator(("speed",), bucket_seconds=3600)
+    aggregator.add_snapshot({"speed": 10}, 7200)
+    aggregator.add_snapshot({"speed": 30}, 7500)
+    assert aggregator.pop_closed() == {}
+
+    aggregator.add_snapshot({"speed": 50}, 10800)
+    closed = aggregator.pop_closed()
+
+    bucket = closed["speed"][0]
+    assert (bucket.start, bucket.mean, bucket.min, bucket.max) == (7200, 20, 10, 30)
+    assert aggregator.pop_closed() == {}
+
+
+def test_aggregator_skips_repeated_timestamps() -> None:
+    """A stale snapshot with an unchanged car time is not counted twice."""
+    aggregator = StatisticsAggregator(("speed",), bucket_seconds=3600)
+    aggregator.add_snapshot({"speed": 10}, 100)
+    aggregator.add_snapshot({"speed": 10}, 100)
+    aggregator.add_snapshot({"speed": 40}, 3700)
+
+    assert aggregator.pop_closed()["speed"][0].count == 1
+
+
+def test_aggregator_flush_closes_finished_hours() -> None:
+    """flush(now) closes buckets that ended by now; flush() closes every open bucket."""
+    aggregator = StatisticsAggregator(("speed", "outsideTemp"), bucket_seconds=3600)
+    aggregator.add_snapshot({"speed": 10}, 7200)
+    aggregator.add_snapshot({"outsideTemp": 5}, 10900)
+
+    aggregator.flush(10800)
+    assert {key: [b.start for b in buckets] for key, buckets in aggregator.pop_closed().items()} == {"speed": [7200]}
+
+    aggregator.flush()
+    assert aggregator.pop_closed()["outsideTemp"][0].start == 10800
+
+
+def test_aggregator_drops_samples_from_imported_hours() -> None:
+    """Late samples do not reopen an hour that was already closed."""
+    aggregator = StatisticsAggregator(("speed",), bucket_seconds=3600)
+    aggregator.add_snapshot({"speed": 10}, 7200)
+    aggregator.add_snapshot({"speed": 20}, 14400)
+    assert aggregator.pop_closed()["speed"][0].start == 7200
+
+    aggregator.add_snapshot({"speed": 99}, 7300)
+    aggregator.add_snapshot({"speed": 99}, 10900)
+    aggregator.flush()
+
+    bucket = aggregator.pop_closed()["speed"][0]
+    assert (bucket.start, bucket.count, bucket.max) == (14400, 1, 20)
+
+
+async def test_statistics_import_open_hours_on_the_clock_and_on_stop(hass: HomeAssistant) -> None:
+    """The hourly timer imports a sleeping car's last hour; stopping imports what is left."""
+    statistics = VoyahStatistics(hass, "car", "Voyah")
+    statistics.async_process({"sensors_data": {"speed": 10}, "time": 7200}, 7200)
+
+    with patch.object(statistics, "_async_import") as import_:
+        stop = statistics.async_start()
+        statistics._async_on_hour(dt_util.utc_from_timestamp(10800))
+        assert import_.call_args.args[0]["speed"][0].start == 7200
+
+        statistics.async_process({"sensors_data": {"speed": 20}, "time": 11000}, 11000)
+        stop()
+        assert import_.call_args.args[0]["speed"][0].start == 10800
+        assert import_.call_count == 2
+
+
+async def test_statistic_id_is_valid(hass: HomeAssistant) -> None:
+    """Statistic ids are slugified per car and key."""
+    statistics = VoyahStatistics(hass, "car-abc123", "Voyah Free")
+    assert statistics.statistic_id("12VBatteryVoltage") == "voyah:car_abc123_12vbatteryvoltage"
+
+
+async def test_sensor_is_coarse_in_statistics_mode(hass: HomeAssistant) -> None:
+    """With statistics mode on, high-frequency sensors round and drop their state class."""
+    data = {**MOCK_CAR_DATA, "sensors_data": {"12VBatteryVoltage": 12.62}}
+    coordinator = make_coordinator(hass, data)
+    coordinator.statistics = MagicMock()
+    desc = next(d for d in SENSOR_DESCRIPTIONS if d.key == "12VBatteryVoltage")
+    sensor = VoyahSensorEntity(coordinator, desc)
+
+    assert sensor.native_value == 12.5
+    assert sensor.state_class is None
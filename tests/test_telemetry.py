@@ -0,0 +1,25 @@
+"""Tests for Voyah telemetry diffs."""
+
+from custom_components.voyah.telemetry import diff_telemetry, flatten_telemetry
+
+
+def test_flatten_prefixes_position_keys_and_skips_volatile_fields() -> None:
+    """Sensor keys stay as they are; position keys get a prefix; last_ping and time are left out."""
+    data = {
+        "sensors_data": {"speed": 40, "batteryPercentage": 80},
+        "position_data": {"lat": 55.7, "speed": 41},
+        "time": 1700000000,
+        "last_ping": 6.6,
+        "doors": 0,
+    }
+
+    assert flatten_telemetry(data) == {"speed": 40, "batteryPercentage": 80, "position.lat": 55.7, "position.speed": 41}
+
+
+def test_diff_lists_changed_added_and_removed_keys() -> None:
+    """Only keys whose value changed are reported, with missing values as None."""
+    old = {"batteryPercentage": 80, "chargingStatus": 1, "odometer": 1000, "gone": 5, "unset": None}
+    new = {"batteryPercentage": 80, "chargingStatus": 0, "odometer": 1000, "added": 3}
+
+    assert diff_telemetry(old, new) == {"chargingStatus": (1, 0), "added": (None, 3), "gone": (5, None)}
+    assert diff_telemetry(new, new) == {}
@@ -0,0 +1,87 @@
+"""Tests for Voyah trip detection."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.voyah.trips import TripDetector, TripRecord, VoyahTripLog
+
+
+def _snapshot(time: int, ignition: int, odometer: float, speed: float = 0, soc: float = 80) -> dict:
+    return {
+        "sensors_data": {
+            "ignitionStatus": ignition,
+            "odometer": odometer,
+            "speed": speed,
+            "batteryPercentage": soc,
+        },
+        "position_data": {"lat": 55.0 + odometer / 1000, "lon": 37.0},
+        "time": time,
+    }
+
+
+def test_detector_emits_trip_on_ignition_off() -> None:
+    """A full ignition cycle with movement produces a trip record."""
+    detector = TripDetector()
+
+    assert detector.update(_snapshot(1000, 1, 100.0, soc=80), 0) is None
+    assert detector.update(_snapshot(1600, 1, 110.0, speed=90, soc=77), 0) is None
+    trip = detector.update(_snapshot(1800, 0, 112.0, soc=76), 0)
+
+    assert trip is not None
+    assert trip.distance == 12.0
+    assert trip.duration == 800
+    assert trip.max_speed == 90
+    assert trip.soc_used == 4
+    assert trip.average_speed == 54.0
+    assert (trip.start_lat, trip.end_lat) == (55.1, 55.112)
+    assert detector.active is None
+
+
+def test_soc_used_is_rounded() -> None:
+    """Fractional state of charge does not leak float noise into soc_used."""
+    detector = TripDetector()
+    detector.update(_snapshot(1000, 1, 100.0, soc=80.5), 0)
+    detector.update(_snapshot(1600, 1, 110.0, speed=90, soc=70), 0)
+    trip = detector.update(_snapshot(1800, 0, 112.0, soc=68.2), 0)
+
+    assert trip.soc_used == 12.3
+
+
+def test_detector_discards_stationary_cycle() -> None:
+    """Ignition on without movement is not a trip."""
+    detector = TripDetector()
+    detector.update(_snapshot(1000, 1, 100.0), 0)
+
+    assert detector.update(_snapshot(1600, 0, 100.0), 0) is None
+
+
+def test_detector_ignores_snapshots_without_ignition() -> None:
+    """Snapshots missing ignitionStatus do not start or end trips."""
+    detector = TripDetector()
+
+    assert detector.update({"sensors_data": {"odometer": 1}}, 0) is None
+    assert detector.active is None
+
+
+def test_trip_record_row_roundtrip() -> None:
+    """Rows are positional and restore an equal record."""
+    trip = TripRecord(1.0, 61.0, 1.5, 40, 80, 79, 55.0, 37.0, 55.1, 37.1)
+    assert TripRecord.from_row(trip.to_row()) == trip
+
+
+async def test_trip_log_query_by_range(hass: HomeAssistant) -> None:
+    """query() filters by start time and limits to the newest trips."""
+    log = VoyahTripLog(hass, "car")
+    log.trips = [TripRecord(t, t + 60, 1.0, None, None, None, None, None, None, None) for t in (100, 200, 300, 400)]
+
+    assert [t.start_time for t in log.query(start=150, end=350)] == [200, 300]
+    assert [t.start_time for t in log.query(limit=2)] == [300, 400]
+
+
+async def test_trip_log_records_finished_trip(hass: HomeAssistant) -> None:
+    """process() appends finished trips to the history."""
+    log = VoyahTripLog(hass, "car")
+    log.process(_snapshot(1000, 1, 100.0), 0)
+    log.process(_snapshot(2000, 0, 105.0), 0)
+
+    assert log.last_trip is not None
+    assert log.last_trip.distance == 5.0
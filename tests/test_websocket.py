@@ -0,0 +1,67 @@
+"""Tests for the Voyah WebSocket API."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.voyah.const import DOMAIN
+from custom_components.voyah.websocket import websocket_subscribe
+
+from .conftest import MOCK_CAR_DATA, MOCK_CAR_ID, make_coordinator, register_account
+
+
+def _events(connection: MagicMock) -> list[dict]:
+    return [call.args[0]["event"] for call in connection.send_message.call_args_list]
+
+
+async def test_subscribe_sends_snapshot_then_deltas(hass: HomeAssistant) -> None:
+    """A subscriber gets every car's telemetry once, then only changed keys per refresh."""
+    coordinator = make_coordinator(hass, None)
+    coordinator.client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
+    await coordinator.async_refresh()
+    register_account(hass, coordinator)
+    connection = MagicMock(subscriptions={})
+
+    websocket_subscribe(hass, connection, {"id": 5, "type": "voyah/subscribe"})
+
+    connection.send_result.assert_called_once_with(5)
+    snapshot = _events(connection)[0]["snapshot"]
+    assert snapshot[MOCK_CAR_ID]["telemetry"]["batteryPercentage"] == 80
+    assert snapshot[MOCK_CAR_ID]["telemetry"]["position.lat"] == 55.7558
+
+    sensors = {**MOCK_CAR_DATA["sensors_data"], "batteryPercentage": 79}
+    coordinator.client.async_get_car_data = AsyncMock(return_value={**MOCK_CAR_DATA, "sensors_data": sensors})
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert _events(connection)[1:] == [{"car_id": MOCK_CAR_ID, "changes": {"batteryPercentage": 79}}]
+
+    connection.subscriptions[5]()
+    coordinator.client.async_get_car_data = AsyncMock(return_value=MOCK_CAR_DATA)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert len(_events(connection)) == 2
+    await coordinator.async_shutdown()
+
+
+async def test_subscribe_filters_by_device(hass: HomeAssistant) -> None:
+    """With device_ids only the selected cars are streamed; unknown devices are an error."""
+    coordinator = make_coordinator(hass, MOCK_CAR_DATA)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=coordinator._entry.entry_id, identifiers={(DOMAIN, MOCK_CAR_ID)}
+    )
+    register_account(hass, coordinator)
+    connection = MagicMock(subscriptions={})
+
+    websocket_subscribe(hass, connection, {"id": 1, "type": "voyah/subscribe", "device_ids": ["missing"]})
+    assert connection.send_error.call_args.args[:2] == (1, "not_found")
+    assert not connection.subscriptions
+
+    websocket_subscribe(hass, connection, {"id": 2, "type": "voyah/subscribe", "device_ids": [device.id]})
+    assert _events(connection) == [{"snapshot": {MOCK_CAR_ID: {"name": coordinator.car_name, "telemetry": {}}}}]
+
+    hass.bus.async_fire("voyah_telemetry_changed", {"car_id": "other", "changes": [{"key": "a", "old": 1, "new": 2}]})
+    await hass.async_block_till_done()
+    assert len(_events(connection)) == 1
+    connection.subscriptions[2]()